@@ -0,0 +1,9 @@
+"""Shared pytest configuration for Wine Agent tests."""
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _raise_on_lazy_load(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Make accidental lazy relationship loads in repository list queries fail."""
+    monkeypatch.setenv("WINE_AGENT_RAISE_ON_LAZY_LOAD", "1")
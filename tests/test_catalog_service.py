@@ -19,6 +19,7 @@ from wine_agent.core.schema_canonical import (
     RegionHierarchyLevel,
 )
 from wine_agent.db.models import Base
+from wine_agent.db.models_canonical import ProducerDB
 from wine_agent.services.catalog_service import CatalogService
 
 
@@ -356,6 +357,42 @@ class TestCatalogStats:
         assert stats.total_grapes == 1
 
 
+class TestIndexManagement:
+    """Tests for search index management."""
+
+    def test_rebuild_search_index_skips_orphan_wines(
+        self,
+        catalog_service: CatalogService,
+        session: Session,
+        mock_meilisearch: MagicMock,
+    ) -> None:
+        """Test that a wine whose producer is gone does not abort the rebuild."""
+        producer = catalog_service.create_producer(canonical_name="Ridge")
+        gone = catalog_service.create_producer(canonical_name="Gone")
+        monte_bello = catalog_service.create_wine(
+            producer_id=producer.id, canonical_name="Monte Bello"
+        )
+        catalog_service.create_wine(
+            producer_id=producer.id, canonical_name="Geyserville"
+        )
+        catalog_service.create_wine(producer_id=gone.id, canonical_name="Orphan")
+        catalog_service.create_vintage(wine_id=monte_bello.id, year=2019)
+        session.query(ProducerDB).filter(ProducerDB.id == str(gone.id)).delete()
+        session.commit()
+        mock_meilisearch.reset_mock()
+
+        catalog_service.rebuild_search_index()
+
+        vintage_call = mock_meilisearch.index_wine_vintage.call_args.args
+        assert vintage_call[0].year == 2019
+        assert vintage_call[1].canonical_name == "Monte Bello"
+        indexed = [
+            call.args[0].canonical_name
+            for call in mock_meilisearch.index_wine_without_vintage.call_args_list
+        ]
+        assert indexed == ["Geyserville"]
+
+
 class TestFullCatalogWorkflow:
     """Integration tests for full catalog workflow."""
 
@@ -19,7 +19,7 @@ from wine_agent.core.schema import (
     TastingNote,
     WineIdentity,
 )
-from wine_agent.db.models import Base
+from wine_agent.db.models import Base, TastingNoteDB
 from wine_agent.db.repositories import (
     AIConversionRepository,
     InboxRepository,
@@ -284,6 +284,53 @@ class TestTastingNoteRepository:
         assert retrieved.wine.producer == "Updated"
         assert retrieved.status == NoteStatus.PUBLISHED
 
+    def test_update_tasting_note_changed_fields(self, session: Session) -> None:
+        """Test that only columns for changed fields are written."""
+        repo = TastingNoteRepository(session)
+        note = TastingNote(
+            wine=WineIdentity(producer="Original", region="Burgundy"),
+            status=NoteStatus.DRAFT,
+        )
+        repo.create(note)
+        session.commit()
+
+        note.wine.region = "Rhone"
+        note.status = NoteStatus.PUBLISHED
+        repo.update(note, changed_fields={"status"})
+        session.commit()
+
+        db_note = session.get(TastingNoteDB, str(note.id))
+        session.refresh(db_note)
+        assert db_note.status == "published"
+        # Column not listed in changed_fields is left as-is...
+        assert db_note.region == "Burgundy"
+        # ...while the full payload always reflects the note.
+        assert json.loads(db_note.note_json)["wine"]["region"] == "Rhone"
+
+    def test_update_tasting_note_changed_section(self, session: Session) -> None:
+        """Test that a section path selects all nested columns."""
+        repo = TastingNoteRepository(session)
+        note = TastingNote(wine=WineIdentity(producer="Original", vintage=2015))
+        repo.create(note)
+        session.commit()
+
+        note.wine.producer = "Updated"
+        note.wine.vintage = 2016
+        repo.update(note, changed_fields={"wine"})
+        session.commit()
+
+        db_note = session.get(TastingNoteDB, str(note.id))
+        session.refresh(db_note)
+        assert db_note.producer == "Updated"
+        assert db_note.vintage == 2016
+
+    def test_update_nonexistent_tasting_note(self, session: Session) -> None:
+        """Test updating a note that does not exist."""
+        repo = TastingNoteRepository(session)
+
+        with pytest.raises(ValueError):
+            repo.update(TastingNote(), changed_fields={"status"})
+
     def test_delete_tasting_note(self, session: Session) -> None:
         """Test deleting a tasting note."""
         repo = TastingNoteRepository(session)
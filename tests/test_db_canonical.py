@@ -2,10 +2,11 @@
 
 import tempfile
 from pathlib import Path
+from typing import Any
 from uuid import uuid4
 
 import pytest
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import Session, sessionmaker
 
 from wine_agent.core.enums import WineColor, WineStyle
@@ -46,6 +47,7 @@ from wine_agent.db.repositories_canonical import (
     ImporterRepository,
     ListingMatchRepository,
     ListingRepository,
+    ProducerAggregateRepository,
     ProducerRepository,
     RegionRepository,
     SnapshotRepository,
@@ -104,6 +106,20 @@ class TestProducerRepository:
         assert created.aliases == ["DRC", "Romanée-Conti"]
         assert created.country == "France"
 
+    def test_create_producer_single_statement(self, session: Session, engine) -> None:
+        """Test that create issues one INSERT ... RETURNING and no SELECT."""
+        repo = ProducerRepository(session)
+        statements: list[str] = []
+        event.listen(
+            engine, "before_cursor_execute", lambda *args: statements.append(args[2])
+        )
+
+        repo.create(Producer(canonical_name="Ridge Vineyards"))
+
+        assert len(statements) == 1
+        assert statements[0].startswith("INSERT INTO producers")
+        assert "RETURNING" in statements[0]
+
     def test_get_producer_by_id(self, session: Session) -> None:
         """Test retrieving a producer by ID."""
         repo = ProducerRepository(session)
@@ -117,6 +133,26 @@ class TestProducerRepository:
         assert retrieved.canonical_name == "Ridge Vineyards"
         assert retrieved.country == "USA"
 
+    def test_get_producer_by_id_uses_identity_map(
+        self, session: Session, engine
+    ) -> None:
+        """Test that fetching an already-loaded producer issues no query."""
+        repo = ProducerRepository(session)
+        producer = Producer(canonical_name="Ridge Vineyards")
+        repo.create(producer)
+        # Hold a strong reference so the instance stays in the identity map
+        db_item = session.get(ProducerDB, str(producer.id))
+        assert db_item is not None
+
+        statements: list[str] = []
+        event.listen(
+            engine, "before_cursor_execute", lambda *args: statements.append(args[2])
+        )
+        retrieved = repo.get_by_id(producer.id)
+
+        assert retrieved is not None
+        assert statements == []
+
     def test_get_nonexistent_producer(self, session: Session) -> None:
         """Test retrieving a nonexistent producer."""
         repo = ProducerRepository(session)
@@ -138,6 +174,49 @@ class TestProducerRepository:
         assert "Domaine Leflaive" in names
         assert "Domaine Leroy" in names
 
+    def test_search_producers_by_name_prefix_case_insensitive(
+        self, session: Session
+    ) -> None:
+        """Test that SQLite name search is a case-insensitive prefix match."""
+        repo = ProducerRepository(session)
+        repo.create(Producer(canonical_name="Domaine Leroy"))
+        session.commit()
+
+        assert [p.canonical_name for p in repo.search_by_name("domaine le")] == [
+            "Domaine Leroy"
+        ]
+        assert repo.search_by_name("Leroy") == []
+
+    def test_search_producers_uses_nocase_index(self, session: Session, engine) -> None:
+        """Test that create_all builds the NOCASE index name search relies on."""
+        statements: list[tuple[str, Any]] = []
+        event.listen(
+            engine,
+            "before_cursor_execute",
+            lambda conn, cursor, stmt, params, *args: statements.append((stmt, params)),
+        )
+        ProducerRepository(session).search_by_name("Domaine")
+
+        stmt, params = statements[-1]
+        plan = session.connection().exec_driver_sql(
+            f"EXPLAIN QUERY PLAN {stmt}", params
+        ).fetchall()
+        assert "ix_producers_canonical_name_nocase" in str(plan)
+
+    def test_search_producers_escapes_wildcards(self, session: Session) -> None:
+        """Test that LIKE wildcards in the query match literally."""
+        repo = ProducerRepository(session)
+        repo.create(Producer(canonical_name="100% Estate"))
+        repo.create(Producer(canonical_name="1000 Hills"))
+        repo.create(Producer(canonical_name="A_B Cellars"))
+        repo.create(Producer(canonical_name="ABC Cellars"))
+        session.commit()
+
+        found = repo.search_by_name("100%")
+        assert [p.canonical_name for p in found] == ["100% Estate"]
+        assert [p.canonical_name for p in repo.search_by_name("A_B")] == ["A_B Cellars"]
+        assert repo.search_by_name("%") == []
+
     def test_list_all_producers(self, session: Session) -> None:
         """Test listing all producers."""
         repo = ProducerRepository(session)
@@ -150,6 +229,17 @@ class TestProducerRepository:
 
         assert len(results) == 2
 
+    def test_iter_all_producers(self, session: Session) -> None:
+        """Test streaming all producers in chunks."""
+        repo = ProducerRepository(session)
+        for name in ["Producer C", "Producer A", "Producer B"]:
+            repo.create(Producer(canonical_name=name))
+        session.commit()
+
+        names = [p.canonical_name for p in repo.iter_all(chunk=2)]
+
+        assert names == ["Producer A", "Producer B", "Producer C"]
+
     def test_count_producers(self, session: Session) -> None:
         """Test counting producers."""
         repo = ProducerRepository(session)
@@ -161,6 +251,28 @@ class TestProducerRepository:
 
         assert repo.count() == 2
 
+    def test_count_producers_is_cached(self, session: Session) -> None:
+        """Test that count() is served from cache until a repository write."""
+        repo = ProducerRepository(session)
+        assert repo.count() == 0
+
+        # Writes outside the repository are not seen until the TTL expires
+        session.add(ProducerDB(canonical_name="Direct insert"))
+        session.flush()
+        assert repo.count() == 0
+
+        repo.create(Producer(canonical_name="Via repository"))
+        assert repo.count() == 2
+
+    def test_count_not_cached_from_rolled_back_writes(self, session: Session) -> None:
+        """Test that a count taken inside a rolled-back transaction is not kept."""
+        repo = ProducerRepository(session)
+        repo.create(Producer(canonical_name="Never committed"))
+        assert repo.count() == 1
+
+        session.rollback()
+        assert repo.count() == 0
+
     def test_update_producer(self, session: Session) -> None:
         """Test updating a producer."""
         repo = ProducerRepository(session)
@@ -178,6 +290,48 @@ class TestProducerRepository:
         assert retrieved.canonical_name == "Updated Name"
         assert retrieved.website == "https://example.com"
 
+    def test_update_producer_single_statement(self, session: Session, engine) -> None:
+        """Test that update issues one UPDATE ... RETURNING and no SELECT."""
+        repo = ProducerRepository(session)
+        producer = Producer(canonical_name="Original Name", aliases=["Alias"])
+        repo.create(producer)
+        session.commit()
+
+        statements: list[str] = []
+        event.listen(
+            engine, "before_cursor_execute", lambda *args: statements.append(args[2])
+        )
+        producer.country = "France"
+        updated = repo.update(producer)
+
+        assert len(statements) == 1
+        assert statements[0].startswith("UPDATE producers")
+        assert "RETURNING" in statements[0]
+        assert updated.country == "France"
+        assert updated.aliases == ["Alias"]
+
+    def test_update_producer_refreshes_loaded_instance(self, session: Session) -> None:
+        """Test that update refreshes a producer already in the identity map."""
+        repo = ProducerRepository(session)
+        producer = Producer(canonical_name="Original Name")
+        repo.create(producer)
+        session.commit()
+        db_item = session.get(ProducerDB, str(producer.id))
+        assert db_item is not None
+
+        producer.country = "France"
+        updated = repo.update(producer)
+
+        assert updated.country == "France"
+        assert db_item.country == "France"
+
+    def test_update_nonexistent_producer(self, session: Session) -> None:
+        """Test that updating a missing producer raises ValueError."""
+        repo = ProducerRepository(session)
+
+        with pytest.raises(ValueError, match="not found"):
+            repo.update(Producer(canonical_name="Ghost"))
+
     def test_delete_producer(self, session: Session) -> None:
         """Test deleting a producer."""
         repo = ProducerRepository(session)
@@ -190,6 +344,49 @@ class TestProducerRepository:
 
         assert deleted is True
         assert repo.get_by_id(producer.id) is None
+        assert repo.delete(producer.id) is False
+
+    def test_bulk_create_producers(self, session: Session) -> None:
+        """Test creating producers in one batch."""
+        repo = ProducerRepository(session)
+        producers = [
+            Producer(canonical_name=f"Producer {i}", aliases=[f"P{i}"])
+            for i in range(5)
+        ]
+
+        created = repo.bulk_create(producers)
+        session.commit()
+
+        assert [p.id for p in created] == [p.id for p in producers]
+        assert repo.count() == 5
+        retrieved = repo.get_by_id(producers[3].id)
+        assert retrieved is not None
+        assert retrieved.aliases == ["P3"]
+
+    def test_bulk_create_empty(self, session: Session) -> None:
+        """Test that an empty batch is a no-op."""
+        repo = ProducerRepository(session)
+        assert repo.bulk_create([]) == []
+        assert repo.count() == 0
+
+    def test_bulk_update_producers(self, session: Session) -> None:
+        """Test updating producers in one batch."""
+        repo = ProducerRepository(session)
+        producers = repo.bulk_create(
+            [Producer(canonical_name="A"), Producer(canonical_name="B")]
+        )
+        session.commit()
+
+        for producer in producers:
+            producer.country = "France"
+        updated = repo.bulk_update(producers)
+        session.commit()
+
+        assert all(p.country == "France" for p in updated)
+        for producer in producers:
+            retrieved = repo.get_by_id(producer.id)
+            assert retrieved is not None
+            assert retrieved.country == "France"
 
 
 class TestWineRepository:
@@ -252,6 +449,62 @@ class TestWineRepository:
 
         assert len(results) == 2
 
+    def test_list_wines_with_related(self, session: Session, monkeypatch) -> None:
+        """Test listing wines with eager-loaded producer and region."""
+        monkeypatch.setenv("WINE_AGENT_RAISE_ON_LAZY_LOAD", "1")
+        producer = ProducerRepository(session).create(Producer(canonical_name="Ridge"))
+        region = RegionRepository(session).create(Region(name="Santa Cruz Mountains"))
+
+        wine_repo = WineRepository(session)
+        wine_repo.create(
+            Wine(
+                producer_id=producer.id,
+                canonical_name="Monte Bello",
+                region_id=region.id,
+            )
+        )
+        wine_repo.create(Wine(producer_id=producer.id, canonical_name="Geyserville"))
+        session.commit()
+
+        results = wine_repo.list_with_related()
+
+        assert [(w.canonical_name, p.id) for w, p, _ in results] == [
+            ("Geyserville", producer.id),
+            ("Monte Bello", producer.id),
+        ]
+        assert results[0][2] is None
+        assert results[1][2] is not None
+        assert results[1][2].name == "Santa Cruz Mountains"
+
+    def test_related_listing_skips_orphan_wines(
+        self, session: Session, monkeypatch
+    ) -> None:
+        """Test that wines whose producer row is gone are skipped, not a crash."""
+        monkeypatch.setenv("WINE_AGENT_RAISE_ON_LAZY_LOAD", "1")
+        producer_repo = ProducerRepository(session)
+        ridge = producer_repo.create(Producer(canonical_name="Ridge"))
+        gone = producer_repo.create(Producer(canonical_name="Gone"))
+
+        wine_repo = WineRepository(session)
+        monte_bello = wine_repo.create(
+            Wine(producer_id=ridge.id, canonical_name="Monte Bello")
+        )
+        wine_repo.create(Wine(producer_id=gone.id, canonical_name="Orphan"))
+        vintage_repo = VintageRepository(session)
+        for year in (2015, 2019):
+            vintage_repo.create(Vintage(wine_id=monte_bello.id, year=year))
+        session.query(ProducerDB).filter(ProducerDB.id == str(gone.id)).delete()
+        session.commit()
+
+        assert [w.canonical_name for w, _, _ in wine_repo.list_with_related()] == [
+            "Monte Bello"
+        ]
+        results = list(wine_repo.iter_with_related(chunk=1))
+        assert [(w.canonical_name, p.id) for w, p, _, _ in results] == [
+            ("Monte Bello", ridge.id)
+        ]
+        assert [v.year for v in results[0][3]] == [2019, 2015]
+
 
 class TestVintageRepository:
     """Tests for VintageRepository."""
@@ -330,6 +583,71 @@ class TestVintageRepository:
         not_found = vintage_repo.get_by_wine_and_year(wine.id, 2018)
         assert not_found is None
 
+    def test_get_vintages_by_wine_and_year_many(self, session: Session) -> None:
+        """Test batch lookup of vintages by (wine, year) pairs."""
+        producer_repo = ProducerRepository(session)
+        producer = Producer(canonical_name="Test Producer")
+        producer_repo.create(producer)
+
+        wine_repo = WineRepository(session)
+        wine_a = Wine(producer_id=producer.id, canonical_name="Wine A")
+        wine_b = Wine(producer_id=producer.id, canonical_name="Wine B")
+        wine_repo.create(wine_a)
+        wine_repo.create(wine_b)
+
+        vintage_repo = VintageRepository(session)
+        vintage_repo.create(Vintage(wine_id=wine_a.id, year=2019))
+        vintage_repo.create(Vintage(wine_id=wine_a.id, year=2020))
+        vintage_repo.create(Vintage(wine_id=wine_b.id, year=2019))
+        session.commit()
+
+        found = vintage_repo.get_by_wine_and_year_many(
+            [(wine_a.id, 2019), (wine_b.id, 2019), (wine_b.id, 2020)]
+        )
+
+        assert set(found) == {(wine_a.id, 2019), (wine_b.id, 2019)}
+        assert found[(wine_b.id, 2019)].wine_id == wine_b.id
+        assert vintage_repo.get_by_wine_and_year_many([]) == {}
+
+
+class TestProducerAggregateRepository:
+    """Tests for ProducerAggregateRepository."""
+
+    def test_get_full(self, session: Session, engine) -> None:
+        """Test loading a producer's wine and vintage tree in three queries."""
+        producer = Producer(canonical_name="Ridge Vineyards")
+        ProducerRepository(session).create(producer)
+        wine_repo = WineRepository(session)
+        monte_bello = Wine(producer_id=producer.id, canonical_name="Monte Bello")
+        geyserville = Wine(producer_id=producer.id, canonical_name="Geyserville")
+        wine_repo.create(monte_bello)
+        wine_repo.create(geyserville)
+        vintage_repo = VintageRepository(session)
+        vintage_repo.create(Vintage(wine_id=monte_bello.id, year=2018))
+        vintage_repo.create(Vintage(wine_id=monte_bello.id, year=2019))
+        session.commit()
+        session.expunge_all()
+
+        statements: list[str] = []
+        event.listen(
+            engine, "before_cursor_execute", lambda *args: statements.append(args[2])
+        )
+        aggregate = ProducerAggregateRepository(session).get_full(producer.id)
+
+        assert aggregate is not None
+        assert aggregate.producer.id == producer.id
+        assert [w.wine.canonical_name for w in aggregate.wines] == [
+            "Geyserville",
+            "Monte Bello",
+        ]
+        assert aggregate.wines[0].vintages == []
+        assert [v.year for v in aggregate.wines[1].vintages] == [2019, 2018]
+        assert len(statements) == 3
+
+    def test_get_full_nonexistent(self, session: Session) -> None:
+        """Test that a missing producer returns None."""
+        assert ProducerAggregateRepository(session).get_full(uuid4()) is None
+
 
 class TestRegionRepository:
     """Tests for RegionRepository."""
@@ -377,6 +695,48 @@ class TestRegionRepository:
         assert len(children) == 1
         assert children[0].name == "Côte de Nuits"
 
+    def test_region_lookups_are_cached(self, session: Session, engine) -> None:
+        """Test that region lookups are cached until a repository create."""
+        repo = RegionRepository(session)
+        parent = Region(name="Burgundy", country="France")
+        repo.create(parent)
+        session.commit()
+        assert repo.get_children(parent.id) == []
+
+        statements: list[str] = []
+        event.listen(
+            engine, "before_cursor_execute", lambda *args: statements.append(args[2])
+        )
+        first = repo.get_by_id(parent.id)
+        assert first is not None
+        first.name = "Mutated"
+        second = repo.get_by_id(parent.id)
+
+        assert second is not None
+        assert second.name == "Burgundy"
+        assert len([s for s in statements if s.startswith("SELECT")]) == 1
+
+        repo.create(Region(name="Chablis", country="France", parent_id=parent.id))
+        assert [r.name for r in repo.get_children(parent.id)] == ["Chablis"]
+
+    def test_region_cache_skips_misses_and_uncommitted_rows(
+        self, session: Session, engine
+    ) -> None:
+        """Test that misses and rows from a rolled-back transaction are not cached."""
+        repo = RegionRepository(session)
+        assert repo.get_by_wikidata_id("Q1") is None
+
+        other = sessionmaker(bind=engine)()
+        other.add(RegionDB(name="Burgundy", country="France", wikidata_id="Q1"))
+        other.commit()
+        other.close()
+        assert repo.get_by_wikidata_id("Q1") is not None
+
+        chablis = repo.create(Region(name="Chablis", country="France"))
+        assert repo.get_by_id(chablis.id) is not None
+        session.rollback()
+        assert repo.get_by_id(chablis.id) is None
+
     def test_search_regions_by_name(self, session: Session) -> None:
         """Test searching regions by name."""
         repo = RegionRepository(session)
@@ -510,6 +870,56 @@ class TestSnapshotRepository:
         assert found is not None
         assert found.url == "https://example.com/wine/123"
 
+    @pytest.mark.parametrize("update_returning", [True, False])
+    def test_update_snapshot_status(
+        self, session: Session, monkeypatch, update_returning: bool
+    ) -> None:
+        """Test updating a snapshot status with and without UPDATE ... RETURNING."""
+        monkeypatch.setattr(
+            session.get_bind().dialect, "update_returning", update_returning
+        )
+        source = SourceRepository(session).create(
+            Source(domain="example.com", adapter_type="html")
+        )
+        snapshot_repo = SnapshotRepository(session)
+        snapshot = snapshot_repo.create(Snapshot(
+            source_id=source.id, url="https://example.com/wine", content_hash="h"
+        ))
+        session.commit()
+
+        updated = snapshot_repo.update_status(snapshot.id, "success")
+
+        assert updated is not None
+        assert updated.status == SnapshotStatus.SUCCESS
+        assert snapshot_repo.get_by_id(snapshot.id).status == SnapshotStatus.SUCCESS
+        assert snapshot_repo.update_status(uuid4(), "success") is None
+
+    def test_iter_snapshots_by_source_id(self, session: Session) -> None:
+        """Test streaming every snapshot for a source in chunks."""
+        source_repo = SourceRepository(session)
+        source = Source(domain="example.com", adapter_type="html")
+        other = Source(domain="other.com", adapter_type="html")
+        source_repo.bulk_create([source, other])
+
+        snapshot_repo = SnapshotRepository(session)
+        snapshot_repo.bulk_create([
+            Snapshot(
+                source_id=source.id,
+                url=f"https://example.com/wine/{i}",
+                content_hash=f"hash{i}",
+            )
+            for i in range(5)
+        ])
+        snapshot_repo.create(Snapshot(
+            source_id=other.id, url="https://other.com/wine", content_hash="other"
+        ))
+        session.commit()
+
+        snapshots = list(snapshot_repo.iter_by_source_id(source.id, chunk=2))
+
+        assert len(snapshots) == 5
+        assert {s.source_id for s in snapshots} == {source.id}
+
 
 class TestListingRepository:
     """Tests for ListingRepository."""
@@ -546,6 +956,83 @@ class TestListingRepository:
         assert created.upc == "012345678901"
         assert created.price == 199.99
 
+    def test_get_parsed_field(self, session: Session) -> None:
+        """Test reading single parsed fields without loading the listing."""
+        source = SourceRepository(session).create(
+            Source(domain="example.com", adapter_type="html")
+        )
+        snapshot = SnapshotRepository(session).create(
+            Snapshot(source_id=source.id, url="url", content_hash="hash")
+        )
+        listing_repo = ListingRepository(session)
+        listing = listing_repo.create(Listing(
+            source_id=source.id,
+            snapshot_id=snapshot.id,
+            url="url",
+            parsed_fields={
+                "producer": "Ridge",
+                "vintage": 2019,
+                "grapes": ["Cabernet Sauvignon"],
+                "tech.sheet": {"abv": 13.5},
+                'say "hi"': "quoted",
+            },
+        ))
+        session.commit()
+
+        assert listing_repo.get_parsed_field(listing.id, "producer") == "Ridge"
+        assert listing_repo.get_parsed_field(listing.id, "vintage") == 2019
+        grapes = listing_repo.get_parsed_field(listing.id, "grapes")
+        assert grapes == ["Cabernet Sauvignon"]
+        assert listing_repo.get_parsed_field(listing.id, "tech.sheet") == {"abv": 13.5}
+        assert listing_repo.get_parsed_field(listing.id, 'say "hi"') == "quoted"
+        assert listing_repo.get_parsed_field(listing.id, "missing") is None
+        assert listing_repo.get_parsed_field(uuid4(), "producer") is None
+
+    def test_get_parsed_field_keeps_booleans(self, session: Session) -> None:
+        """Test that boolean parsed fields are not returned as 1/0."""
+        source = SourceRepository(session).create(
+            Source(domain="example.com", adapter_type="html")
+        )
+        snapshot = SnapshotRepository(session).create(
+            Snapshot(source_id=source.id, url="url", content_hash="hash")
+        )
+        listing_repo = ListingRepository(session)
+        listing = listing_repo.create(Listing(
+            source_id=source.id,
+            snapshot_id=snapshot.id,
+            url="url",
+            parsed_fields={"in_stock": True, "organic": False, "notes": None},
+        ))
+        session.commit()
+
+        assert listing_repo.get_parsed_field(listing.id, "in_stock") is True
+        assert listing_repo.get_parsed_field(listing.id, "organic") is False
+        assert listing_repo.get_parsed_field(listing.id, "notes") is None
+
+    def test_get_listings_by_upc_many(self, session: Session) -> None:
+        """Test getting listings for several UPC codes in one query."""
+        source = SourceRepository(session).create(
+            Source(domain="example.com", adapter_type="html")
+        )
+        snapshot = SnapshotRepository(session).create(
+            Snapshot(source_id=source.id, url="url", content_hash="hash")
+        )
+        listing_repo = ListingRepository(session)
+        listing_repo.bulk_create([
+            Listing(source_id=source.id, snapshot_id=snapshot.id, url="a", upc="111"),
+            Listing(source_id=source.id, snapshot_id=snapshot.id, url="b", upc="111"),
+            Listing(source_id=source.id, snapshot_id=snapshot.id, url="c", upc="222"),
+            Listing(source_id=source.id, snapshot_id=snapshot.id, url="d", ean="111"),
+        ])
+        session.commit()
+
+        found = listing_repo.get_by_upc_many(["111", "222", "333"])
+
+        assert sorted(found) == ["111", "222"]
+        assert sorted(listing.url for listing in found["111"]) == ["a", "b"]
+        assert [listing.url for listing in found["222"]] == ["c"]
+        assert listing_repo.get_by_upc_many([]) == {}
+
     def test_get_listings_by_upc(self, session: Session) -> None:
         """Test getting listings by UPC code."""
         source_repo = SourceRepository(session)
@@ -655,6 +1142,43 @@ class TestListingMatchRepository:
         assert len(pending) == 1
         assert pending[0].confidence == 0.80
 
+    def test_get_matches_by_listing_id_many(self, session: Session) -> None:
+        """Test getting matches for several listings in one query."""
+        source = SourceRepository(session).create(
+            Source(domain="example.com", adapter_type="html")
+        )
+        snapshot = SnapshotRepository(session).create(
+            Snapshot(source_id=source.id, url="url", content_hash="hash")
+        )
+        listing_repo = ListingRepository(session)
+        first = listing_repo.create(
+            Listing(source_id=source.id, snapshot_id=snapshot.id, url="a")
+        )
+        second = listing_repo.create(
+            Listing(source_id=source.id, snapshot_id=snapshot.id, url="b")
+        )
+        unmatched = listing_repo.create(
+            Listing(source_id=source.id, snapshot_id=snapshot.id, url="c")
+        )
+
+        match_repo = ListingMatchRepository(session)
+        match_repo.bulk_create([
+            ListingMatch(
+                listing_id=listing.id,
+                entity_type=EntityType.WINE,
+                entity_id=uuid4(),
+                confidence=confidence,
+            )
+            for listing, confidence in ((first, 0.6), (first, 0.9), (second, 0.8))
+        ])
+        session.commit()
+
+        found = match_repo.get_by_listing_id_many([first.id, second.id, unmatched.id])
+
+        assert set(found) == {first.id, second.id}
+        assert [m.confidence for m in found[first.id]] == [0.9, 0.6]
+        assert [m.confidence for m in found[second.id]] == [0.8]
+
 
 class TestFullCanonicalWorkflow:
     """Integration tests for the full canonical entity workflow."""
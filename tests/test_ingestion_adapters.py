@@ -1,5 +1,6 @@
 """Tests for the ingestion adapters module."""
 
+import dataclasses
 import json
 
 import pytest
@@ -73,6 +74,12 @@ class TestExtractedField:
         with pytest.raises(ValueError):
             ExtractedField("name", "value", 1.5, "css_selector")
 
+    def test_immutable(self) -> None:
+        """Test that fields cannot be modified once created."""
+        field = ExtractedField("name", "value", 0.85, "css_selector")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            field.value = "other"  # type: ignore[misc]
+
 
 class TestExtractedListing:
     """Tests for the ExtractedListing class."""
@@ -154,6 +161,24 @@ class TestTestAdapter:
         assert listing is not None
         assert listing.get_value("producer_name") == "Château Margaux"
 
+    def test_extract_listing_content_fallback(self, adapter: TestAdapter) -> None:
+        """Test that content supplies the index when the URL has none."""
+        url = "https://test.wineagent.local/wines/latest"
+        content = json.dumps({"index": 1}).encode()
+        listing = adapter.extract_listing(content, url, "application/json")
+
+        assert listing is not None
+        assert listing.get_value("producer_name") == "Château Margaux"
+
+    def test_extract_listing_non_vintage_title(self, adapter: TestAdapter) -> None:
+        """Test that a wine without a vintage is titled NV."""
+        index = next(i for i, w in enumerate(TEST_WINES) if w.get("vintage") is None)
+        listing = adapter.extract_listing(b"", f"{adapter.BASE_URL}/{index}", "")
+
+        assert listing is not None
+        assert listing.title.endswith(" NV")
+        assert listing.vintage_year is None
+
     def test_extract_listing_invalid_index(self, adapter: TestAdapter) -> None:
         """Test extracting listing with invalid index."""
         url = "https://test.wineagent.local/wines/999"
@@ -178,6 +203,30 @@ class TestTestAdapter:
         assert listing.get_value("abv") is not None
         assert listing.get_value("price") is not None
 
+    def test_extract_listing_returns_fresh_copies(self, adapter: TestAdapter) -> None:
+        """Test that repeated extractions do not share listing instances."""
+        content = adapter.get_test_content(0)
+        first = adapter.extract_listing(content, "https://a.example/wines/0", "")
+        second = adapter.extract_listing(content, "https://b.example/wines/0", "")
+
+        assert first is not None and second is not None
+        assert first is not second
+        assert first.url == "https://a.example/wines/0"
+        assert second.url == "https://b.example/wines/0"
+        first.extraction_errors.append("boom")
+        assert second.extraction_errors == []
+        assert first.to_dict()["producer_name"] == second.to_dict()["producer_name"]
+
+    def test_extract_listing_shares_repeated_fields(self, adapter: TestAdapter) -> None:
+        """Test that equal values across wines reuse one ExtractedField."""
+        first = adapter.extract_listing(b"", f"{adapter.BASE_URL}/0", "")
+        second = adapter.extract_listing(b"", f"{adapter.BASE_URL}/1", "")
+
+        assert first is not None and second is not None
+        assert first.get_value("currency") == second.get_value("currency")
+        assert first.currency is second.currency
+        assert first.grapes is not second.grapes
+
     def test_get_test_content(self, adapter: TestAdapter) -> None:
         """Test generating test content."""
         content = adapter.get_test_content(0)
@@ -274,3 +323,16 @@ class TestBaseAdapter:
         adapter = TestAdapter()
         errors = adapter.validate_listing(listing)
         assert any("price" in e.lower() for e in errors)
+
+    @pytest.mark.parametrize("price", ["nan", "abc", "0", 0])
+    def test_validate_rejects_non_positive_price(self, price: object) -> None:
+        """Test validation rejects zero, NaN and unparseable prices."""
+        listing = ExtractedListing(
+            url="https://example.com",
+            source_name="test",
+            title="Test Wine",
+            price=ExtractedField("price", price, 1.0, "manual"),
+        )
+        adapter = TestAdapter()
+        errors = adapter.validate_listing(listing)
+        assert any("price" in e.lower() for e in errors)
@@ -2,10 +2,24 @@
 
 import asyncio
 import time
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime
+from urllib.robotparser import RobotFileParser
 
+import httpx
 import pytest
 
-from wine_agent.ingestion.crawler import Crawler, FetchResult, TokenBucket
+from wine_agent.ingestion.crawler import (
+    _DENY_ALL,
+    RATE_RECOVERY_STREAK,
+    ROBOTS_ERROR_TTL_SECONDS,
+    ROBOTS_MAX_TTL_SECONDS,
+    Crawler,
+    FetchResult,
+    RobotsChecker,
+    TokenBucket,
+    parse_retry_after,
+)
 from wine_agent.ingestion.registry import RateLimitConfig, SourceConfig
 
 
@@ -61,6 +75,56 @@ class TestTokenBucket:
 
         assert elapsed < 0.1
 
+    @pytest.mark.asyncio
+    async def test_concurrent_waiters_get_staggered_slots(self) -> None:
+        """Test that concurrent callers are spaced by the rate, not serialized."""
+        bucket = TokenBucket(requests_per_second=20.0, burst_limit=1)
+        start = time.monotonic()
+        done: list[float] = []
+
+        async def acquire() -> None:
+            await bucket.acquire()
+            done.append(time.monotonic() - start)
+
+        await asyncio.gather(*(acquire() for _ in range(4)))
+
+        # Slots at ~0, 0.05, 0.10 and 0.15s
+        assert done[0] < 0.03
+        assert 0.12 < done[-1] < 0.3
+
+    @pytest.mark.asyncio
+    async def test_throttling_backs_off_and_honours_retry_after(self) -> None:
+        """Test that a 429 halves the rate and delays the next request."""
+        bucket = TokenBucket(requests_per_second=100.0, burst_limit=5)
+        bucket.on_response(429, {"retry-after": "0.2"})
+
+        assert bucket.requests_per_second == 50.0
+        start = time.monotonic()
+        await bucket.acquire()
+        assert 0.15 < time.monotonic() - start < 0.4
+
+    def test_successes_restore_configured_rate(self) -> None:
+        """Test that a success streak ramps the rate back up to its ceiling."""
+        bucket = TokenBucket(requests_per_second=10.0, burst_limit=5)
+        bucket.on_response(503, {})
+        assert bucket.requests_per_second == 5.0
+
+        for _ in range(RATE_RECOVERY_STREAK * 20):
+            bucket.on_response(200, {})
+
+        assert bucket.requests_per_second == 10.0
+
+    def test_parse_retry_after(self) -> None:
+        """Test parsing Retry-After as seconds or an HTTP date."""
+        later = datetime.now(UTC) + timedelta(seconds=30)
+
+        assert parse_retry_after("5") == 5.0
+        assert 25.0 < parse_retry_after(format_datetime(later, usegmt=True)) <= 30.0
+        assert parse_retry_after("-3") == 0.0
+        assert parse_retry_after("99999") == 300.0
+        assert parse_retry_after("soon") is None
+        assert parse_retry_after(None) is None
+
 
 class TestFetchResult:
     """Tests for the FetchResult dataclass."""
@@ -112,6 +176,11 @@ class TestFetchResult:
 class TestCrawler:
     """Tests for the Crawler class."""
 
+    @pytest.fixture(autouse=True)
+    def clear_validators(self) -> None:
+        """Start each test with no shared cache validators."""
+        Crawler().clear_validators()
+
     @pytest.fixture
     def source_config(self) -> SourceConfig:
         """Create a test source configuration."""
@@ -144,17 +213,17 @@ class TestCrawler:
     def test_mark_hash_seen(self) -> None:
         """Test marking hashes as seen."""
         crawler = Crawler()
-        test_hash = "abc123"
+        test_hash = crawler.compute_hash(b"seen content")
 
-        assert test_hash not in crawler._seen_hashes
+        assert bytes.fromhex(test_hash) not in crawler._seen_hashes
         crawler.mark_hash_seen(test_hash)
-        assert test_hash in crawler._seen_hashes
+        assert bytes.fromhex(test_hash) in crawler._seen_hashes
 
     def test_clear_seen_hashes(self) -> None:
         """Test clearing seen hashes."""
         crawler = Crawler()
-        crawler.mark_hash_seen("hash1")
-        crawler.mark_hash_seen("hash2")
+        crawler.mark_hash_seen(crawler.compute_hash(b"content 1"))
+        crawler.mark_hash_seen(crawler.compute_hash(b"content 2"))
 
         assert len(crawler._seen_hashes) == 2
         crawler.clear_seen_hashes()
@@ -172,6 +241,182 @@ class TestCrawler:
         assert result.success is False
         assert "not allowed" in result.error.lower()
 
+    @pytest.mark.asyncio
+    async def test_fetch_reuses_client(self, source_config: SourceConfig) -> None:
+        """Test that fetches share one pooled client until closed."""
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, content=request.url.path.encode())
+
+        async with Crawler(respect_robots=False) as crawler:
+            shared = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            crawler._client = shared
+
+            first = await crawler.fetch("https://test.example.com/a", source_config)
+            second = await crawler.fetch("https://test.example.com/b", source_config)
+
+            assert first.success and second.success
+            assert len(requests) == 2
+            assert not first.is_duplicate and not second.is_duplicate
+            assert first.content == b"/a"
+            assert first.content_hash == Crawler.compute_hash(b"/a")
+
+            again = await crawler.fetch("https://test.example.com/a", source_config)
+            assert again.is_duplicate
+            assert again.content_hash == first.content_hash
+            assert crawler._get_client() is shared
+
+        assert crawler._client is None
+        assert shared.is_closed
+
+    @pytest.mark.asyncio
+    async def test_fetch_revalidates_with_etag(self, source_config: SourceConfig) -> None:
+        """Test that refetching a stored page sends its ETag and honours 304."""
+        seen_etags: list[str | None] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen_etags.append(request.headers.get("If-None-Match"))
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(
+                200,
+                content=b"<html>wine</html>",
+                headers={"ETag": '"v1"', "Content-Type": "text/html"},
+            )
+
+        async with Crawler(respect_robots=False) as crawler:
+            crawler._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+            first = await crawler.fetch("https://test.example.com/w", source_config)
+            unstored = await crawler.fetch("https://test.example.com/w", source_config)
+            crawler.remember_validators(first)
+            second = await crawler.fetch("https://test.example.com/w", source_config)
+
+        assert seen_etags == [None, None, '"v1"']
+        assert unstored.success and unstored.etag == '"v1"'
+        assert first.success and not first.not_modified
+        assert second.not_modified and second.is_duplicate
+        assert second.content_hash == first.content_hash
+        assert second.mime_type == "text/html"
+
+    @pytest.mark.asyncio
+    async def test_validators_shared_across_crawlers(
+        self, source_config: SourceConfig
+    ) -> None:
+        """Test that a new crawler revalidates pages an earlier one fetched."""
+        seen_etags: list[str | None] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen_etags.append(request.headers.get("If-None-Match"))
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, content=b"wine", headers={"ETag": '"v1"'})
+
+        url = "https://test.example.com/w"
+        for _ in range(2):
+            async with Crawler(respect_robots=False) as crawler:
+                crawler._client = httpx.AsyncClient(
+                    transport=httpx.MockTransport(handler)
+                )
+                result = await crawler.fetch(url, source_config)
+                crawler.remember_validators(result)
+
+        assert seen_etags == [None, '"v1"']
+        assert result.not_modified
+
+        async with Crawler("OtherAgent/1.0", respect_robots=False) as crawler:
+            crawler._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            result = await crawler.fetch(url, source_config)
+
+        assert seen_etags[-1] is None
+        assert result.success
+        crawler.clear_validators()
+
+    @pytest.mark.asyncio
+    async def test_iter_fetch_ordered(self, source_config: SourceConfig) -> None:
+        """Test that iter_fetch overlaps requests but yields in input order."""
+        in_flight = 0
+        peak = 0
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            # Later URLs finish first
+            await asyncio.sleep(0.05 - int(request.url.path[1:]) * 0.01)
+            in_flight -= 1
+            return httpx.Response(200, content=request.url.path.encode())
+
+        urls = [f"https://test.example.com/{i}" for i in range(5)]
+        async with Crawler(respect_robots=False) as crawler:
+            crawler._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            results = [r async for r in crawler.iter_fetch(urls, source_config, 3)]
+
+        assert [r.url for r in results] == urls
+        assert [r.content for r in results] == [f"/{i}".encode() for i in range(5)]
+        assert 1 < peak <= 3
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("statuses", "expected_status", "expected_requests"),
+        [
+            ([503, 200], 200, 2),
+            ([429, 429, 429], 429, 3),
+            ([404, 200], 404, 1),
+        ],
+    )
+    async def test_fetch_retries_only_retryable_statuses(
+        self,
+        source_config: SourceConfig,
+        monkeypatch: pytest.MonkeyPatch,
+        statuses: list[int],
+        expected_status: int,
+        expected_requests: int,
+    ) -> None:
+        """Test that throttling and server errors are retried, other 4xx are not."""
+        monkeypatch.setattr("random.uniform", lambda low, high: 0.0)
+        responses = iter(statuses)
+        calls = 0
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal calls
+            calls += 1
+            return httpx.Response(next(responses))
+
+        async with Crawler(respect_robots=False) as crawler:
+            crawler._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            result = await crawler.fetch("https://test.example.com/r", source_config)
+
+        assert calls == expected_requests
+        assert result.status_code == expected_status
+
+    @pytest.mark.asyncio
+    async def test_fetch_retry_waits_for_retry_after(
+        self, source_config: SourceConfig, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a Retry-After replaces the jittered backoff before a retry."""
+        jitter_calls: list[float] = []
+        monkeypatch.setattr(
+            "random.uniform", lambda low, high: jitter_calls.append(high) or 0.0
+        )
+        responses = iter(
+            [httpx.Response(429, headers={"Retry-After": "0.1"}), httpx.Response(200)]
+        )
+
+        async with Crawler(respect_robots=False) as crawler:
+            crawler._client = httpx.AsyncClient(
+                transport=httpx.MockTransport(lambda request: next(responses))
+            )
+            start = time.monotonic()
+            result = await crawler.fetch("https://test.example.com/r", source_config)
+            elapsed = time.monotonic() - start
+
+        assert result.status_code == 200
+        assert jitter_calls == []
+        assert elapsed >= 0.09
+
     def test_rate_limiter_creation(self, source_config: SourceConfig) -> None:
         """Test that rate limiters are created per source."""
         crawler = Crawler()
@@ -194,6 +439,11 @@ class TestCrawler:
 class TestRobotsChecker:
     """Tests for robots.txt compliance."""
 
+    @pytest.fixture(autouse=True)
+    def clear_robots_cache(self) -> None:
+        """Start each test with an empty shared robots.txt cache."""
+        RobotsChecker("TestAgent/1.0").clear_cache()
+
     def test_crawler_respects_robots_flag(self) -> None:
         """Test that respect_robots flag is properly set."""
         crawler1 = Crawler(respect_robots=True)
@@ -201,3 +451,169 @@ class TestRobotsChecker:
 
         assert crawler1._robots_checker is not None
         assert crawler2._robots_checker is None
+
+    @pytest.mark.asyncio
+    async def test_concurrent_lookups_share_one_fetch(self) -> None:
+        """Test that concurrent checks for a domain fetch robots.txt once."""
+        hosts: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            hosts.append(request.url.host)
+            return httpx.Response(200, text="User-agent: *\nDisallow: /private/\n")
+
+        checker = RobotsChecker("TestAgent/1.0")
+        checker._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        results = await asyncio.gather(
+            *(
+                checker.is_allowed(f"https://a.example.com/{path}")
+                for path in ("x", "private/y", "z")
+            )
+        )
+        assert await checker.is_allowed("https://a.example.com/private/z") is False
+        await checker.aclose()
+
+        assert results == [True, False, True]
+        assert hosts == ["a.example.com"]
+
+    @pytest.mark.asyncio
+    async def test_server_error_cached_briefly(self) -> None:
+        """Test that a robots.txt server error allows crawling, cached briefly."""
+        checker = RobotsChecker("TestAgent/1.0")
+        checker._client = httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda request: httpx.Response(503))
+        )
+        assert await checker.is_allowed("https://b.example.com/page") is True
+        await checker.aclose()
+
+        _, expires_at = checker._cache["b.example.com"]
+        assert expires_at - time.monotonic() <= ROBOTS_ERROR_TTL_SECONDS
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("robots_txt", "expected"),
+        [
+            ("User-agent: *\nDisallow:\n", "allow_all"),
+            ("User-agent: *\nDisallow: /\n", "deny_all"),
+            (
+                "User-agent: TestAgent\nDisallow: /\n\nUser-agent: *\nDisallow:\n",
+                "deny_all",
+            ),
+            ("User-agent: *\nDisallow: /private/\n", "parser"),
+        ],
+    )
+    async def test_trivial_rules_cached_as_shared_result(
+        self, robots_txt: str, expected: str
+    ) -> None:
+        """Test that allow-all and deny-all robots.txt files are not kept per domain."""
+        checker = RobotsChecker("TestAgent/1.0")
+        checker._client = httpx.AsyncClient(
+            transport=httpx.MockTransport(
+                lambda request: httpx.Response(200, text=robots_txt)
+            )
+        )
+        allowed = await checker.is_allowed("https://c.example.com/page")
+        await checker.aclose()
+
+        parser, _ = checker._cache["c.example.com"]
+        if expected == "allow_all":
+            assert parser is None and allowed is True
+        elif expected == "deny_all":
+            assert parser is _DENY_ALL and allowed is False
+        else:
+            assert parser not in (None, _DENY_ALL) and allowed is True
+
+    def test_parser_kept_without_parsed_rules(self) -> None:
+        """Test that a parser whose rules cannot be read is not simplified."""
+        parser = RobotFileParser()
+        parser.parse(["User-agent: *", "Disallow: /"])
+        del parser.entries
+
+        assert RobotsChecker("TestAgent/1.0")._simplify(parser) is parser
+
+    @pytest.mark.asyncio
+    async def test_cache_shared_across_checkers(self) -> None:
+        """Test that a new checker reuses robots.txt fetched by an earlier one."""
+        hosts: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            hosts.append(request.url.host)
+            return httpx.Response(200, text="User-agent: *\nDisallow: /private/\n")
+
+        first = RobotsChecker("TestAgent/1.0")
+        first._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        assert await first.is_allowed("https://d.example.com/private/x") is False
+        await first.aclose()
+
+        second = RobotsChecker("TestAgent/1.0")
+        second._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        assert await second.is_allowed("https://d.example.com/private/y") is False
+        await second.aclose()
+
+        assert hosts == ["d.example.com"]
+        assert "d.example.com" not in RobotsChecker("OtherAgent/1.0")._cache
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("cache_control", "expected_ttl"),
+        [
+            ("public, max-age=7200", 7200.0),
+            ("max-age=0", ROBOTS_ERROR_TTL_SECONDS),
+            ("max-age=31536000", ROBOTS_MAX_TTL_SECONDS),
+        ],
+    )
+    async def test_cache_ttl_honors_max_age(
+        self, cache_control: str, expected_ttl: float
+    ) -> None:
+        """Test that Cache-Control max-age sets the TTL, within bounds."""
+        checker = RobotsChecker("TestAgent/1.0")
+        checker._client = httpx.AsyncClient(
+            transport=httpx.MockTransport(
+                lambda request: httpx.Response(
+                    200,
+                    text="User-agent: *\nDisallow: /private/\n",
+                    headers={"Cache-Control": cache_control},
+                )
+            )
+        )
+        before = time.monotonic()
+        await checker.is_allowed("https://e.example.com/page")
+        await checker.aclose()
+
+        _, expires_at = checker._cache["e.example.com"]
+        assert expected_ttl <= expires_at - before <= expected_ttl + 5
+
+    @pytest.mark.asyncio
+    async def test_decisions_cached_until_robots_refresh(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that repeat URL checks reuse the decision until robots.txt changes."""
+        rules = iter(
+            ["User-agent: *\nDisallow: /private/\n", "User-agent: *\nDisallow: /p\n"]
+        )
+        checker = RobotsChecker("TestAgent/1.0")
+        checker._client = httpx.AsyncClient(
+            transport=httpx.MockTransport(
+                lambda request: httpx.Response(200, text=next(rules))
+            )
+        )
+        calls: list[str] = []
+        can_fetch = RobotFileParser.can_fetch
+
+        def counting_can_fetch(self, useragent: str, url: str) -> bool:
+            calls.append(url)
+            return can_fetch(self, useragent, url)
+
+        monkeypatch.setattr(RobotFileParser, "can_fetch", counting_can_fetch)
+        url = "https://f.example.com/page"
+
+        assert await checker.is_allowed(url) is True
+        assert await checker.is_allowed(url) is True
+        assert calls == [url]
+
+        # An expired entry is refetched, and the new rules decide again
+        parser, _ = checker._cache["f.example.com"]
+        checker._cache["f.example.com"] = (parser, 0.0)
+        assert await checker.is_allowed(url) is False
+        await checker.aclose()
+
+        assert calls == [url, url]
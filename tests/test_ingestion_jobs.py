@@ -0,0 +1,127 @@
+"""Tests for the ingestion job pipeline."""
+
+from functools import partial
+from pathlib import Path
+
+import httpx
+import pytest
+import yaml
+
+from wine_agent.db import init_db, reset_engine
+from wine_agent.db import models_canonical  # noqa: F401
+from wine_agent.ingestion import jobs
+from wine_agent.ingestion.adapters.base import (
+    BaseAdapter,
+    ExtractedField,
+    ExtractedListing,
+)
+from wine_agent.ingestion.crawler import Crawler
+from wine_agent.ingestion.jobs import JobStatus, ingest_source_sync
+from wine_agent.ingestion.registry import SourceRegistry
+
+PAGE_URL = "https://shop.example.com/wines/1"
+
+
+class FlakyAdapter(BaseAdapter):
+    """Adapter whose first extraction fails, as a parser bug would."""
+
+    ADAPTER_NAME = "flaky"
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.extract_calls = 0
+
+    def discover_urls(self, seed_urls: list[str] | None = None) -> list[str]:
+        return [PAGE_URL]
+
+    def extract_listing(
+        self, content: bytes, url: str, mime_type: str
+    ) -> ExtractedListing | None:
+        self.extract_calls += 1
+        if self.extract_calls == 1:
+            return None
+        return ExtractedListing(
+            url=url,
+            source_name="shop",
+            title="Domaine Test Pinot Noir 2019",
+            producer_name=ExtractedField(
+                "producer_name", "Domaine Test", 0.9, "jsonld"
+            ),
+            wine_name=ExtractedField("wine_name", "Pinot Noir", 0.9, "jsonld"),
+            vintage_year=ExtractedField("vintage_year", 2019, 0.9, "jsonld"),
+        )
+
+
+class TestIngestSource:
+    """Tests for ingest_source with a real database and a mocked site."""
+
+    @pytest.fixture
+    def registry(self, tmp_path: Path) -> SourceRegistry:
+        """Create a registry with a single HTTP source."""
+        config = {
+            "global": {"user_agent": "JobsTestAgent/1.0"},
+            "sources": [
+                {
+                    "name": "shop",
+                    "domain": "shop.example.com",
+                    "adapter": "flaky",
+                    "enabled": True,
+                }
+            ],
+        }
+        config_path = tmp_path / "sources.yaml"
+        config_path.write_text(yaml.dump(config))
+        registry = SourceRegistry()
+        registry.load_config(config_path)
+        return registry
+
+    @pytest.fixture(autouse=True)
+    def environment(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        """Point the job at a temporary database and snapshot directory."""
+        monkeypatch.setenv("DATABASE_URL", str(tmp_path / "jobs.db"))
+        monkeypatch.setenv("SNAPSHOT_STORAGE_PATH", str(tmp_path / "snapshots"))
+        reset_engine()
+        init_db()
+        yield
+        Crawler("JobsTestAgent/1.0").clear_validators()
+        reset_engine()
+
+    @pytest.mark.asyncio
+    async def test_page_failing_extraction_is_refetched_next_job(
+        self, registry: SourceRegistry, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a page is only revalidated once a job has stored it."""
+        seen_etags: list[str | None] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/robots.txt":
+                return httpx.Response(404)
+            seen_etags.append(request.headers.get("If-None-Match"))
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(
+                200,
+                content=b"<html>wine</html>",
+                headers={"ETag": '"v1"', "Content-Type": "text/html"},
+            )
+
+        adapter = FlakyAdapter()
+        monkeypatch.setattr(jobs, "get_default_registry", lambda: registry)
+        monkeypatch.setattr(jobs, "get_adapter", lambda name, config: adapter)
+        monkeypatch.setattr(
+            httpx,
+            "AsyncClient",
+            partial(httpx.AsyncClient, transport=httpx.MockTransport(handler)),
+        )
+
+        failed = await ingest_source_sync("shop")
+        stored = await ingest_source_sync("shop")
+        unchanged = await ingest_source_sync("shop")
+
+        assert seen_etags == [None, None, '"v1"']
+        assert failed.status == JobStatus.COMPLETED
+        assert failed.errors == [f"Failed to extract listing from {PAGE_URL}"]
+        assert stored.listings_created == 1
+        assert unchanged.urls_unchanged == 1
+        assert unchanged.urls_fetched == 0
+        assert adapter.extract_calls == 2
@@ -29,6 +29,20 @@ class TestNormalizer:
         assert normalizer.normalize_region("Some Unknown Region") == "Some Unknown Region"
         assert normalizer.normalize_region(None) is None
 
+    @pytest.mark.parametrize(
+        "aliases",
+        [
+            Normalizer.REGION_ALIASES,
+            Normalizer.GRAPE_ALIASES,
+            Normalizer.COLOR_ALIASES,
+            Normalizer.STYLE_ALIASES,
+        ],
+    )
+    def test_canonical_names_map_to_themselves(self, aliases: dict[str, str]) -> None:
+        """Test the invariant that lets canonical inputs skip the alias lookup."""
+        for canonical in set(aliases.values()):
+            assert aliases.get(canonical.lower(), canonical) == canonical
+
     def test_normalize_grapes_from_list(self, normalizer: Normalizer) -> None:
         """Test grape normalization from list input."""
         grapes = ["cab", "merlot", "Pinot Noir"]
@@ -52,6 +66,29 @@ class TestNormalizer:
         """Test grape normalization with None input."""
         assert normalizer.normalize_grapes(None) == []
 
+    def test_find_aliases(self, normalizer: Normalizer) -> None:
+        """Test finding aliases in a title, longest match first."""
+        title = "Domaine X Burgundy Pinot Noir 2015 Rouge, an important wine"
+        assert normalizer.find_aliases(title) == [
+            ("region", "Bourgogne"),
+            ("grape", "Pinot Noir"),
+            ("color", "red"),
+        ]
+        assert normalizer.find_aliases("Cab Sauv from Napa Valley") == [
+            ("grape", "Cabernet Sauvignon"),
+            ("region", "Napa Valley"),
+        ]
+
+    def test_find_aliases_multiple_kinds(self, normalizer: Normalizer) -> None:
+        """Test that an alias in several tables is reported for each kind."""
+        assert normalizer.find_aliases("NV Champagne Brut") == [
+            ("region", "Champagne"),
+            ("color", "sparkling"),
+            ("style", "sparkling"),
+        ]
+        assert normalizer.find_aliases("Cabinet reserve") == []
+        assert normalizer.find_aliases(None) == []
+
     def test_parse_abv_float(self, normalizer: Normalizer) -> None:
         """Test ABV parsing from float."""
         assert normalizer.parse_abv(13.5) == 13.5
@@ -123,6 +160,20 @@ class TestNormalizer:
         assert normalized.price == 99.99
         assert normalized.currency == "USD"
 
+    def test_normalize_listing_color_and_style(self, normalizer: Normalizer) -> None:
+        """Test that color and style are case-folded, stripped and aliased."""
+        extracted = ExtractedListing(
+            url="https://example.com/wine/1",
+            source_name="test",
+            color=ExtractedField("color", " Rouge ", 0.9, "css"),
+            style=ExtractedField("style", " Late Harvest ", 0.9, "css"),
+        )
+
+        normalized = normalizer.normalize_listing(extracted)
+
+        assert normalized.color == "red"
+        assert normalized.style == "late harvest"
+
     def test_normalize_listing_missing_fields(self, normalizer: Normalizer) -> None:
         """Test listing normalization with missing fields."""
         extracted = ExtractedListing(
@@ -139,6 +190,14 @@ class TestNormalizer:
         assert normalized.grapes == []
         assert normalized.bottle_size_ml == 750  # Default
 
+    def test_clean_string_collapses_whitespace(self, normalizer: Normalizer) -> None:
+        """Test that whitespace runs of any kind collapse to single spaces."""
+        assert normalizer._clean_string("  Domaine\t\n de\u00a0 la  Romanée ") == (
+            "Domaine de la Romanée"
+        )
+        assert normalizer._clean_string(" \t\n ") is None
+        assert normalizer._clean_string(2019) == "2019"
+
     def test_parse_bottle_size(self, normalizer: Normalizer) -> None:
         """Test bottle size parsing."""
         # Test via _parse_bottle_size method
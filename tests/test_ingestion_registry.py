@@ -1,5 +1,6 @@
 """Tests for the ingestion registry module."""
 
+import re
 import tempfile
 from pathlib import Path
 
@@ -110,6 +111,34 @@ class TestSourceConfig:
         assert config.is_url_allowed("https://test.com/wines/123") is True
         assert config.is_url_allowed("https://test.com/admin/123") is False
 
+    @pytest.mark.parametrize(
+        ("allowlist", "fused"),
+        [
+            (["^https://test\\.com/wines/", "^https://test\\.com/(red|white)/"], True),
+            (["(?i)^https://test\\.com/wines/", "^https://test\\.com/red/"], False),
+            (["^https://test\\.com/wines/", "^https://(test)\\.com/\\1/"], False),
+        ],
+    )
+    def test_url_filtering_fused_patterns(
+        self, allowlist: list[str], fused: bool
+    ) -> None:
+        """Test that allowlist patterns are fused when safe, with the same results."""
+        config = SourceConfig(
+            name="test", domain="test.com", adapter="test", allowlist=allowlist
+        )
+        expected = {
+            url: any(re.match(p, url) for p in allowlist)
+            for url in (
+                "https://test.com/wines/1",
+                "https://TEST.com/wines/1",
+                "https://test.com/red/1",
+                "https://test.com/test/1",
+                "https://test.com/other/1",
+            )
+        }
+        assert {url: config.is_url_allowed(url) for url in expected} == expected
+        assert (len(config._allowlist_patterns) == 1) is fused
+
 
 class TestSourceRegistry:
     """Tests for SourceRegistry."""
@@ -233,6 +262,36 @@ sources:
         finally:
             Path(config_path).unlink()
 
+    def test_reload_reuses_parse_until_file_changes(
+        self, sample_config: str, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that reloading an unchanged file skips the YAML parse."""
+        config_path = tmp_path / "sources.yaml"
+        config_path.write_text(sample_config)
+        parses = 0
+        load = yaml.load
+
+        def counting_load(*args, **kwargs):
+            nonlocal parses
+            parses += 1
+            return load(*args, **kwargs)
+
+        monkeypatch.setattr(yaml, "load", counting_load)
+
+        first = SourceRegistry()
+        first.load_config(config_path)
+        first.get_source("test-source").allowlist.append("^https://changed/")
+        second = SourceRegistry()
+        second.load_config(config_path)
+        assert parses == 1
+        assert second.get_source("test-source").allowlist == []
+
+        # A different length, so the change is seen even with coarse mtimes
+        config_path.write_text(sample_config.replace("TestAgent/1.0", "Agent/2"))
+        second.load_config(config_path)
+        assert parses == 2
+        assert second.global_config.user_agent == "Agent/2"
+
     def test_config_not_found(self) -> None:
         """Test error when config file not found."""
         registry = SourceRegistry()
@@ -10,7 +10,8 @@ from sqlalchemy.orm import sessionmaker
 
 from wine_agent.core.enums import NoteSource, NoteStatus, WineColor
 from wine_agent.core.schema import TastingNote
-from wine_agent.db.models import Base, TastingNoteDB
+from wine_agent.db.models import Base, TastingNoteDB, TastingNoteGrapeDB
+from wine_agent.db.repositories import TastingNoteRepository
 from wine_agent.db.search import SearchFilters, SearchRepository
 
 
@@ -211,6 +212,16 @@ class TestSearchRepository:
             result = repo.search(filters=filters)
             assert result.total_count == 1
 
+    def test_build_fts_query_strips_special_characters(self, test_db):
+        """FTS5 operators in user input become word separators."""
+        with test_db() as session:
+            repo = SearchRepository(session)
+
+            assert repo._build_fts_query('  "cherry" (red)*:x-y^z ') == (
+                '"cherry"* "red"* "x"* "y"* "z"*'
+            )
+            assert repo._build_fts_query("  ") == '""'
+
     def test_search_by_score_range(self, test_db):
         """Score range filter works correctly."""
         from wine_agent.core.schema import Scores, SubScores
@@ -329,6 +340,46 @@ class TestSearchRepository:
             assert len(result.notes) == 1
             assert result.has_more is False
 
+            # Past the end still reports the total
+            result = repo.search(limit=2, offset=10)
+            assert result.notes == []
+            assert result.total_count == 5
+
+    def test_search_cursor_pagination(self, test_db):
+        """Keyset cursor pages cover every match once, in offset order."""
+        with test_db() as session:
+            for i in range(5):
+                _insert_note(session, _create_test_note(producer=f"Producer {i}"))
+
+            repo = SearchRepository(session)
+            expected = [n.id for n in repo.search(limit=10).notes]
+
+            result = repo.search(limit=2)
+            seen = [n.id for n in result.notes]
+            while result.next_cursor is not None:
+                # offset is ignored once a cursor is given
+                filters = SearchFilters(cursor=result.next_cursor)
+                result = repo.search(filters, limit=2, offset=99)
+                assert result.offset == 0
+                seen.extend(n.id for n in result.notes)
+
+            assert seen == expected
+            assert len(result.notes) == 1
+            assert result.has_more is False
+
+    def test_iter_notes_streams_all_matches(self, test_db):
+        """iter_notes yields every match without pagination."""
+        with test_db() as session:
+            for i in range(5):
+                _insert_note(session, _create_test_note(producer=f"Producer {i}"))
+            _insert_note(session, _create_test_note(producer="Other", region="Rioja"))
+
+            repo = SearchRepository(session)
+            notes = list(repo.iter_notes(SearchFilters(producer="Producer"), chunk=2))
+
+            assert len(notes) == 5
+            assert all(n.wine.producer.startswith("Producer") for n in notes)
+
     def test_search_combined_filters(self, test_db):
         """Multiple filters combine correctly."""
         with test_db() as session:
@@ -400,6 +451,76 @@ class TestSearchRepository:
             assert "Pinot Noir" in options["grapes"]
             assert "Cabernet Sauvignon" in options["grapes"]
 
+    def test_filter_options_cached_until_note_write(self, test_db):
+        """Filter options are cached and refreshed when a note is written."""
+        with test_db() as session:
+            note = _create_test_note(region="Burgundy")
+            _insert_note(session, note)
+
+            repo = SearchRepository(session)
+            assert repo.get_filter_options()["regions"] == ["Burgundy"]
+
+            # Raw SQL bypasses invalidation, so the cached value is served
+            session.execute(text("UPDATE tasting_notes SET region = 'Jura'"))
+            session.commit()
+            assert repo.get_filter_options()["regions"] == ["Burgundy"]
+
+            note.wine.region = "Rhone"
+            TastingNoteRepository(session).update(note)
+            session.commit()
+            assert repo.get_filter_options()["regions"] == ["Rhone"]
+
+    def test_filter_options_not_cached_from_rolled_back_writes(self, test_db):
+        """Options read after an uncommitted note write are not kept."""
+        with test_db() as session:
+            note = _create_test_note(region="Burgundy")
+            _insert_note(session, note)
+
+            repo = SearchRepository(session)
+            assert repo.get_filter_options()["regions"] == ["Burgundy"]
+
+            note.wine.region = "Rhone"
+            TastingNoteRepository(session).update(note)
+            assert repo.get_filter_options()["regions"] == ["Rhone"]
+
+            session.rollback()
+            assert repo.get_filter_options()["regions"] == ["Burgundy"]
+
+    def test_filter_option_grapes_follow_note_changes(self, test_db):
+        """Grape options track updates and deletes of notes."""
+        with test_db() as session:
+            note = _create_test_note(grapes=["Pinot Noir", "Gamay"])
+            _insert_note(session, note)
+            _insert_note(session, _create_test_note(grapes=["Gamay"]))
+
+            repo = SearchRepository(session)
+            assert repo.get_filter_options()["grapes"] == ["Gamay", "Pinot Noir"]
+
+            db_note = session.get(TastingNoteDB, str(note.id))
+            db_note.grapes_json = json.dumps(["Syrah"])
+            session.commit()
+            assert repo.get_filter_options()["grapes"] == ["Gamay", "Syrah"]
+
+            session.delete(db_note)
+            session.commit()
+            assert repo.get_filter_options()["grapes"] == ["Gamay"]
+
+    def test_grape_lookup_backfilled_when_created(self, test_db):
+        """Creating the grape lookup on an existing database fills it from notes."""
+        with test_db() as session:
+            _insert_note(session, _create_test_note(grapes=["Pinot Noir", "Gamay"]))
+            engine = session.get_bind()
+            session.close()
+
+            # As on a database that predates the table, before init_db adds it
+            TastingNoteGrapeDB.__table__.drop(engine)
+            Base.metadata.create_all(bind=engine)
+
+            grapes = session.execute(
+                text("SELECT grape FROM tasting_note_grapes ORDER BY grape")
+            ).scalars()
+            assert list(grapes) == ["Gamay", "Pinot Noir"]
+
     def test_search_all_statuses(self, test_db):
         """Search with status='all' returns both drafts and published."""
         with test_db() as session:
@@ -356,6 +356,7 @@ def _display_job_result(result: dict) -> None:
     rprint(f"\n[bold]Statistics:[/bold]")
     rprint(f"  URLs discovered: {result.get('urls_discovered', 0)}")
     rprint(f"  URLs fetched: {result.get('urls_fetched', 0)}")
+    rprint(f"  URLs unchanged: {result.get('urls_unchanged', 0)}")
     rprint(f"  Listings created: {result.get('listings_created', 0)}")
     rprint(f"  Entities created: {result.get('entities_created', 0)}")
     rprint(f"  Entities matched: {result.get('entities_matched', 0)}")
@@ -6,6 +6,7 @@ These models define the canonical wine catalog entities:
 - Importer, Distributor (trade entities)
 - Source, Snapshot, Listing, ListingMatch (ingestion entities)
 - FieldProvenance (provenance tracking)
+- ProducerAggregate, WineWithVintages (aggregate read models)
 """
 
 from datetime import UTC, datetime
@@ -380,6 +381,25 @@ class FieldProvenance(BaseModel):
         return v.strip()
 
 
+# ============================================================================
+# Aggregate Models
+# ============================================================================
+
+
+class WineWithVintages(BaseModel):
+    """A wine together with all of its vintages."""
+
+    wine: Wine
+    vintages: list[Vintage] = Field(default_factory=list)
+
+
+class ProducerAggregate(BaseModel):
+    """A producer with its full wine and vintage tree."""
+
+    producer: Producer
+    wines: list[WineWithVintages] = Field(default_factory=list)
+
+
 # ============================================================================
 # Search/API Models
 # ============================================================================
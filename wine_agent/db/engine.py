@@ -4,15 +4,29 @@ import os
 from collections.abc import Generator
 from contextlib import contextmanager
 from pathlib import Path
+from typing import Any
 
 from alembic import command
 from alembic.config import Config
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, make_url
 from sqlalchemy.orm import Session, sessionmaker
 
 # Default database path (can be overridden via environment variable)
 DEFAULT_DB_PATH = Path.home() / ".wine_agent" / "wine_agent.db"
 
+# Per-connection tuning applied to every new SQLite connection. WAL lets
+# readers proceed during writes and, with synchronous=NORMAL, avoids an fsync
+# per commit; the page cache and mmap keep hot FTS and index pages in memory.
+# cache_size is per connection (negative values are KiB), so it is sized
+# with the connection pool in mind; mmap pages are shared through the OS.
+SQLITE_PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "cache_size": "-32768",
+    "mmap_size": "268435456",
+    "temp_store": "MEMORY",
+}
+
 
 def get_database_url(db_path: Path | str | None = None) -> str:
     """
@@ -54,11 +68,33 @@ def create_db_engine(db_path: Path | str | None = None, echo: bool = False):
         SQLAlchemy Engine instance.
     """
     url = get_database_url(db_path)
-    return create_engine(
+    pool_kwargs = {}
+    if make_url(url).database not in (None, "", ":memory:"):
+        # File databases get a QueuePool sized for the web worker threadpool;
+        # LIFO checkout keeps reusing the connections with warm page caches.
+        pool_kwargs = {
+            "pool_size": int(os.environ.get("WINE_AGENT_DB_POOL_SIZE", "20")),
+            "max_overflow": int(os.environ.get("WINE_AGENT_DB_MAX_OVERFLOW", "20")),
+            "pool_use_lifo": True,
+        }
+    engine = create_engine(
         url,
         echo=echo,
         connect_args={"check_same_thread": False},  # Allow multi-threaded access
+        **pool_kwargs,
     )
+    event.listen(engine, "connect", _apply_sqlite_pragmas)
+    return engine
+
+
+def _apply_sqlite_pragmas(dbapi_connection: Any, connection_record: Any) -> None:
+    """Apply SQLITE_PRAGMAS to a newly opened SQLite connection."""
+    cursor = dbapi_connection.cursor()
+    try:
+        for name, value in SQLITE_PRAGMAS.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+    finally:
+        cursor.close()
 
 
 # Global engine and session factory (initialized lazily)
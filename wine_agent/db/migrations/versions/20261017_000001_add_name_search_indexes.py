@@ -0,0 +1,56 @@
+"""Add case-insensitive name search indexes for canonical entities.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-17
+
+This migration adds, per dialect:
+- SQLite: NOCASE indexes so prefix LIKE searches become index range scans
+- PostgreSQL: pg_trgm GIN indexes so substring ILIKE searches avoid table scans
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0006"
+down_revision: Union[str, None] = "0005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, name column) pairs searched by the repositories' search_by_name
+NAME_COLUMNS = [
+    ("producers", "canonical_name"),
+    ("wines", "canonical_name"),
+    ("regions", "name"),
+    ("grape_varieties", "canonical_name"),
+    ("importers", "canonical_name"),
+    ("distributors", "canonical_name"),
+]
+
+
+def upgrade() -> None:
+    dialect = op.get_bind().dialect.name
+
+    if dialect == "postgresql":
+        op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        for table, column in NAME_COLUMNS:
+            op.execute(
+                f"CREATE INDEX IF NOT EXISTS ix_{table}_{column}_trgm "
+                f"ON {table} USING gin ({column} gin_trgm_ops)"
+            )
+    elif dialect == "sqlite":
+        for table, column in NAME_COLUMNS:
+            op.execute(
+                f"CREATE INDEX IF NOT EXISTS ix_{table}_{column}_nocase "
+                f"ON {table} ({column} COLLATE NOCASE)"
+            )
+
+
+def downgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    suffix = "trgm" if dialect == "postgresql" else "nocase"
+
+    for table, column in NAME_COLUMNS:
+        op.execute(f"DROP INDEX IF EXISTS ix_{table}_{column}_{suffix}")
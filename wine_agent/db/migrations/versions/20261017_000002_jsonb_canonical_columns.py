@@ -0,0 +1,58 @@
+"""Store canonical JSON list/dict columns as JSONB on PostgreSQL.
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-17
+
+This migration (PostgreSQL only; a no-op on SQLite):
+- Converts the aliases/grapes/tech sheet/regions served columns from TEXT to JSONB
+- Adds a GIN index on vintages.tech_sheet_attrs_json for containment queries
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0007"
+down_revision: Union[str, None] = "0006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, column, empty value) for every OrjsonList/OrjsonDict column
+JSON_COLUMNS = [
+    ("producers", "aliases_json", "[]"),
+    ("wines", "aliases_json", "[]"),
+    ("wines", "grapes_json", "[]"),
+    ("vintages", "tech_sheet_attrs_json", "{}"),
+    ("regions", "aliases_json", "[]"),
+    ("grape_varieties", "aliases_json", "[]"),
+    ("distributors", "regions_served_json", "[]"),
+]
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    for table, column, empty in JSON_COLUMNS:
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} TYPE jsonb "
+            f"USING COALESCE(NULLIF({column}, ''), '{empty}')::jsonb"
+        )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_vintages_tech_sheet_attrs_gin "
+        "ON vintages USING gin (tech_sheet_attrs_json)"
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.execute("DROP INDEX IF EXISTS ix_vintages_tech_sheet_attrs_gin")
+    for table, column, _ in JSON_COLUMNS:
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} TYPE text "
+            f"USING {column}::text"
+        )
@@ -0,0 +1,37 @@
+"""Add composite (status, updated_at) index on tasting_notes.
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-17
+
+This migration adds:
+- ix_tasting_notes_status_updated_at, so library searches filter by status
+  and walk notes in updated_at order without scanning the whole table
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0008"
+down_revision: Union[str, None] = "0007"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_tasting_notes_status_updated_at",
+        "tasting_notes",
+        ["status", "updated_at"],
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_tasting_notes_status_updated_at",
+        table_name="tasting_notes",
+        if_exists=True,
+    )
@@ -0,0 +1,99 @@
+"""Add denormalized grape lookup table for tasting notes.
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-17
+
+This migration adds:
+- tasting_note_grapes (note_id, grape) with an index on grape
+- On SQLite, triggers keeping it in sync with tasting_notes.grapes_json
+- On SQLite, a backfill from existing notes
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0009"
+down_revision: Union[str, None] = "0008"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Explode a note's grapes_json into the lookup table; malformed JSON yields no rows
+INSERT_NOTE_GRAPES = """
+    INSERT OR IGNORE INTO tasting_note_grapes(note_id, grape)
+    SELECT NEW.id, value
+    FROM json_each(
+        CASE WHEN json_valid(NEW.grapes_json) THEN NEW.grapes_json ELSE '[]' END
+    )
+    WHERE type = 'text' AND value != '';
+"""
+
+
+def upgrade() -> None:
+    op.create_table(
+        "tasting_note_grapes",
+        sa.Column(
+            "note_id",
+            sa.String(36),
+            sa.ForeignKey("tasting_notes.id"),
+            nullable=False,
+        ),
+        sa.Column("grape", sa.String(100), nullable=False),
+        sa.PrimaryKeyConstraint("note_id", "grape"),
+    )
+    op.create_index("ix_tasting_note_grapes_grape", "tasting_note_grapes", ["grape"])
+
+    # The triggers and backfill use SQLite's json_each
+    if op.get_bind().dialect.name != "sqlite":
+        return
+
+    # Trigger: After INSERT on tasting_notes, add its grapes
+    op.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS tasting_note_grapes_insert
+        AFTER INSERT ON tasting_notes
+        BEGIN
+            {INSERT_NOTE_GRAPES}
+        END;
+    """)
+
+    # Trigger: After UPDATE of grapes_json, replace its grapes
+    op.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS tasting_note_grapes_update
+        AFTER UPDATE OF grapes_json ON tasting_notes
+        BEGIN
+            DELETE FROM tasting_note_grapes WHERE note_id = OLD.id;
+            {INSERT_NOTE_GRAPES}
+        END;
+    """)
+
+    # Trigger: After DELETE on tasting_notes, drop its grapes
+    op.execute("""
+        CREATE TRIGGER IF NOT EXISTS tasting_note_grapes_delete
+        AFTER DELETE ON tasting_notes
+        BEGIN
+            DELETE FROM tasting_note_grapes WHERE note_id = OLD.id;
+        END;
+    """)
+
+    # Backfill from existing notes
+    op.execute("""
+        INSERT OR IGNORE INTO tasting_note_grapes(note_id, grape)
+        SELECT tn.id, j.value
+        FROM tasting_notes tn,
+             json_each(
+                 CASE WHEN json_valid(tn.grapes_json) THEN tn.grapes_json ELSE '[]' END
+             ) j
+        WHERE j.type = 'text' AND j.value != ''
+    """)
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "sqlite":
+        op.execute("DROP TRIGGER IF EXISTS tasting_note_grapes_delete")
+        op.execute("DROP TRIGGER IF EXISTS tasting_note_grapes_update")
+        op.execute("DROP TRIGGER IF EXISTS tasting_note_grapes_insert")
+    op.drop_index("ix_tasting_note_grapes_grape", table_name="tasting_note_grapes")
+    op.drop_table("tasting_note_grapes")
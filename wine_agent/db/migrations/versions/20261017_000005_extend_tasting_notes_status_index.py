@@ -0,0 +1,49 @@
+"""Extend the tasting_notes status index with id for keyset pagination.
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2026-10-17
+
+This migration:
+- Replaces ix_tasting_notes_status_updated_at with
+  ix_tasting_notes_status_updated_at_id (status, updated_at, id), so search
+  can seek past a (updated_at, id) cursor instead of skipping OFFSET rows
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0010"
+down_revision: Union[str, None] = "0009"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_tasting_notes_status_updated_at_id",
+        "tasting_notes",
+        ["status", "updated_at", "id"],
+        if_not_exists=True,
+    )
+    op.drop_index(
+        "ix_tasting_notes_status_updated_at",
+        table_name="tasting_notes",
+        if_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.create_index(
+        "ix_tasting_notes_status_updated_at",
+        "tasting_notes",
+        ["status", "updated_at"],
+        if_not_exists=True,
+    )
+    op.drop_index(
+        "ix_tasting_notes_status_updated_at_id",
+        table_name="tasting_notes",
+        if_exists=True,
+    )
@@ -4,7 +4,18 @@ from datetime import UTC, datetime
 from typing import Any
 from uuid import uuid4
 
-from sqlalchemy import Boolean, DateTime, Float, Integer, String, Text
+from sqlalchemy import (
+    DDL,
+    Boolean,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    event,
+)
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
 
@@ -55,6 +66,13 @@ class TastingNoteDB(Base):
     """
 
     __tablename__ = "tasting_notes"
+    __table_args__ = (
+        # Serves the status filter and the (updated_at, id) keyset ordering
+        # used by search
+        Index(
+            "ix_tasting_notes_status_updated_at_id", "status", "updated_at", "id"
+        ),
+    )
 
     # Primary key
     id: Mapped[str] = mapped_column(String(36), primary_key=True, default=_generate_uuid)
@@ -96,6 +114,79 @@ class TastingNoteDB(Base):
         return f"<TastingNoteDB(id={self.id}, producer='{self.producer}', vintage={self.vintage})>"
 
 
+class TastingNoteGrapeDB(Base):
+    """
+    Database model for the denormalized grape lookup of tasting notes.
+
+    One row per (note, grape) pair, kept in sync with tasting_notes.grapes_json
+    by SQLite triggers so filter options can be read with an indexed DISTINCT.
+    """
+
+    __tablename__ = "tasting_note_grapes"
+
+    note_id: Mapped[str] = mapped_column(
+        String(36), ForeignKey("tasting_notes.id"), primary_key=True
+    )
+    grape: Mapped[str] = mapped_column(String(100), primary_key=True, index=True)
+
+    def __repr__(self) -> str:
+        return f"<TastingNoteGrapeDB(note_id={self.note_id}, grape='{self.grape}')>"
+
+
+# Explode a note's grapes_json into the lookup table; malformed JSON yields no rows
+_INSERT_NOTE_GRAPES = """
+    INSERT OR IGNORE INTO tasting_note_grapes(note_id, grape)
+    SELECT NEW.id, value
+    FROM json_each(
+        CASE WHEN json_valid(NEW.grapes_json) THEN NEW.grapes_json ELSE '[]' END
+    )
+    WHERE type = 'text' AND value != '';
+"""
+
+# Fill the lookup table from notes that already exist when it is created
+_NOTE_GRAPES_BACKFILL = """
+    INSERT OR IGNORE INTO tasting_note_grapes(note_id, grape)
+    SELECT tn.id, j.value
+    FROM tasting_notes tn,
+         json_each(
+             CASE WHEN json_valid(tn.grapes_json) THEN tn.grapes_json ELSE '[]' END
+         ) j
+    WHERE j.type = 'text' AND j.value != ''
+"""
+
+for _ddl in (
+    f"""
+    CREATE TRIGGER IF NOT EXISTS tasting_note_grapes_insert
+    AFTER INSERT ON tasting_notes
+    BEGIN
+        {_INSERT_NOTE_GRAPES}
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS tasting_note_grapes_update
+    AFTER UPDATE OF grapes_json ON tasting_notes
+    BEGIN
+        DELETE FROM tasting_note_grapes WHERE note_id = OLD.id;
+        {_INSERT_NOTE_GRAPES}
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS tasting_note_grapes_delete
+    AFTER DELETE ON tasting_notes
+    BEGIN
+        DELETE FROM tasting_note_grapes WHERE note_id = OLD.id;
+    END
+    """,
+    # create_all on an existing database adds the table after notes exist
+    _NOTE_GRAPES_BACKFILL,
+):
+    event.listen(
+        TastingNoteGrapeDB.__table__,
+        "after_create",
+        DDL(_ddl).execute_if(dialect="sqlite"),
+    )
+
+
 class AIConversionRunDB(Base):
     """
     Database model for AI conversion runs.
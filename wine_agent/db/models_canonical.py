@@ -9,10 +9,26 @@ These models define the database tables for the canonical wine catalog:
 """
 
 from datetime import UTC, datetime
+from typing import Any
 from uuid import uuid4
 
-from sqlalchemy import Boolean, DateTime, Float, ForeignKey, Integer, String, Text
+import orjson
+from sqlalchemy import (
+    Boolean,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    event,
+    text,
+)
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.engine import Connection, Dialect
 from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.types import TypeDecorator, TypeEngine
 
 from wine_agent.db.models import Base
 
@@ -27,6 +43,90 @@ def _generate_uuid() -> str:
     return str(uuid4())
 
 
+class OrjsonList(TypeDecorator[list[Any]]):
+    """
+    JSON array column: native JSONB on PostgreSQL, orjson-encoded Text elsewhere.
+
+    Repositories assign and read plain lists. An ORM flush only writes
+    attributes whose value changed, so it does not re-encode an unchanged
+    list; the repositories' Core UPDATEs write (and encode) every column. On
+    PostgreSQL the driver hands back decoded values, so no Python-side JSON
+    step runs on reads.
+    """
+
+    impl = Text
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect: Dialect) -> TypeEngine[Any]:
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(JSONB())
+        return dialect.type_descriptor(Text())
+
+    def process_bind_param(self, value: list[Any] | None, dialect: Dialect) -> Any:
+        if value is None:
+            value = []
+        if dialect.name == "postgresql":
+            return value
+        return orjson.dumps(value).decode()
+
+    def process_result_value(self, value: Any, dialect: Dialect) -> list[Any]:
+        if not value:
+            return []
+        return value if isinstance(value, list) else orjson.loads(value)
+
+
+class OrjsonDict(TypeDecorator[dict[str, Any]]):
+    """JSON object column: native JSONB on PostgreSQL, orjson-encoded Text elsewhere."""
+
+    impl = Text
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect: Dialect) -> TypeEngine[Any]:
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(JSONB())
+        return dialect.type_descriptor(Text())
+
+    def process_bind_param(self, value: dict[str, Any] | None, dialect: Dialect) -> Any:
+        if value is None:
+            value = {}
+        if dialect.name == "postgresql":
+            return value
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    def process_result_value(self, value: Any, dialect: Dialect) -> dict[str, Any]:
+        if not value:
+            return {}
+        return value if isinstance(value, dict) else orjson.loads(value)
+
+
+def _name_search_indexes(table: str, column: str) -> tuple[Index, Index]:
+    """
+    Build the case-insensitive name search indexes for a table's name column.
+
+    SQLite gets a NOCASE index, so prefix LIKE searches are index range scans;
+    PostgreSQL gets a pg_trgm GIN index for substring ILIKE searches. Each is
+    only created on its own dialect, as in the migration that added them.
+    """
+    return (
+        Index(
+            f"ix_{table}_{column}_nocase", text(f"{column} COLLATE NOCASE")
+        ).ddl_if(dialect="sqlite"),
+        Index(
+            f"ix_{table}_{column}_trgm",
+            column,
+            postgresql_using="gin",
+            postgresql_ops={column: "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+    )
+
+
+@event.listens_for(Base.metadata, "before_create")
+def _create_pg_trgm(target: Any, connection: Connection, **kw: Any) -> None:
+    """Enable pg_trgm before create_all builds the trigram name indexes."""
+    if connection.dialect.name == "postgresql":
+        connection.exec_driver_sql("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+
 # ============================================================================
 # Core Wine Entities
 # ============================================================================
@@ -40,10 +140,11 @@ class ProducerDB(Base):
     """
 
     __tablename__ = "producers"
+    __table_args__ = _name_search_indexes("producers", "canonical_name")
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True, default=_generate_uuid)
     canonical_name: Mapped[str] = mapped_column(String(255), nullable=False, index=True)
-    aliases_json: Mapped[str] = mapped_column(Text, default="[]")  # JSON array
+    aliases_json: Mapped[list[str]] = mapped_column(OrjsonList, default=list)
     country: Mapped[str] = mapped_column(String(100), default="", index=True)
     region: Mapped[str] = mapped_column(String(100), default="", index=True)
     website: Mapped[str] = mapped_column(String(500), default="")
@@ -66,16 +167,17 @@ class WineDB(Base):
     """
 
     __tablename__ = "wines"
+    __table_args__ = _name_search_indexes("wines", "canonical_name")
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True, default=_generate_uuid)
     producer_id: Mapped[str] = mapped_column(
         String(36), ForeignKey("producers.id"), nullable=False, index=True
     )
     canonical_name: Mapped[str] = mapped_column(String(255), nullable=False, index=True)
-    aliases_json: Mapped[str] = mapped_column(Text, default="[]")  # JSON array
+    aliases_json: Mapped[list[str]] = mapped_column(OrjsonList, default=list)
     color: Mapped[str | None] = mapped_column(String(20), nullable=True)
     style: Mapped[str | None] = mapped_column(String(20), nullable=True)
-    grapes_json: Mapped[str] = mapped_column(Text, default="[]")  # JSON array
+    grapes_json: Mapped[list[str]] = mapped_column(OrjsonList, default=list)
     appellation: Mapped[str] = mapped_column(String(255), default="", index=True)
     region_id: Mapped[str | None] = mapped_column(
         String(36), ForeignKey("regions.id"), nullable=True, index=True
@@ -108,7 +210,7 @@ class VintageDB(Base):
     year: Mapped[int] = mapped_column(Integer, nullable=False, index=True)
     bottle_size_ml: Mapped[int] = mapped_column(Integer, default=750)
     abv: Mapped[float | None] = mapped_column(Float, nullable=True)
-    tech_sheet_attrs_json: Mapped[str] = mapped_column(Text, default="{}")  # JSON object
+    tech_sheet_attrs_json: Mapped[dict[str, Any]] = mapped_column(OrjsonDict, default=dict)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=_utc_now)
     updated_at: Mapped[datetime] = mapped_column(DateTime, default=_utc_now, onupdate=_utc_now)
 
@@ -132,13 +234,14 @@ class RegionDB(Base):
     """
 
     __tablename__ = "regions"
+    __table_args__ = _name_search_indexes("regions", "name")
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True, default=_generate_uuid)
     parent_id: Mapped[str | None] = mapped_column(
         String(36), ForeignKey("regions.id"), nullable=True, index=True
     )
     name: Mapped[str] = mapped_column(String(255), nullable=False, index=True)
-    aliases_json: Mapped[str] = mapped_column(Text, default="[]")  # JSON array
+    aliases_json: Mapped[list[str]] = mapped_column(OrjsonList, default=list)
     country: Mapped[str] = mapped_column(String(100), default="", index=True)
     wikidata_id: Mapped[str | None] = mapped_column(String(20), nullable=True, index=True)
     hierarchy_level: Mapped[str] = mapped_column(String(20), default="region")
@@ -164,10 +267,11 @@ class GrapeVarietyDB(Base):
     """
 
     __tablename__ = "grape_varieties"
+    __table_args__ = _name_search_indexes("grape_varieties", "canonical_name")
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True, default=_generate_uuid)
     canonical_name: Mapped[str] = mapped_column(String(255), nullable=False, index=True)
-    aliases_json: Mapped[str] = mapped_column(Text, default="[]")  # JSON array
+    aliases_json: Mapped[list[str]] = mapped_column(OrjsonList, default=list)
     wikidata_id: Mapped[str | None] = mapped_column(String(20), nullable=True, index=True)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=_utc_now)
     updated_at: Mapped[datetime] = mapped_column(DateTime, default=_utc_now, onupdate=_utc_now)
@@ -189,6 +293,7 @@ class ImporterDB(Base):
     """
 
     __tablename__ = "importers"
+    __table_args__ = _name_search_indexes("importers", "canonical_name")
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True, default=_generate_uuid)
     canonical_name: Mapped[str] = mapped_column(String(255), nullable=False, index=True)
@@ -209,12 +314,13 @@ class DistributorDB(Base):
     """
 
     __tablename__ = "distributors"
+    __table_args__ = _name_search_indexes("distributors", "canonical_name")
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True, default=_generate_uuid)
     canonical_name: Mapped[str] = mapped_column(String(255), nullable=False, index=True)
     country: Mapped[str] = mapped_column(String(100), default="", index=True)
     website: Mapped[str] = mapped_column(String(500), default="")
-    regions_served_json: Mapped[str] = mapped_column(Text, default="[]")  # JSON array
+    regions_served_json: Mapped[list[str]] = mapped_column(OrjsonList, default=list)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=_utc_now)
     updated_at: Mapped[datetime] = mapped_column(DateTime, default=_utc_now, onupdate=_utc_now)
 
@@ -1,10 +1,11 @@
 """Repository classes for database operations."""
 
-import json
 from datetime import UTC, datetime
+from typing import Any, cast
 from uuid import UUID
 
-from sqlalchemy import select
+import orjson
+from sqlalchemy import CursorResult, select, update
 from sqlalchemy.orm import Session
 
 from wine_agent.core.entitlements import AppConfiguration, SubscriptionTier
@@ -22,6 +23,7 @@ from wine_agent.db.models import (
     RevisionDB,
     TastingNoteDB,
 )
+from wine_agent.db.search import invalidate_filter_options
 
 
 def _utc_now() -> datetime:
@@ -29,6 +31,65 @@ def _utc_now() -> datetime:
     return datetime.now(UTC)
 
 
+def _dumps(obj: Any) -> str:
+    """Serialize a value to a JSON string for a Text column."""
+    return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+_loads = orjson.loads
+
+
+# Maps dotted TastingNote field paths to the tasting_notes columns that
+# denormalize them. Used by TastingNoteRepository.update to write only the
+# columns whose domain fields actually changed.
+DOMAIN_TO_DB_COL: dict[str, str] = {
+    "status": "status",
+    "source": "source",
+    "wine.producer": "producer",
+    "wine.cuvee": "cuvee",
+    "wine.vintage": "vintage",
+    "wine.country": "country",
+    "wine.region": "region",
+    "wine.grapes": "grapes_json",
+    "wine.color": "color",
+    "scores.total": "score_total",
+    "scores.quality_band": "quality_band",
+    "tags": "tags_json",
+}
+
+
+def _note_column_values(note: TastingNote) -> dict[str, Any]:
+    """Build the denormalized tasting_notes column values for a note."""
+    return {
+        "status": note.status.value,
+        "source": note.source.value,
+        "producer": note.wine.producer,
+        "cuvee": note.wine.cuvee,
+        "vintage": note.wine.vintage,
+        "country": note.wine.country,
+        "region": note.wine.region,
+        "grapes_json": _dumps(note.wine.grapes),
+        "color": note.wine.color.value if note.wine.color else None,
+        "score_total": note.scores.total,
+        "quality_band": note.scores.quality_band.value if note.scores.quality_band else None,
+        "tags_json": _dumps(note.tags),
+    }
+
+
+def _changed_columns(changed_fields: set[str]) -> set[str]:
+    """
+    Resolve changed domain field paths to tasting_notes column names.
+
+    A changed path selects every column whose domain path equals it or is
+    nested beneath it, so "wine" selects all wine identity columns.
+    """
+    return {
+        column
+        for path, column in DOMAIN_TO_DB_COL.items()
+        if any(path == changed or path.startswith(f"{changed}.") for changed in changed_fields)
+    }
+
+
 class InboxRepository:
     """Repository for InboxItem CRUD operations."""
 
@@ -52,7 +113,7 @@ class InboxRepository:
             updated_at=item.updated_at,
             converted=item.converted,
             conversion_run_id=str(item.conversion_run_id) if item.conversion_run_id else None,
-            tags_json=json.dumps(item.tags),
+            tags_json=_dumps(item.tags),
         )
         self.session.add(db_item)
         self.session.flush()
@@ -68,8 +129,7 @@ class InboxRepository:
         Returns:
             The InboxItem if found, None otherwise.
         """
-        stmt = select(InboxItemDB).where(InboxItemDB.id == str(item_id))
-        db_item = self.session.execute(stmt).scalar_one_or_none()
+        db_item = self.session.get(InboxItemDB, str(item_id))
         return self._to_domain(db_item) if db_item else None
 
     def list_all(self, include_converted: bool = True) -> list[InboxItem]:
@@ -98,8 +158,7 @@ class InboxRepository:
         Returns:
             The updated InboxItem.
         """
-        stmt = select(InboxItemDB).where(InboxItemDB.id == str(item.id))
-        db_item = self.session.execute(stmt).scalar_one_or_none()
+        db_item = self.session.get(InboxItemDB, str(item.id))
         if db_item is None:
             raise ValueError(f"InboxItem with id {item.id} not found")
 
@@ -107,7 +166,7 @@ class InboxRepository:
         db_item.updated_at = _utc_now()
         db_item.converted = item.converted
         db_item.conversion_run_id = str(item.conversion_run_id) if item.conversion_run_id else None
-        db_item.tags_json = json.dumps(item.tags)
+        db_item.tags_json = _dumps(item.tags)
 
         self.session.flush()
         return self._to_domain(db_item)
@@ -122,8 +181,7 @@ class InboxRepository:
         Returns:
             True if deleted, False if not found.
         """
-        stmt = select(InboxItemDB).where(InboxItemDB.id == str(item_id))
-        db_item = self.session.execute(stmt).scalar_one_or_none()
+        db_item = self.session.get(InboxItemDB, str(item_id))
         if db_item is None:
             return False
         self.session.delete(db_item)
@@ -141,8 +199,7 @@ class InboxRepository:
         Returns:
             The updated InboxItem, or None if not found.
         """
-        stmt = select(InboxItemDB).where(InboxItemDB.id == str(item_id))
-        db_item = self.session.execute(stmt).scalar_one_or_none()
+        db_item = self.session.get(InboxItemDB, str(item_id))
         if db_item is None:
             return None
 
@@ -154,14 +211,16 @@ class InboxRepository:
 
     def _to_domain(self, db_item: InboxItemDB) -> InboxItem:
         """Convert DB model to domain model."""
-        return InboxItem(
-            id=UUID(db_item.id),
-            raw_text=db_item.raw_text,
-            created_at=db_item.created_at,
-            updated_at=db_item.updated_at,
-            converted=db_item.converted,
-            conversion_run_id=UUID(db_item.conversion_run_id) if db_item.conversion_run_id else None,
-            tags=json.loads(db_item.tags_json),
+        return InboxItem.model_validate(
+            {
+                "id": db_item.id,
+                "raw_text": db_item.raw_text,
+                "created_at": db_item.created_at,
+                "updated_at": db_item.updated_at,
+                "converted": db_item.converted,
+                "conversion_run_id": db_item.conversion_run_id or None,
+                "tags": _loads(db_item.tags_json),
+            }
         )
 
 
@@ -186,21 +245,10 @@ class TastingNoteRepository:
             id=str(note.id),
             created_at=note.created_at,
             updated_at=note.updated_at,
-            status=note.status.value,
-            source=note.source.value,
             template_version=note.template_version,
             inbox_item_id=str(note.inbox_item_id) if note.inbox_item_id else None,
-            producer=note.wine.producer,
-            cuvee=note.wine.cuvee,
-            vintage=note.wine.vintage,
-            country=note.wine.country,
-            region=note.wine.region,
-            grapes_json=json.dumps(note.wine.grapes),
-            color=note.wine.color.value if note.wine.color else None,
-            score_total=note.scores.total,
-            quality_band=note.scores.quality_band.value if note.scores.quality_band else None,
-            tags_json=json.dumps(note.tags),
-            note_json=json.dumps(note_dict),
+            note_json=_dumps(note_dict),
+            **_note_column_values(note),
         )
         self.session.add(db_note)
         self.session.flush()
@@ -216,8 +264,7 @@ class TastingNoteRepository:
         Returns:
             The TastingNote if found, None otherwise.
         """
-        stmt = select(TastingNoteDB).where(TastingNoteDB.id == str(note_id))
-        db_note = self.session.execute(stmt).scalar_one_or_none()
+        db_note = self.session.get(TastingNoteDB, str(note_id))
         return self._to_domain(db_note) if db_note else None
 
     def get_by_inbox_item_id(self, inbox_item_id: UUID | str) -> TastingNote | None:
@@ -250,40 +297,40 @@ class TastingNoteRepository:
         result = self.session.execute(stmt).scalars().all()
         return [self._to_domain(note) for note in result]
 
-    def update(self, note: TastingNote) -> TastingNote:
+    def update(self, note: TastingNote, changed_fields: set[str] | None = None) -> TastingNote:
         """
         Update an existing tasting note.
 
+        Only the denormalized columns backing ``changed_fields`` are written,
+        so unchanged indexed columns are left untouched. The full note payload
+        is always rewritten since it is the source of truth for reads.
+
         Args:
             note: The TastingNote with updated values.
+            changed_fields: Dotted domain field paths that changed (e.g.
+                "status", "wine.producer", or "wine" for the whole section).
+                If None, all columns are written.
 
         Returns:
             The updated TastingNote.
         """
-        stmt = select(TastingNoteDB).where(TastingNoteDB.id == str(note.id))
-        db_note = self.session.execute(stmt).scalar_one_or_none()
-        if db_note is None:
-            raise ValueError(f"TastingNote with id {note.id} not found")
+        values = _note_column_values(note)
+        if changed_fields is not None:
+            columns = _changed_columns(changed_fields)
+            values = {column: value for column, value in values.items() if column in columns}
 
         note_dict = note.model_dump(mode="json")
+        values["note_json"] = _dumps(note_dict)
+        values["updated_at"] = _utc_now()
 
-        db_note.updated_at = _utc_now()
-        db_note.status = note.status.value
-        db_note.source = note.source.value
-        db_note.producer = note.wine.producer
-        db_note.cuvee = note.wine.cuvee
-        db_note.vintage = note.wine.vintage
-        db_note.country = note.wine.country
-        db_note.region = note.wine.region
-        db_note.grapes_json = json.dumps(note.wine.grapes)
-        db_note.color = note.wine.color.value if note.wine.color else None
-        db_note.score_total = note.scores.total
-        db_note.quality_band = note.scores.quality_band.value if note.scores.quality_band else None
-        db_note.tags_json = json.dumps(note.tags)
-        db_note.note_json = json.dumps(note_dict)
+        stmt = update(TastingNoteDB).where(TastingNoteDB.id == str(note.id)).values(**values)
+        result = cast(CursorResult[Any], self.session.execute(stmt))
+        if result.rowcount == 0:
+            raise ValueError(f"TastingNote with id {note.id} not found")
+        invalidate_filter_options(self.session)
 
         self.session.flush()
-        return self._to_domain(db_note)
+        return TastingNote.model_validate(note_dict)
 
     def delete(self, note_id: UUID | str) -> bool:
         """
@@ -295,8 +342,7 @@ class TastingNoteRepository:
         Returns:
             True if deleted, False if not found.
         """
-        stmt = select(TastingNoteDB).where(TastingNoteDB.id == str(note_id))
-        db_note = self.session.execute(stmt).scalar_one_or_none()
+        db_note = self.session.get(TastingNoteDB, str(note_id))
         if db_note is None:
             return False
         self.session.delete(db_note)
@@ -305,8 +351,7 @@ class TastingNoteRepository:
 
     def _to_domain(self, db_note: TastingNoteDB) -> TastingNote:
         """Convert DB model to domain model."""
-        note_data = json.loads(db_note.note_json)
-        return TastingNote.model_validate(note_data)
+        return TastingNote.model_validate_json(db_note.note_json)
 
 
 class AIConversionRepository:
@@ -335,7 +380,7 @@ class AIConversionRepository:
             input_hash=run.input_hash,
             raw_input=run.raw_input,
             raw_response=run.raw_response,
-            parsed_json=json.dumps(run.parsed_json) if run.parsed_json else None,
+            parsed_json=_dumps(run.parsed_json) if run.parsed_json else None,
             success=run.success,
             error_message=run.error_message,
             repair_attempts=run.repair_attempts,
@@ -355,8 +400,7 @@ class AIConversionRepository:
         Returns:
             The AIConversionRun if found, None otherwise.
         """
-        stmt = select(AIConversionRunDB).where(AIConversionRunDB.id == str(run_id))
-        db_run = self.session.execute(stmt).scalar_one_or_none()
+        db_run = self.session.get(AIConversionRunDB, str(run_id))
         return self._to_domain(db_run) if db_run else None
 
     def get_by_inbox_item_id(self, inbox_item_id: UUID | str) -> list[AIConversionRun]:
@@ -387,15 +431,14 @@ class AIConversionRepository:
         Returns:
             The updated AIConversionRun.
         """
-        stmt = select(AIConversionRunDB).where(AIConversionRunDB.id == str(run.id))
-        db_run = self.session.execute(stmt).scalar_one_or_none()
+        db_run = self.session.get(AIConversionRunDB, str(run.id))
         if db_run is None:
             raise ValueError(f"AIConversionRun with id {run.id} not found")
 
         db_run.success = run.success
         db_run.error_message = run.error_message
         db_run.repair_attempts = run.repair_attempts
-        db_run.parsed_json = json.dumps(run.parsed_json) if run.parsed_json else None
+        db_run.parsed_json = _dumps(run.parsed_json) if run.parsed_json else None
         db_run.resulting_note_id = str(run.resulting_note_id) if run.resulting_note_id else None
 
         self.session.flush()
@@ -403,21 +446,25 @@ class AIConversionRepository:
 
     def _to_domain(self, db_run: AIConversionRunDB) -> AIConversionRun:
         """Convert DB model to domain model."""
-        return AIConversionRun(
-            id=UUID(db_run.id),
-            inbox_item_id=UUID(db_run.inbox_item_id),
-            created_at=db_run.created_at,
-            provider=db_run.provider,
-            model=db_run.model,
-            prompt_version=db_run.prompt_version,
-            input_hash=db_run.input_hash,
-            raw_input=db_run.raw_input,
-            raw_response=db_run.raw_response,
-            parsed_json=json.loads(db_run.parsed_json) if db_run.parsed_json else None,
-            success=db_run.success,
-            error_message=db_run.error_message,
-            repair_attempts=db_run.repair_attempts,
-            resulting_note_id=UUID(db_run.resulting_note_id) if db_run.resulting_note_id else None,
+        return AIConversionRun.model_validate(
+            {
+                "id": db_run.id,
+                "inbox_item_id": db_run.inbox_item_id,
+                "created_at": db_run.created_at,
+                "provider": db_run.provider,
+                "model": db_run.model,
+                "prompt_version": db_run.prompt_version,
+                "input_hash": db_run.input_hash,
+                "raw_input": db_run.raw_input,
+                "raw_response": db_run.raw_response,
+                "parsed_json": (
+                    _loads(db_run.parsed_json) if db_run.parsed_json else None
+                ),
+                "success": db_run.success,
+                "error_message": db_run.error_message,
+                "repair_attempts": db_run.repair_attempts,
+                "resulting_note_id": db_run.resulting_note_id or None,
+            }
         )
 
 
@@ -442,9 +489,9 @@ class RevisionRepository:
             tasting_note_id=str(revision.tasting_note_id),
             revision_number=revision.revision_number,
             created_at=revision.created_at,
-            changed_fields_json=json.dumps(revision.changed_fields),
-            previous_snapshot=json.dumps(revision.previous_snapshot),
-            new_snapshot=json.dumps(revision.new_snapshot),
+            changed_fields_json=_dumps(revision.changed_fields),
+            previous_snapshot=_dumps(revision.previous_snapshot),
+            new_snapshot=_dumps(revision.new_snapshot),
             change_reason=revision.change_reason,
         )
         self.session.add(db_revision)
@@ -461,8 +508,7 @@ class RevisionRepository:
         Returns:
             The Revision if found, None otherwise.
         """
-        stmt = select(RevisionDB).where(RevisionDB.id == str(revision_id))
-        db_revision = self.session.execute(stmt).scalar_one_or_none()
+        db_revision = self.session.get(RevisionDB, str(revision_id))
         return self._to_domain(db_revision) if db_revision else None
 
     def get_by_note_id(self, tasting_note_id: UUID | str) -> list[Revision]:
@@ -504,15 +550,17 @@ class RevisionRepository:
 
     def _to_domain(self, db_revision: RevisionDB) -> Revision:
         """Convert DB model to domain model."""
-        return Revision(
-            id=UUID(db_revision.id),
-            tasting_note_id=UUID(db_revision.tasting_note_id),
-            revision_number=db_revision.revision_number,
-            created_at=db_revision.created_at,
-            changed_fields=json.loads(db_revision.changed_fields_json),
-            previous_snapshot=json.loads(db_revision.previous_snapshot),
-            new_snapshot=json.loads(db_revision.new_snapshot),
-            change_reason=db_revision.change_reason,
+        return Revision.model_validate(
+            {
+                "id": db_revision.id,
+                "tasting_note_id": db_revision.tasting_note_id,
+                "revision_number": db_revision.revision_number,
+                "created_at": db_revision.created_at,
+                "changed_fields": _loads(db_revision.changed_fields_json),
+                "previous_snapshot": _loads(db_revision.previous_snapshot),
+                "new_snapshot": _loads(db_revision.new_snapshot),
+                "change_reason": db_revision.change_reason,
+            }
         )
 
 
@@ -533,8 +581,7 @@ class AppConfigRepository:
         Returns:
             AppConfiguration if exists, None otherwise.
         """
-        stmt = select(AppConfigurationDB).where(AppConfigurationDB.id == 1)
-        db_config = self.session.execute(stmt).scalar_one_or_none()
+        db_config = self.session.get(AppConfigurationDB, 1)
         return self._to_domain(db_config) if db_config else None
 
     def get_or_create(self) -> AppConfiguration:
@@ -578,8 +625,7 @@ class AppConfigRepository:
         Returns:
             The updated AppConfiguration.
         """
-        stmt = select(AppConfigurationDB).where(AppConfigurationDB.id == 1)
-        db_config = self.session.execute(stmt).scalar_one_or_none()
+        db_config = self.session.get(AppConfigurationDB, 1)
 
         if db_config is None:
             # Create if not exists
@@ -616,8 +662,7 @@ class AppConfigRepository:
         Returns:
             The updated AppConfiguration.
         """
-        stmt = select(AppConfigurationDB).where(AppConfigurationDB.id == 1)
-        db_config = self.session.execute(stmt).scalar_one_or_none()
+        db_config = self.session.get(AppConfigurationDB, 1)
 
         if db_config is None:
             raise ValueError("App configuration not found")
@@ -671,7 +716,7 @@ class MigrationLogRepository:
             migration_name=migration_name,
             started_at=_utc_now(),
             status="pending",
-            details_json=json.dumps(details or {}),
+            details_json=_dumps(details or {}),
         )
         self.session.add(db_log)
         self.session.flush()
@@ -685,15 +730,14 @@ class MigrationLogRepository:
             log_id: The migration log ID.
             details: Optional updated details.
         """
-        stmt = select(MigrationLogDB).where(MigrationLogDB.id == log_id)
-        db_log = self.session.execute(stmt).scalar_one_or_none()
+        db_log = self.session.get(MigrationLogDB, log_id)
         if db_log is None:
             raise ValueError(f"Migration log {log_id} not found")
 
         db_log.status = "success"
         db_log.completed_at = _utc_now()
         if details:
-            db_log.details_json = json.dumps(details)
+            db_log.details_json = _dumps(details)
         self.session.flush()
 
     def mark_failed(self, log_id: str, error_message: str) -> None:
@@ -704,8 +748,7 @@ class MigrationLogRepository:
             log_id: The migration log ID.
             error_message: The error message.
         """
-        stmt = select(MigrationLogDB).where(MigrationLogDB.id == log_id)
-        db_log = self.session.execute(stmt).scalar_one_or_none()
+        db_log = self.session.get(MigrationLogDB, log_id)
         if db_log is None:
             raise ValueError(f"Migration log {log_id} not found")
 
@@ -737,7 +780,7 @@ class MigrationLogRepository:
                 "started_at": r.started_at,
                 "completed_at": r.completed_at,
                 "status": r.status,
-                "details": json.loads(r.details_json),
+                "details": _loads(r.details_json),
                 "error_message": r.error_message,
             }
             for r in results
@@ -1,25 +1,70 @@
-"""Repository classes for canonical entity database operations."""
-
-import json
+"""
+Repository classes for canonical entity database operations.
+
+ORM list queries go through _guard_lazy_loads, which attaches raiseload("*")
+when WINE_AGENT_RAISE_ON_LAZY_LOAD is set (as it is under the test suite).
+Code that reads a relationship attribute from their results must load it
+with an explicit loader option such as selectinload.
+"""
+
+import os
+import time
+import weakref
+from collections.abc import Callable, Iterator
 from datetime import UTC, datetime
+from typing import Any, TypeVar
+from typing import cast as typing_cast
 from uuid import UUID
 
-from sqlalchemy import func, select
-from sqlalchemy.orm import Session
+import orjson
+from pydantic import BaseModel
+from sqlalchemy import (
+    ColumnElement,
+    CursorResult,
+    Row,
+    Select,
+    Text,
+    bindparam,
+    cast,
+    delete,
+    event,
+    func,
+    insert,
+    select,
+    text,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import (
+    DeclarativeBase,
+    Session,
+    SessionTransaction,
+    contains_eager,
+    raiseload,
+    selectinload,
+)
 
+from wine_agent.core.enums import WineColor, WineStyle
 from wine_agent.core.schema_canonical import (
     Distributor,
+    EntityType,
     FieldProvenance,
     GrapeVariety,
     Importer,
     Listing,
     ListingMatch,
+    MatchDecision,
     Producer,
+    ProducerAggregate,
     Region,
+    RegionHierarchyLevel,
     Snapshot,
+    SnapshotStatus,
     Source,
     Vintage,
     Wine,
+    WineWithVintages,
 )
 from wine_agent.db.models_canonical import (
     DistributorDB,
@@ -36,17 +81,309 @@ from wine_agent.db.models_canonical import (
     WineDB,
 )
 
+# Mapped classes that the id-based write helpers accept; all have a string id.
+_ModelT = TypeVar(
+    "_ModelT",
+    bound=DistributorDB
+    | FieldProvenanceDB
+    | GrapeVarietyDB
+    | ImporterDB
+    | ListingDB
+    | ListingMatchDB
+    | ProducerDB
+    | RegionDB
+    | SnapshotDB
+    | SourceDB
+    | VintageDB
+    | WineDB,
+)
+
 
 def _utc_now() -> datetime:
     """Return current UTC datetime."""
     return datetime.now(UTC)
 
 
+def _dumps(obj: Any) -> str:
+    """Serialize a value to a JSON string for a Text column."""
+    return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+_loads = orjson.loads
+
+
+def _raise_on_lazy_load() -> bool:
+    """Check whether list queries should forbid lazy relationship loads."""
+    return os.environ.get("WINE_AGENT_RAISE_ON_LAZY_LOAD", "").lower() in ("true", "1", "yes")
+
+
+def _guard_lazy_loads(stmt: Select[Any]) -> Select[Any]:
+    """
+    Attach raiseload("*") to a list query when WINE_AGENT_RAISE_ON_LAZY_LOAD is set.
+
+    Relationships that a query needs must be loaded explicitly (e.g. with
+    selectinload), so an accidental per-row lazy load fails loudly during
+    development instead of silently issuing N+1 queries.
+    """
+    return stmt.options(raiseload("*")) if _raise_on_lazy_load() else stmt
+
+
+# Tables a session has written through the repositories in its current
+# transaction, kept in Session.info. Shared caches skip these tables until the
+# transaction ends, so rows that are not committed yet are never cached.
+_CHANGED_TABLES = "wine_agent.changed_tables"
+
+
+def _mark_changed(session: Session, model: type[DeclarativeBase]) -> None:
+    """Record a repository write to a model's table in the current transaction."""
+    session.info.setdefault(_CHANGED_TABLES, set()).add(model.__tablename__)
+
+
+def _has_changes(session: Session, model: type[DeclarativeBase]) -> bool:
+    """Check whether the session's transaction has written to a model's table."""
+    return model.__tablename__ in session.info.get(_CHANGED_TABLES, ())
+
+
+# Row counts are cached per engine and table for a few seconds so paginators
+# that call count() on every request don't rescan the table each time.
+# Repository writes invalidate the entry when their transaction commits or
+# rolls back; writes made outside the repositories become visible once the
+# TTL expires.
+COUNT_CACHE_TTL_SECONDS = 5.0
+_count_cache: weakref.WeakKeyDictionary[Any, dict[str, tuple[float, int]]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _count_rows(
+    session: Session,
+    model: type[DeclarativeBase],
+    stmt: Select[Any],
+    approximate: bool = False,
+) -> int:
+    """
+    Count rows in a model's table, using the TTL cache when fresh.
+
+    With approximate=True on PostgreSQL, the planner estimate from pg_class
+    is returned in O(1) instead of scanning the table.
+    """
+    bind = session.get_bind()
+    table = model.__tablename__
+    cacheable = not _has_changes(session, model)
+    entries = _count_cache.setdefault(bind, {})
+    cached = entries.get(table)
+    now = time.monotonic()
+    if cacheable and cached is not None and now - cached[0] < COUNT_CACHE_TTL_SECONDS:
+        return cached[1]
+
+    count = -1
+    if approximate and bind.dialect.name == "postgresql":
+        estimate = session.execute(
+            text("SELECT reltuples::bigint FROM pg_class WHERE relname = :table"),
+            {"table": table},
+        ).scalar()
+        # reltuples is -1 until the table has been vacuumed or analyzed
+        count = estimate if estimate is not None else -1
+    if count < 0:
+        count = session.execute(stmt).scalar() or 0
+
+    if cacheable:
+        entries[table] = (now, count)
+    return count
+
+
+# Region and grape variety rows are reference data that rarely change, so
+# point lookups on them are cached per engine for a minute. Repository writes
+# invalidate the table's entries when their transaction commits or rolls
+# back; misses are not cached. Callers receive deep copies, so mutating a
+# returned model never alters the cached one.
+REFERENCE_CACHE_TTL_SECONDS = 60.0
+REFERENCE_CACHE_MAX_ENTRIES = 10000
+_reference_cache: weakref.WeakKeyDictionary[
+    Any, dict[tuple[str, str, str], tuple[float, Any]]
+] = weakref.WeakKeyDictionary()
+
+_T = TypeVar("_T")
+
+
+def _copy_cached(value: _T) -> _T:
+    """Deep-copy a cached domain model or list of domain models."""
+    if isinstance(value, BaseModel):
+        return value.model_copy(deep=True)
+    if isinstance(value, list):
+        return type(value)(item.model_copy(deep=True) for item in value)
+    return value
+
+
+def _cached_reference(
+    session: Session,
+    model: type[DeclarativeBase],
+    lookup: str,
+    key: str,
+    load: Callable[[], _T],
+) -> _T:
+    """Return a cached reference-table lookup, calling load() when missing or stale."""
+    if _has_changes(session, model):
+        return load()
+
+    entries = _reference_cache.setdefault(session.get_bind(), {})
+    cache_key = (model.__tablename__, lookup, key)
+    cached = entries.get(cache_key)
+    now = time.monotonic()
+    if cached is not None and now - cached[0] < REFERENCE_CACHE_TTL_SECONDS:
+        hit: _T = cached[1]
+        return _copy_cached(hit)
+
+    value = load()
+    if value is None:
+        return value
+    if len(entries) >= REFERENCE_CACHE_MAX_ENTRIES:
+        entries.clear()
+    entries[cache_key] = (now, value)
+    return _copy_cached(value)
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _invalidate_changed_tables(
+    session: Session, transaction: SessionTransaction
+) -> None:
+    """Drop shared cache entries for written tables once the transaction ends."""
+    if transaction.parent is not None:
+        return
+    tables = session.info.pop(_CHANGED_TABLES, None)
+    if not tables:
+        return
+    bind = session.get_bind()
+    counts = _count_cache.get(bind)
+    if counts is not None:
+        for table in tables:
+            counts.pop(table, None)
+    entries = _reference_cache.get(bind)
+    if entries is not None:
+        for cache_key in [k for k in entries if k[0] in tables]:
+            del entries[cache_key]
+
+
+def _escape_like(value: str) -> str:
+    """Escape LIKE wildcards so user input only ever matches literally."""
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _name_matches(session: Session, column: Any, name: str) -> Any:
+    """
+    Build a case-insensitive name filter that can use an index.
+
+    On PostgreSQL this is a substring ILIKE served by the pg_trgm GIN index.
+    Elsewhere it is a prefix LIKE: SQLite's LIKE is already case-insensitive
+    for ASCII and, with a constant prefix, is answered as a range scan on the
+    NOCASE index instead of a full table scan.
+    """
+    pattern = _escape_like(name)
+    if session.get_bind().dialect.name == "postgresql":
+        return column.ilike(f"%{pattern}%", escape="\\")
+    return column.like(f"{pattern}%", escape="\\")
+
+
+def _insert_returning(
+    session: Session, model: type[DeclarativeBase], row: dict[str, Any]
+) -> Any:
+    """
+    Insert a single row and return the persisted ORM instance.
+
+    Uses INSERT ... RETURNING where the dialect supports it (SQLite 3.35+,
+    PostgreSQL), so the row is written and materialized in one statement
+    without going through a unit-of-work flush. Falls back to add/flush
+    otherwise.
+    """
+    if session.get_bind().dialect.insert_returning:
+        stmt = insert(model).values(**row).returning(model)
+        return session.execute(stmt).scalar_one()
+    db_item = model(**row)
+    session.add(db_item)
+    session.flush()
+    return db_item
+
+
+def _update_returning(
+    session: Session, model: type[_ModelT], row: dict[str, Any]
+) -> Any | None:
+    """
+    Overwrite the row with primary key row["id"] and return the ORM instance.
+
+    created_at is left untouched. Returns None when no row matched.
+    """
+    values = {k: v for k, v in row.items() if k not in ("id", "created_at")}
+    return _update_by_id(session, model, row["id"], values)
+
+
+def _update_by_id(
+    session: Session,
+    model: type[_ModelT],
+    item_id: UUID | str,
+    values: dict[str, Any],
+) -> Any | None:
+    """
+    Set columns on the row with the given primary key and return the ORM instance.
+
+    Issues a single UPDATE ... WHERE id = ? RETURNING where the dialect
+    supports it, so a missing row is detected without a prior SELECT.
+    Otherwise the UPDATE is followed by a primary-key SELECT. Returns None
+    when no row matched.
+
+    The session is not synchronized by evaluating the WHERE clause against
+    every object in the identity map; instead populate_existing refreshes the
+    one matching instance (if loaded) from the returned row.
+    """
+    stmt = (
+        update(model)
+        .where(model.id == str(item_id))
+        .values(**values)
+        .execution_options(synchronize_session=False)
+    )
+    if session.get_bind().dialect.update_returning:
+        stmt = stmt.returning(model).execution_options(populate_existing=True)
+        return session.execute(stmt).scalar_one_or_none()
+    result = typing_cast(CursorResult[Any], session.execute(stmt))
+    if result.rowcount == 0:
+        return None
+    return session.get(model, str(item_id), populate_existing=True)
+
+
+def _delete_by_id(
+    session: Session, model: type[_ModelT], item_id: UUID | str
+) -> bool:
+    """Delete a row by primary key with a single DELETE; report whether it existed."""
+    result = typing_cast(
+        CursorResult[Any],
+        session.execute(delete(model).where(model.id == str(item_id))),
+    )
+    return result.rowcount > 0
+
+# Frequently used lookups are built once at import time as module-level
+# statements (named _<ENTITY>_BY_<KEY> / _<ENTITY>_COUNT) and executed with
+# bound parameters, so each call skips Select construction entirely.
+#
+# List queries on the catalog entities select the mapped table rather than
+# the ORM class, so rows come back as Core tuples without ORM instance or
+# identity-map bookkeeping. Row exposes columns as attributes, so the same
+# _to_domain converts both Rows and ORM instances.
+#
+# _to_domain methods pass stored UUID strings straight to the domain models'
+# model_validate. Pydantic parses them in its compiled validator, which is
+# markedly cheaper than building uuid.UUID objects in Python first.
+
+
 # ============================================================================
 # Core Wine Entity Repositories
 # ============================================================================
 
 
+_PRODUCER_BY_WIKIDATA_ID = select(ProducerDB).where(
+    ProducerDB.wikidata_id == bindparam("wikidata_id")
+)
+_PRODUCER_COUNT = select(func.count()).select_from(ProducerDB)
+
+
 class ProducerRepository:
     """Repository for Producer CRUD operations."""
 
@@ -55,103 +392,134 @@ class ProducerRepository:
 
     def create(self, producer: Producer) -> Producer:
         """Create a new producer."""
-        db_item = ProducerDB(
-            id=str(producer.id),
-            canonical_name=producer.canonical_name,
-            aliases_json=json.dumps(producer.aliases),
-            country=producer.country,
-            region=producer.region,
-            website=producer.website,
-            wikidata_id=producer.wikidata_id,
-            created_at=producer.created_at,
-            updated_at=producer.updated_at,
-        )
-        self.session.add(db_item)
-        self.session.flush()
+        db_item = _insert_returning(self.session, ProducerDB, self._to_row(producer))
+        _mark_changed(self.session, ProducerDB)
         return self._to_domain(db_item)
 
+    def bulk_create(self, producers: list[Producer]) -> list[Producer]:
+        """Create many producers with a single executemany INSERT."""
+        if producers:
+            rows = [self._to_row(producer) for producer in producers]
+            self.session.execute(insert(ProducerDB), rows)
+            _mark_changed(self.session, ProducerDB)
+        return list(producers)
+
     def get_by_id(self, producer_id: UUID | str) -> Producer | None:
         """Get a producer by ID."""
-        stmt = select(ProducerDB).where(ProducerDB.id == str(producer_id))
-        db_item = self.session.execute(stmt).scalar_one_or_none()
+        db_item = self.session.get(ProducerDB, str(producer_id))
         return self._to_domain(db_item) if db_item else None
 
     def get_by_wikidata_id(self, wikidata_id: str) -> Producer | None:
         """Get a producer by Wikidata ID."""
-        stmt = select(ProducerDB).where(ProducerDB.wikidata_id == wikidata_id)
-        db_item = self.session.execute(stmt).scalar_one_or_none()
+        db_item = self.session.execute(
+            _PRODUCER_BY_WIKIDATA_ID, {"wikidata_id": wikidata_id}
+        ).scalar_one_or_none()
         return self._to_domain(db_item) if db_item else None
 
     def search_by_name(self, name: str, limit: int = 20) -> list[Producer]:
-        """Search producers by name (partial match)."""
+        """Search producers by name (case-insensitive match)."""
         stmt = (
-            select(ProducerDB)
-            .where(ProducerDB.canonical_name.ilike(f"%{name}%"))
+            select(ProducerDB.__table__)
+            .where(_name_matches(self.session, ProducerDB.canonical_name, name))
             .order_by(ProducerDB.canonical_name)
             .limit(limit)
         )
-        result = self.session.execute(stmt).scalars().all()
+        result = self.session.execute(stmt)
         return [self._to_domain(p) for p in result]
 
     def list_all(self, limit: int = 100, offset: int = 0) -> list[Producer]:
         """List all producers with pagination."""
         stmt = (
-            select(ProducerDB)
+            select(ProducerDB.__table__)
             .order_by(ProducerDB.canonical_name)
             .limit(limit)
             .offset(offset)
         )
-        result = self.session.execute(stmt).scalars().all()
+        result = self.session.execute(stmt)
         return [self._to_domain(p) for p in result]
 
-    def count(self) -> int:
-        """Get total count of producers."""
-        stmt = select(func.count()).select_from(ProducerDB)
-        return self.session.execute(stmt).scalar() or 0
+    def iter_all(self, chunk: int = 500) -> Iterator[Producer]:
+        """Iterate over all producers, loading at most chunk rows at a time."""
+        stmt = (
+            select(ProducerDB.__table__)
+            .order_by(ProducerDB.canonical_name)
+            .execution_options(yield_per=chunk)
+        )
+        for p in self.session.execute(stmt):
+            yield self._to_domain(p)
+
+    def count(self, approximate: bool = False) -> int:
+        """Get total count of producers (briefly cached)."""
+        return _count_rows(self.session, ProducerDB, _PRODUCER_COUNT, approximate)
 
     def update(self, producer: Producer) -> Producer:
         """Update an existing producer."""
-        stmt = select(ProducerDB).where(ProducerDB.id == str(producer.id))
-        db_item = self.session.execute(stmt).scalar_one_or_none()
+        row = self._to_row(producer)
+        row["updated_at"] = _utc_now()
+        db_item = _update_returning(self.session, ProducerDB, row)
         if db_item is None:
             raise ValueError(f"Producer with id {producer.id} not found")
-
-        db_item.canonical_name = producer.canonical_name
-        db_item.aliases_json = json.dumps(producer.aliases)
-        db_item.country = producer.country
-        db_item.region = producer.region
-        db_item.website = producer.website
-        db_item.wikidata_id = producer.wikidata_id
-        db_item.updated_at = _utc_now()
-
-        self.session.flush()
         return self._to_domain(db_item)
 
+    def bulk_update(self, producers: list[Producer]) -> list[Producer]:
+        """Update many producers with a single executemany UPDATE by primary key."""
+        now = _utc_now()
+        rows = []
+        for producer in producers:
+            row = self._to_row(producer)
+            del row["created_at"]
+            row["updated_at"] = now
+            rows.append(row)
+        if rows:
+            self.session.execute(update(ProducerDB), rows)
+        return [p.model_copy(update={"updated_at": now}) for p in producers]
+
     def delete(self, producer_id: UUID | str) -> bool:
         """Delete a producer by ID."""
-        stmt = select(ProducerDB).where(ProducerDB.id == str(producer_id))
-        db_item = self.session.execute(stmt).scalar_one_or_none()
-        if db_item is None:
-            return False
-        self.session.delete(db_item)
-        self.session.flush()
-        return True
-
-    def _to_domain(self, db_item: ProducerDB) -> Producer:
+        deleted = _delete_by_id(self.session, ProducerDB, producer_id)
+        if deleted:
+            _mark_changed(self.session, ProducerDB)
+        return deleted
+
+    def _to_row(self, producer: Producer) -> dict[str, Any]:
+        """Convert domain model to DB column values."""
+        return {
+            "id": str(producer.id),
+            "canonical_name": producer.canonical_name,
+            "aliases_json": producer.aliases,
+            "country": producer.country,
+            "region": producer.region,
+            "website": producer.website,
+            "wikidata_id": producer.wikidata_id,
+            "created_at": producer.created_at,
+            "updated_at": producer.updated_at,
+        }
+
+    def _to_domain(self, db_item: ProducerDB | Row[Any]) -> Producer:
         """Convert DB model to domain model."""
-        return Producer(
-            id=UUID(db_item.id),
-            canonical_name=db_item.canonical_name,
-            aliases=json.loads(db_item.aliases_json),
-            country=db_item.country,
-            region=db_item.region,
-            website=db_item.website,
-            wikidata_id=db_item.wikidata_id,
-            created_at=db_item.created_at,
-            updated_at=db_item.updated_at,
+        return Producer.model_validate(
+            {
+                "id": db_item.id,
+                "canonical_name": db_item.canonical_name,
+                "aliases": db_item.aliases_json,
+                "country": db_item.country,
+                "region": db_item.region,
+                "website": db_item.website,
+                "wikidata_id": db_item.wikidata_id,
+                "created_at": db_item.created_at,
+                "updated_at": db_item.updated_at,
+            }
         )
 
 
+_WINES_BY_PRODUCER_ID = (
+    select(WineDB.__table__)
+    .where(WineDB.producer_id == bindparam("producer_id"))
+    .order_by(WineDB.canonical_name)
+)
+_WINE_COUNT = select(func.count()).select_from(WineDB)
+
+
 class WineRepository:
     """Repository for Wine CRUD operations."""
 
@@ -160,104 +528,181 @@ class WineRepository:
 
     def create(self, wine: Wine) -> Wine:
         """Create a new wine."""
-        db_item = WineDB(
-            id=str(wine.id),
-            producer_id=str(wine.producer_id),
-            canonical_name=wine.canonical_name,
-            aliases_json=json.dumps(wine.aliases),
-            color=wine.color.value if wine.color else None,
-            style=wine.style.value if wine.style else None,
-            grapes_json=json.dumps(wine.grapes),
-            appellation=wine.appellation,
-            region_id=str(wine.region_id) if wine.region_id else None,
-            created_at=wine.created_at,
-            updated_at=wine.updated_at,
-        )
-        self.session.add(db_item)
-        self.session.flush()
+        db_item = _insert_returning(self.session, WineDB, self._to_row(wine))
+        _mark_changed(self.session, WineDB)
         return self._to_domain(db_item)
 
+    def bulk_create(self, wines: list[Wine]) -> list[Wine]:
+        """Create many wines with a single executemany INSERT."""
+        if wines:
+            rows = [self._to_row(wine) for wine in wines]
+            self.session.execute(insert(WineDB), rows)
+            _mark_changed(self.session, WineDB)
+        return list(wines)
+
     def get_by_id(self, wine_id: UUID | str) -> Wine | None:
         """Get a wine by ID."""
-        stmt = select(WineDB).where(WineDB.id == str(wine_id))
-        db_item = self.session.execute(stmt).scalar_one_or_none()
+        db_item = self.session.get(WineDB, str(wine_id))
         return self._to_domain(db_item) if db_item else None
 
     def get_by_producer_id(self, producer_id: UUID | str) -> list[Wine]:
         """Get all wines for a producer."""
-        stmt = (
-            select(WineDB)
-            .where(WineDB.producer_id == str(producer_id))
-            .order_by(WineDB.canonical_name)
+        result = self.session.execute(
+            _WINES_BY_PRODUCER_ID, {"producer_id": str(producer_id)}
         )
-        result = self.session.execute(stmt).scalars().all()
         return [self._to_domain(w) for w in result]
 
     def search_by_name(self, name: str, limit: int = 20) -> list[Wine]:
-        """Search wines by name (partial match)."""
+        """Search wines by name (case-insensitive match)."""
         stmt = (
-            select(WineDB)
-            .where(WineDB.canonical_name.ilike(f"%{name}%"))
+            select(WineDB.__table__)
+            .where(_name_matches(self.session, WineDB.canonical_name, name))
             .order_by(WineDB.canonical_name)
             .limit(limit)
         )
-        result = self.session.execute(stmt).scalars().all()
+        result = self.session.execute(stmt)
         return [self._to_domain(w) for w in result]
 
-    def count(self) -> int:
-        """Get total count of wines."""
-        stmt = select(func.count()).select_from(WineDB)
-        return self.session.execute(stmt).scalar() or 0
+    def list_with_related(
+        self, limit: int = 100, offset: int = 0
+    ) -> list[tuple[Wine, Producer, Region | None]]:
+        """
+        List wines together with their producer and region.
+
+        Producers are joined and regions batch-loaded with selectinload, so a
+        page costs two queries regardless of how many wines it holds. Wines
+        whose producer row no longer exists are skipped.
+        """
+        stmt = self._with_related().limit(limit).offset(offset)
+        result = self.session.execute(_guard_lazy_loads(stmt)).scalars().all()
+        producer_repo = ProducerRepository(self.session)
+        region_repo = RegionRepository(self.session)
+        return [
+            (
+                self._to_domain(w),
+                producer_repo._to_domain(w.producer),
+                region_repo._to_domain(w.region) if w.region else None,
+            )
+            for w in result
+        ]
+
+    def iter_with_related(
+        self, chunk: int = 500
+    ) -> Iterator[tuple[Wine, Producer, Region | None, list[Vintage]]]:
+        """
+        Iterate over all wines with their producer, region and vintages.
+
+        Loads at most chunk wines at a time; regions and vintages are
+        batch-loaded per chunk. Vintages are newest first, and wines whose
+        producer row no longer exists are skipped.
+        """
+        stmt = (
+            self._with_related()
+            .options(selectinload(WineDB.vintages))
+            .execution_options(yield_per=chunk)
+        )
+        producer_repo = ProducerRepository(self.session)
+        region_repo = RegionRepository(self.session)
+        vintage_repo = VintageRepository(self.session)
+        for w in self.session.execute(_guard_lazy_loads(stmt)).scalars():
+            vintages = sorted(w.vintages, key=lambda v: v.year, reverse=True)
+            yield (
+                self._to_domain(w),
+                producer_repo._to_domain(w.producer),
+                region_repo._to_domain(w.region) if w.region else None,
+                [vintage_repo._to_domain(v) for v in vintages],
+            )
+
+    @staticmethod
+    def _with_related() -> Select[Any]:
+        """Select wines inner-joined to their producer, with the region loaded."""
+        return (
+            select(WineDB)
+            .join(WineDB.producer)
+            .options(contains_eager(WineDB.producer), selectinload(WineDB.region))
+            .order_by(WineDB.canonical_name, WineDB.id)
+        )
+
+    def count(self, approximate: bool = False) -> int:
+        """Get total count of wines (briefly cached)."""
+        return _count_rows(self.session, WineDB, _WINE_COUNT, approximate)
 
     def update(self, wine: Wine) -> Wine:
         """Update an existing wine."""
-        stmt = select(WineDB).where(WineDB.id == str(wine.id))
-        db_item = self.session.execute(stmt).scalar_one_or_none()
+        row = self._to_row(wine)
+        row["updated_at"] = _utc_now()
+        db_item = _update_returning(self.session, WineDB, row)
         if db_item is None:
             raise ValueError(f"Wine with id {wine.id} not found")
-
-        db_item.producer_id = str(wine.producer_id)
-        db_item.canonical_name = wine.canonical_name
-        db_item.aliases_json = json.dumps(wine.aliases)
-        db_item.color = wine.color.value if wine.color else None
-        db_item.style = wine.style.value if wine.style else None
-        db_item.grapes_json = json.dumps(wine.grapes)
-        db_item.appellation = wine.appellation
-        db_item.region_id = str(wine.region_id) if wine.region_id else None
-        db_item.updated_at = _utc_now()
-
-        self.session.flush()
         return self._to_domain(db_item)
 
+    def bulk_update(self, wines: list[Wine]) -> list[Wine]:
+        """Update many wines with a single executemany UPDATE by primary key."""
+        now = _utc_now()
+        rows = []
+        for wine in wines:
+            row = self._to_row(wine)
+            del row["created_at"]
+            row["updated_at"] = now
+            rows.append(row)
+        if rows:
+            self.session.execute(update(WineDB), rows)
+        return [wine.model_copy(update={"updated_at": now}) for wine in wines]
+
     def delete(self, wine_id: UUID | str) -> bool:
         """Delete a wine by ID."""
-        stmt = select(WineDB).where(WineDB.id == str(wine_id))
-        db_item = self.session.execute(stmt).scalar_one_or_none()
-        if db_item is None:
-            return False
-        self.session.delete(db_item)
-        self.session.flush()
-        return True
-
-    def _to_domain(self, db_item: WineDB) -> Wine:
+        deleted = _delete_by_id(self.session, WineDB, wine_id)
+        if deleted:
+            _mark_changed(self.session, WineDB)
+        return deleted
+
+    def _to_row(self, wine: Wine) -> dict[str, Any]:
+        """Convert domain model to DB column values."""
+        return {
+            "id": str(wine.id),
+            "producer_id": str(wine.producer_id),
+            "canonical_name": wine.canonical_name,
+            "aliases_json": wine.aliases,
+            "color": wine.color.value if wine.color else None,
+            "style": wine.style.value if wine.style else None,
+            "grapes_json": wine.grapes,
+            "appellation": wine.appellation,
+            "region_id": str(wine.region_id) if wine.region_id else None,
+            "created_at": wine.created_at,
+            "updated_at": wine.updated_at,
+        }
+
+    def _to_domain(self, db_item: WineDB | Row[Any]) -> Wine:
         """Convert DB model to domain model."""
-        from wine_agent.core.enums import WineColor, WineStyle
-
-        return Wine(
-            id=UUID(db_item.id),
-            producer_id=UUID(db_item.producer_id),
-            canonical_name=db_item.canonical_name,
-            aliases=json.loads(db_item.aliases_json),
-            color=WineColor(db_item.color) if db_item.color else None,
-            style=WineStyle(db_item.style) if db_item.style else None,
-            grapes=json.loads(db_item.grapes_json),
-            appellation=db_item.appellation,
-            region_id=UUID(db_item.region_id) if db_item.region_id else None,
-            created_at=db_item.created_at,
-            updated_at=db_item.updated_at,
+        return Wine.model_validate(
+            {
+                "id": db_item.id,
+                "producer_id": db_item.producer_id,
+                "canonical_name": db_item.canonical_name,
+                "aliases": db_item.aliases_json,
+                "color": WineColor(db_item.color) if db_item.color else None,
+                "style": WineStyle(db_item.style) if db_item.style else None,
+                "grapes": db_item.grapes_json,
+                "appellation": db_item.appellation,
+                "region_id": db_item.region_id,
+                "created_at": db_item.created_at,
+                "updated_at": db_item.updated_at,
+            }
         )
 
 
+_VINTAGES_BY_WINE_ID = (
+    select(VintageDB.__table__)
+    .where(VintageDB.wine_id == bindparam("wine_id"))
+    .order_by(VintageDB.year.desc())
+)
+_VINTAGE_BY_WINE_AND_YEAR = select(VintageDB).where(
+    VintageDB.wine_id == bindparam("wine_id"),
+    VintageDB.year == bindparam("year"),
+)
+_VINTAGE_COUNT = select(func.count()).select_from(VintageDB)
+
+
 class VintageRepository:
     """Repository for Vintage CRUD operations."""
 
@@ -266,88 +711,154 @@ class VintageRepository:
 
     def create(self, vintage: Vintage) -> Vintage:
         """Create a new vintage."""
-        db_item = VintageDB(
-            id=str(vintage.id),
-            wine_id=str(vintage.wine_id),
-            year=vintage.year,
-            bottle_size_ml=vintage.bottle_size_ml,
-            abv=vintage.abv,
-            tech_sheet_attrs_json=json.dumps(vintage.tech_sheet_attrs),
-            created_at=vintage.created_at,
-            updated_at=vintage.updated_at,
-        )
-        self.session.add(db_item)
-        self.session.flush()
+        db_item = _insert_returning(self.session, VintageDB, self._to_row(vintage))
+        _mark_changed(self.session, VintageDB)
         return self._to_domain(db_item)
 
+    def bulk_create(self, vintages: list[Vintage]) -> list[Vintage]:
+        """Create many vintages with a single executemany INSERT."""
+        if vintages:
+            rows = [self._to_row(vintage) for vintage in vintages]
+            self.session.execute(insert(VintageDB), rows)
+            _mark_changed(self.session, VintageDB)
+        return list(vintages)
+
     def get_by_id(self, vintage_id: UUID | str) -> Vintage | None:
         """Get a vintage by ID."""
-        stmt = select(VintageDB).where(VintageDB.id == str(vintage_id))
-        db_item = self.session.execute(stmt).scalar_one_or_none()
+        db_item = self.session.get(VintageDB, str(vintage_id))
         return self._to_domain(db_item) if db_item else None
 
     def get_by_wine_id(self, wine_id: UUID | str) -> list[Vintage]:
         """Get all vintages for a wine."""
-        stmt = (
-            select(VintageDB)
-            .where(VintageDB.wine_id == str(wine_id))
-            .order_by(VintageDB.year.desc())
+        result = self.session.execute(
+            _VINTAGES_BY_WINE_ID, {"wine_id": str(wine_id)}
         )
-        result = self.session.execute(stmt).scalars().all()
         return [self._to_domain(v) for v in result]
 
     def get_by_wine_and_year(self, wine_id: UUID | str, year: int) -> Vintage | None:
         """Get a specific vintage by wine ID and year."""
-        stmt = select(VintageDB).where(
-            VintageDB.wine_id == str(wine_id),
-            VintageDB.year == year,
-        )
-        db_item = self.session.execute(stmt).scalar_one_or_none()
+        db_item = self.session.execute(
+            _VINTAGE_BY_WINE_AND_YEAR, {"wine_id": str(wine_id), "year": year}
+        ).scalar_one_or_none()
         return self._to_domain(db_item) if db_item else None
 
-    def count(self) -> int:
-        """Get total count of vintages."""
-        stmt = select(func.count()).select_from(VintageDB)
-        return self.session.execute(stmt).scalar() or 0
+    def get_by_wine_and_year_many(
+        self, pairs: list[tuple[UUID | str, int]]
+    ) -> dict[tuple[UUID, int], Vintage]:
+        """
+        Get vintages for many (wine ID, year) pairs in a single query.
+
+        Returns a dict keyed by (wine_id, year); pairs with no matching
+        vintage are absent from the result.
+        """
+        if not pairs:
+            return {}
+        keys = {(str(wine_id), year) for wine_id, year in pairs}
+        stmt = select(VintageDB.__table__).where(
+            tuple_(VintageDB.wine_id, VintageDB.year).in_(keys)
+        )
+        vintages = (self._to_domain(v) for v in self.session.execute(stmt))
+        return {(v.wine_id, v.year): v for v in vintages}
+
+    def count(self, approximate: bool = False) -> int:
+        """Get total count of vintages (briefly cached)."""
+        return _count_rows(self.session, VintageDB, _VINTAGE_COUNT, approximate)
 
     def update(self, vintage: Vintage) -> Vintage:
         """Update an existing vintage."""
-        stmt = select(VintageDB).where(VintageDB.id == str(vintage.id))
-        db_item = self.session.execute(stmt).scalar_one_or_none()
+        row = self._to_row(vintage)
+        row["updated_at"] = _utc_now()
+        db_item = _update_returning(self.session, VintageDB, row)
         if db_item is None:
             raise ValueError(f"Vintage with id {vintage.id} not found")
-
-        db_item.wine_id = str(vintage.wine_id)
-        db_item.year = vintage.year
-        db_item.bottle_size_ml = vintage.bottle_size_ml
-        db_item.abv = vintage.abv
-        db_item.tech_sheet_attrs_json = json.dumps(vintage.tech_sheet_attrs)
-        db_item.updated_at = _utc_now()
-
-        self.session.flush()
         return self._to_domain(db_item)
 
+    def bulk_update(self, vintages: list[Vintage]) -> list[Vintage]:
+        """Update many vintages with a single executemany UPDATE by primary key."""
+        now = _utc_now()
+        rows = []
+        for vintage in vintages:
+            row = self._to_row(vintage)
+            del row["created_at"]
+            row["updated_at"] = now
+            rows.append(row)
+        if rows:
+            self.session.execute(update(VintageDB), rows)
+        return [vintage.model_copy(update={"updated_at": now}) for vintage in vintages]
+
     def delete(self, vintage_id: UUID | str) -> bool:
         """Delete a vintage by ID."""
-        stmt = select(VintageDB).where(VintageDB.id == str(vintage_id))
+        deleted = _delete_by_id(self.session, VintageDB, vintage_id)
+        if deleted:
+            _mark_changed(self.session, VintageDB)
+        return deleted
+
+    def _to_row(self, vintage: Vintage) -> dict[str, Any]:
+        """Convert domain model to DB column values."""
+        return {
+            "id": str(vintage.id),
+            "wine_id": str(vintage.wine_id),
+            "year": vintage.year,
+            "bottle_size_ml": vintage.bottle_size_ml,
+            "abv": vintage.abv,
+            "tech_sheet_attrs_json": vintage.tech_sheet_attrs,
+            "created_at": vintage.created_at,
+            "updated_at": vintage.updated_at,
+        }
+
+    def _to_domain(self, db_item: VintageDB | Row[Any]) -> Vintage:
+        """Convert DB model to domain model."""
+        return Vintage.model_validate(
+            {
+                "id": db_item.id,
+                "wine_id": db_item.wine_id,
+                "year": db_item.year,
+                "bottle_size_ml": db_item.bottle_size_ml,
+                "abv": db_item.abv,
+                "tech_sheet_attrs": db_item.tech_sheet_attrs_json,
+                "created_at": db_item.created_at,
+                "updated_at": db_item.updated_at,
+            }
+        )
+
+
+class ProducerAggregateRepository:
+    """Repository for reading a producer together with its wines and vintages."""
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def get_full(self, producer_id: UUID | str) -> ProducerAggregate | None:
+        """
+        Get a producer with all of its wines and their vintages.
+
+        Wines and vintages are batch-loaded with a selectinload chain, so the
+        whole tree costs three queries regardless of its size.
+        """
+        stmt = (
+            select(ProducerDB)
+            .where(ProducerDB.id == str(producer_id))
+            .options(selectinload(ProducerDB.wines).selectinload(WineDB.vintages))
+        )
         db_item = self.session.execute(stmt).scalar_one_or_none()
         if db_item is None:
-            return False
-        self.session.delete(db_item)
-        self.session.flush()
-        return True
+            return None
 
-    def _to_domain(self, db_item: VintageDB) -> Vintage:
-        """Convert DB model to domain model."""
-        return Vintage(
-            id=UUID(db_item.id),
-            wine_id=UUID(db_item.wine_id),
-            year=db_item.year,
-            bottle_size_ml=db_item.bottle_size_ml,
-            abv=db_item.abv,
-            tech_sheet_attrs=json.loads(db_item.tech_sheet_attrs_json),
-            created_at=db_item.created_at,
-            updated_at=db_item.updated_at,
+        producer_repo = ProducerRepository(self.session)
+        wine_repo = WineRepository(self.session)
+        vintage_repo = VintageRepository(self.session)
+        wines = [
+            WineWithVintages(
+                wine=wine_repo._to_domain(w),
+                vintages=[
+                    vintage_repo._to_domain(v)
+                    for v in sorted(w.vintages, key=lambda v: v.year, reverse=True)
+                ],
+            )
+            for w in sorted(db_item.wines, key=lambda w: w.canonical_name)
+        ]
+        return ProducerAggregate(
+            producer=producer_repo._to_domain(db_item), wines=wines
         )
 
 
@@ -356,6 +867,22 @@ class VintageRepository:
 # ============================================================================
 
 
+_REGION_BY_WIKIDATA_ID = select(RegionDB).where(
+    RegionDB.wikidata_id == bindparam("wikidata_id")
+)
+_REGIONS_BY_COUNTRY = (
+    select(RegionDB.__table__)
+    .where(RegionDB.country == bindparam("country"))
+    .order_by(RegionDB.name)
+)
+_REGIONS_BY_PARENT_ID = (
+    select(RegionDB.__table__)
+    .where(RegionDB.parent_id == bindparam("parent_id"))
+    .order_by(RegionDB.name)
+)
+_REGION_COUNT = select(func.count()).select_from(RegionDB)
+
+
 class RegionRepository:
     """Repository for Region CRUD operations."""
 
@@ -364,86 +891,126 @@ class RegionRepository:
 
     def create(self, region: Region) -> Region:
         """Create a new region."""
-        db_item = RegionDB(
-            id=str(region.id),
-            parent_id=str(region.parent_id) if region.parent_id else None,
-            name=region.name,
-            aliases_json=json.dumps(region.aliases),
-            country=region.country,
-            wikidata_id=region.wikidata_id,
-            hierarchy_level=region.hierarchy_level.value,
-            created_at=region.created_at,
-            updated_at=region.updated_at,
-        )
-        self.session.add(db_item)
-        self.session.flush()
+        db_item = _insert_returning(self.session, RegionDB, self._to_row(region))
+        _mark_changed(self.session, RegionDB)
         return self._to_domain(db_item)
 
+    def bulk_create(self, regions: list[Region]) -> list[Region]:
+        """Create many regions with a single executemany INSERT."""
+        if regions:
+            rows = [self._to_row(region) for region in regions]
+            self.session.execute(insert(RegionDB), rows)
+            _mark_changed(self.session, RegionDB)
+        return list(regions)
+
     def get_by_id(self, region_id: UUID | str) -> Region | None:
-        """Get a region by ID."""
-        stmt = select(RegionDB).where(RegionDB.id == str(region_id))
-        db_item = self.session.execute(stmt).scalar_one_or_none()
-        return self._to_domain(db_item) if db_item else None
+        """Get a region by ID (cached)."""
+
+        def load() -> Region | None:
+            db_item = self.session.get(RegionDB, str(region_id))
+            return self._to_domain(db_item) if db_item else None
+
+        return _cached_reference(self.session, RegionDB, "id", str(region_id), load)
 
     def get_by_wikidata_id(self, wikidata_id: str) -> Region | None:
-        """Get a region by Wikidata ID."""
-        stmt = select(RegionDB).where(RegionDB.wikidata_id == wikidata_id)
-        db_item = self.session.execute(stmt).scalar_one_or_none()
-        return self._to_domain(db_item) if db_item else None
+        """Get a region by Wikidata ID (cached)."""
+
+        def load() -> Region | None:
+            db_item = self.session.execute(
+                _REGION_BY_WIKIDATA_ID, {"wikidata_id": wikidata_id}
+            ).scalar_one_or_none()
+            return self._to_domain(db_item) if db_item else None
+
+        return _cached_reference(
+            self.session, RegionDB, "wikidata_id", wikidata_id, load
+        )
 
     def search_by_name(self, name: str, limit: int = 20) -> list[Region]:
-        """Search regions by name (partial match)."""
+        """Search regions by name (case-insensitive match)."""
         stmt = (
-            select(RegionDB)
-            .where(RegionDB.name.ilike(f"%{name}%"))
+            select(RegionDB.__table__)
+            .where(_name_matches(self.session, RegionDB.name, name))
             .order_by(RegionDB.name)
             .limit(limit)
         )
-        result = self.session.execute(stmt).scalars().all()
+        result = self.session.execute(stmt)
         return [self._to_domain(r) for r in result]
 
     def get_by_country(self, country: str) -> list[Region]:
-        """Get all regions for a country."""
-        stmt = (
-            select(RegionDB)
-            .where(RegionDB.country == country)
-            .order_by(RegionDB.name)
-        )
-        result = self.session.execute(stmt).scalars().all()
-        return [self._to_domain(r) for r in result]
+        """Get all regions for a country (cached)."""
+
+        def load() -> list[Region]:
+            result = self.session.execute(
+                _REGIONS_BY_COUNTRY, {"country": country}
+            )
+            return [self._to_domain(r) for r in result]
+
+        return _cached_reference(self.session, RegionDB, "country", country, load)
 
     def get_children(self, parent_id: UUID | str) -> list[Region]:
-        """Get child regions of a parent region."""
+        """Get child regions of a parent region (cached)."""
+
+        def load() -> list[Region]:
+            result = self.session.execute(
+                _REGIONS_BY_PARENT_ID, {"parent_id": str(parent_id)}
+            )
+            return [self._to_domain(r) for r in result]
+
+        return _cached_reference(
+            self.session, RegionDB, "parent_id", str(parent_id), load
+        )
+
+    def iter_all(self, chunk: int = 500) -> Iterator[Region]:
+        """Iterate over all regions, loading at most chunk rows at a time."""
         stmt = (
-            select(RegionDB)
-            .where(RegionDB.parent_id == str(parent_id))
+            select(RegionDB.__table__)
             .order_by(RegionDB.name)
+            .execution_options(yield_per=chunk)
         )
-        result = self.session.execute(stmt).scalars().all()
-        return [self._to_domain(r) for r in result]
-
-    def count(self) -> int:
-        """Get total count of regions."""
-        stmt = select(func.count()).select_from(RegionDB)
-        return self.session.execute(stmt).scalar() or 0
-
-    def _to_domain(self, db_item: RegionDB) -> Region:
+        for r in self.session.execute(stmt):
+            yield self._to_domain(r)
+
+    def count(self, approximate: bool = False) -> int:
+        """Get total count of regions (briefly cached)."""
+        return _count_rows(self.session, RegionDB, _REGION_COUNT, approximate)
+
+    def _to_row(self, region: Region) -> dict[str, Any]:
+        """Convert domain model to DB column values."""
+        return {
+            "id": str(region.id),
+            "parent_id": str(region.parent_id) if region.parent_id else None,
+            "name": region.name,
+            "aliases_json": region.aliases,
+            "country": region.country,
+            "wikidata_id": region.wikidata_id,
+            "hierarchy_level": region.hierarchy_level.value,
+            "created_at": region.created_at,
+            "updated_at": region.updated_at,
+        }
+
+    def _to_domain(self, db_item: RegionDB | Row[Any]) -> Region:
         """Convert DB model to domain model."""
-        from wine_agent.core.schema_canonical import RegionHierarchyLevel
-
-        return Region(
-            id=UUID(db_item.id),
-            parent_id=UUID(db_item.parent_id) if db_item.parent_id else None,
-            name=db_item.name,
-            aliases=json.loads(db_item.aliases_json),
-            country=db_item.country,
-            wikidata_id=db_item.wikidata_id,
-            hierarchy_level=RegionHierarchyLevel(db_item.hierarchy_level),
-            created_at=db_item.created_at,
-            updated_at=db_item.updated_at,
+        return Region.model_validate(
+            {
+                "id": db_item.id,
+                "parent_id": db_item.parent_id,
+                "name": db_item.name,
+                "aliases": db_item.aliases_json,
+                "country": db_item.country,
+                "wikidata_id": db_item.wikidata_id,
+                "hierarchy_level": RegionHierarchyLevel(db_item.hierarchy_level),
+                "created_at": db_item.created_at,
+                "updated_at": db_item.updated_at,
+            }
         )
 
 
+_GRAPE_VARIETY_BY_WIKIDATA_ID = select(GrapeVarietyDB).where(
+    GrapeVarietyDB.wikidata_id == bindparam("wikidata_id")
+)
+_GRAPE_VARIETY_COUNT = select(func.count()).select_from(GrapeVarietyDB)
+
+
 class GrapeVarietyRepository:
     """Repository for GrapeVariety CRUD operations."""
 
@@ -452,66 +1019,102 @@ class GrapeVarietyRepository:
 
     def create(self, grape: GrapeVariety) -> GrapeVariety:
         """Create a new grape variety."""
-        db_item = GrapeVarietyDB(
-            id=str(grape.id),
-            canonical_name=grape.canonical_name,
-            aliases_json=json.dumps(grape.aliases),
-            wikidata_id=grape.wikidata_id,
-            created_at=grape.created_at,
-            updated_at=grape.updated_at,
-        )
-        self.session.add(db_item)
-        self.session.flush()
+        db_item = _insert_returning(self.session, GrapeVarietyDB, self._to_row(grape))
+        _mark_changed(self.session, GrapeVarietyDB)
         return self._to_domain(db_item)
 
+    def bulk_create(self, grapes: list[GrapeVariety]) -> list[GrapeVariety]:
+        """Create many grape varieties with a single executemany INSERT."""
+        if grapes:
+            rows = [self._to_row(grape) for grape in grapes]
+            self.session.execute(insert(GrapeVarietyDB), rows)
+            _mark_changed(self.session, GrapeVarietyDB)
+        return list(grapes)
+
     def get_by_id(self, grape_id: UUID | str) -> GrapeVariety | None:
-        """Get a grape variety by ID."""
-        stmt = select(GrapeVarietyDB).where(GrapeVarietyDB.id == str(grape_id))
-        db_item = self.session.execute(stmt).scalar_one_or_none()
-        return self._to_domain(db_item) if db_item else None
+        """Get a grape variety by ID (cached)."""
+
+        def load() -> GrapeVariety | None:
+            db_item = self.session.get(GrapeVarietyDB, str(grape_id))
+            return self._to_domain(db_item) if db_item else None
+
+        return _cached_reference(
+            self.session, GrapeVarietyDB, "id", str(grape_id), load
+        )
 
     def get_by_wikidata_id(self, wikidata_id: str) -> GrapeVariety | None:
-        """Get a grape variety by Wikidata ID."""
-        stmt = select(GrapeVarietyDB).where(GrapeVarietyDB.wikidata_id == wikidata_id)
-        db_item = self.session.execute(stmt).scalar_one_or_none()
-        return self._to_domain(db_item) if db_item else None
+        """Get a grape variety by Wikidata ID (cached)."""
+
+        def load() -> GrapeVariety | None:
+            db_item = self.session.execute(
+                _GRAPE_VARIETY_BY_WIKIDATA_ID, {"wikidata_id": wikidata_id}
+            ).scalar_one_or_none()
+            return self._to_domain(db_item) if db_item else None
+
+        return _cached_reference(
+            self.session, GrapeVarietyDB, "wikidata_id", wikidata_id, load
+        )
 
     def search_by_name(self, name: str, limit: int = 20) -> list[GrapeVariety]:
-        """Search grape varieties by name (partial match)."""
+        """Search grape varieties by name (case-insensitive match)."""
         stmt = (
-            select(GrapeVarietyDB)
-            .where(GrapeVarietyDB.canonical_name.ilike(f"%{name}%"))
+            select(GrapeVarietyDB.__table__)
+            .where(_name_matches(self.session, GrapeVarietyDB.canonical_name, name))
             .order_by(GrapeVarietyDB.canonical_name)
             .limit(limit)
         )
-        result = self.session.execute(stmt).scalars().all()
+        result = self.session.execute(stmt)
         return [self._to_domain(g) for g in result]
 
     def list_all(self, limit: int = 100, offset: int = 0) -> list[GrapeVariety]:
         """List all grape varieties with pagination."""
         stmt = (
-            select(GrapeVarietyDB)
+            select(GrapeVarietyDB.__table__)
             .order_by(GrapeVarietyDB.canonical_name)
             .limit(limit)
             .offset(offset)
         )
-        result = self.session.execute(stmt).scalars().all()
+        result = self.session.execute(stmt)
         return [self._to_domain(g) for g in result]
 
-    def count(self) -> int:
-        """Get total count of grape varieties."""
-        stmt = select(func.count()).select_from(GrapeVarietyDB)
-        return self.session.execute(stmt).scalar() or 0
+    def iter_all(self, chunk: int = 500) -> Iterator[GrapeVariety]:
+        """Iterate over all grape varieties, loading chunk rows at a time."""
+        stmt = (
+            select(GrapeVarietyDB.__table__)
+            .order_by(GrapeVarietyDB.canonical_name)
+            .execution_options(yield_per=chunk)
+        )
+        for g in self.session.execute(stmt):
+            yield self._to_domain(g)
+
+    def count(self, approximate: bool = False) -> int:
+        """Get total count of grape varieties (briefly cached)."""
+        return _count_rows(
+            self.session, GrapeVarietyDB, _GRAPE_VARIETY_COUNT, approximate
+        )
 
-    def _to_domain(self, db_item: GrapeVarietyDB) -> GrapeVariety:
+    def _to_row(self, grape: GrapeVariety) -> dict[str, Any]:
+        """Convert domain model to DB column values."""
+        return {
+            "id": str(grape.id),
+            "canonical_name": grape.canonical_name,
+            "aliases_json": grape.aliases,
+            "wikidata_id": grape.wikidata_id,
+            "created_at": grape.created_at,
+            "updated_at": grape.updated_at,
+        }
+
+    def _to_domain(self, db_item: GrapeVarietyDB | Row[Any]) -> GrapeVariety:
         """Convert DB model to domain model."""
-        return GrapeVariety(
-            id=UUID(db_item.id),
-            canonical_name=db_item.canonical_name,
-            aliases=json.loads(db_item.aliases_json),
-            wikidata_id=db_item.wikidata_id,
-            created_at=db_item.created_at,
-            updated_at=db_item.updated_at,
+        return GrapeVariety.model_validate(
+            {
+                "id": db_item.id,
+                "canonical_name": db_item.canonical_name,
+                "aliases": db_item.aliases_json,
+                "wikidata_id": db_item.wikidata_id,
+                "created_at": db_item.created_at,
+                "updated_at": db_item.updated_at,
+            }
         )
 
 
@@ -520,6 +1123,9 @@ class GrapeVarietyRepository:
 # ============================================================================
 
 
+_IMPORTER_COUNT = select(func.count()).select_from(ImporterDB)
+
+
 class ImporterRepository:
     """Repository for Importer CRUD operations."""
 
@@ -528,52 +1134,66 @@ class ImporterRepository:
 
     def create(self, importer: Importer) -> Importer:
         """Create a new importer."""
-        db_item = ImporterDB(
-            id=str(importer.id),
-            canonical_name=importer.canonical_name,
-            country=importer.country,
-            website=importer.website,
-            created_at=importer.created_at,
-            updated_at=importer.updated_at,
-        )
-        self.session.add(db_item)
-        self.session.flush()
+        db_item = _insert_returning(self.session, ImporterDB, self._to_row(importer))
+        _mark_changed(self.session, ImporterDB)
         return self._to_domain(db_item)
 
+    def bulk_create(self, importers: list[Importer]) -> list[Importer]:
+        """Create many importers with a single executemany INSERT."""
+        if importers:
+            rows = [self._to_row(importer) for importer in importers]
+            self.session.execute(insert(ImporterDB), rows)
+            _mark_changed(self.session, ImporterDB)
+        return list(importers)
+
     def get_by_id(self, importer_id: UUID | str) -> Importer | None:
         """Get an importer by ID."""
-        stmt = select(ImporterDB).where(ImporterDB.id == str(importer_id))
-        db_item = self.session.execute(stmt).scalar_one_or_none()
+        db_item = self.session.get(ImporterDB, str(importer_id))
         return self._to_domain(db_item) if db_item else None
 
     def search_by_name(self, name: str, limit: int = 20) -> list[Importer]:
-        """Search importers by name (partial match)."""
+        """Search importers by name (case-insensitive match)."""
         stmt = (
-            select(ImporterDB)
-            .where(ImporterDB.canonical_name.ilike(f"%{name}%"))
+            select(ImporterDB.__table__)
+            .where(_name_matches(self.session, ImporterDB.canonical_name, name))
             .order_by(ImporterDB.canonical_name)
             .limit(limit)
         )
-        result = self.session.execute(stmt).scalars().all()
+        result = self.session.execute(stmt)
         return [self._to_domain(i) for i in result]
 
-    def count(self) -> int:
-        """Get total count of importers."""
-        stmt = select(func.count()).select_from(ImporterDB)
-        return self.session.execute(stmt).scalar() or 0
-
-    def _to_domain(self, db_item: ImporterDB) -> Importer:
+    def count(self, approximate: bool = False) -> int:
+        """Get total count of importers (briefly cached)."""
+        return _count_rows(self.session, ImporterDB, _IMPORTER_COUNT, approximate)
+
+    def _to_row(self, importer: Importer) -> dict[str, Any]:
+        """Convert domain model to DB column values."""
+        return {
+            "id": str(importer.id),
+            "canonical_name": importer.canonical_name,
+            "country": importer.country,
+            "website": importer.website,
+            "created_at": importer.created_at,
+            "updated_at": importer.updated_at,
+        }
+
+    def _to_domain(self, db_item: ImporterDB | Row[Any]) -> Importer:
         """Convert DB model to domain model."""
-        return Importer(
-            id=UUID(db_item.id),
-            canonical_name=db_item.canonical_name,
-            country=db_item.country,
-            website=db_item.website,
-            created_at=db_item.created_at,
-            updated_at=db_item.updated_at,
+        return Importer.model_validate(
+            {
+                "id": db_item.id,
+                "canonical_name": db_item.canonical_name,
+                "country": db_item.country,
+                "website": db_item.website,
+                "created_at": db_item.created_at,
+                "updated_at": db_item.updated_at,
+            }
         )
 
 
+_DISTRIBUTOR_COUNT = select(func.count()).select_from(DistributorDB)
+
+
 class DistributorRepository:
     """Repository for Distributor CRUD operations."""
 
@@ -582,51 +1202,64 @@ class DistributorRepository:
 
     def create(self, distributor: Distributor) -> Distributor:
         """Create a new distributor."""
-        db_item = DistributorDB(
-            id=str(distributor.id),
-            canonical_name=distributor.canonical_name,
-            country=distributor.country,
-            website=distributor.website,
-            regions_served_json=json.dumps(distributor.regions_served),
-            created_at=distributor.created_at,
-            updated_at=distributor.updated_at,
+        db_item = _insert_returning(
+            self.session, DistributorDB, self._to_row(distributor)
         )
-        self.session.add(db_item)
-        self.session.flush()
+        _mark_changed(self.session, DistributorDB)
         return self._to_domain(db_item)
 
+    def bulk_create(self, distributors: list[Distributor]) -> list[Distributor]:
+        """Create many distributors with a single executemany INSERT."""
+        if distributors:
+            rows = [self._to_row(distributor) for distributor in distributors]
+            self.session.execute(insert(DistributorDB), rows)
+            _mark_changed(self.session, DistributorDB)
+        return list(distributors)
+
     def get_by_id(self, distributor_id: UUID | str) -> Distributor | None:
         """Get a distributor by ID."""
-        stmt = select(DistributorDB).where(DistributorDB.id == str(distributor_id))
-        db_item = self.session.execute(stmt).scalar_one_or_none()
+        db_item = self.session.get(DistributorDB, str(distributor_id))
         return self._to_domain(db_item) if db_item else None
 
     def search_by_name(self, name: str, limit: int = 20) -> list[Distributor]:
-        """Search distributors by name (partial match)."""
+        """Search distributors by name (case-insensitive match)."""
         stmt = (
-            select(DistributorDB)
-            .where(DistributorDB.canonical_name.ilike(f"%{name}%"))
+            select(DistributorDB.__table__)
+            .where(_name_matches(self.session, DistributorDB.canonical_name, name))
             .order_by(DistributorDB.canonical_name)
             .limit(limit)
         )
-        result = self.session.execute(stmt).scalars().all()
+        result = self.session.execute(stmt)
         return [self._to_domain(d) for d in result]
 
-    def count(self) -> int:
-        """Get total count of distributors."""
-        stmt = select(func.count()).select_from(DistributorDB)
-        return self.session.execute(stmt).scalar() or 0
-
-    def _to_domain(self, db_item: DistributorDB) -> Distributor:
+    def count(self, approximate: bool = False) -> int:
+        """Get total count of distributors (briefly cached)."""
+        return _count_rows(self.session, DistributorDB, _DISTRIBUTOR_COUNT, approximate)
+
+    def _to_row(self, distributor: Distributor) -> dict[str, Any]:
+        """Convert domain model to DB column values."""
+        return {
+            "id": str(distributor.id),
+            "canonical_name": distributor.canonical_name,
+            "country": distributor.country,
+            "website": distributor.website,
+            "regions_served_json": distributor.regions_served,
+            "created_at": distributor.created_at,
+            "updated_at": distributor.updated_at,
+        }
+
+    def _to_domain(self, db_item: DistributorDB | Row[Any]) -> Distributor:
         """Convert DB model to domain model."""
-        return Distributor(
-            id=UUID(db_item.id),
-            canonical_name=db_item.canonical_name,
-            country=db_item.country,
-            website=db_item.website,
-            regions_served=json.loads(db_item.regions_served_json),
-            created_at=db_item.created_at,
-            updated_at=db_item.updated_at,
+        return Distributor.model_validate(
+            {
+                "id": db_item.id,
+                "canonical_name": db_item.canonical_name,
+                "country": db_item.country,
+                "website": db_item.website,
+                "regions_served": db_item.regions_served_json,
+                "created_at": db_item.created_at,
+                "updated_at": db_item.updated_at,
+            }
         )
 
 
@@ -635,6 +1268,10 @@ class DistributorRepository:
 # ============================================================================
 
 
+_SOURCE_BY_DOMAIN = select(SourceDB).where(SourceDB.domain == bindparam("domain"))
+_SOURCE_COUNT = select(func.count()).select_from(SourceDB)
+
+
 class SourceRepository:
     """Repository for Source CRUD operations."""
 
@@ -643,31 +1280,28 @@ class SourceRepository:
 
     def create(self, source: Source) -> Source:
         """Create a new source."""
-        db_item = SourceDB(
-            id=str(source.id),
-            domain=source.domain,
-            adapter_type=source.adapter_type,
-            rate_limit_config_json=json.dumps(source.rate_limit_config),
-            allowlist_json=json.dumps(source.allowlist),
-            denylist_json=json.dumps(source.denylist),
-            enabled=source.enabled,
-            created_at=source.created_at,
-            updated_at=source.updated_at,
-        )
-        self.session.add(db_item)
-        self.session.flush()
+        db_item = _insert_returning(self.session, SourceDB, self._to_row(source))
+        _mark_changed(self.session, SourceDB)
         return self._to_domain(db_item)
 
+    def bulk_create(self, sources: list[Source]) -> list[Source]:
+        """Create many sources with a single executemany INSERT."""
+        if sources:
+            rows = [self._to_row(source) for source in sources]
+            self.session.execute(insert(SourceDB), rows)
+            _mark_changed(self.session, SourceDB)
+        return list(sources)
+
     def get_by_id(self, source_id: UUID | str) -> Source | None:
         """Get a source by ID."""
-        stmt = select(SourceDB).where(SourceDB.id == str(source_id))
-        db_item = self.session.execute(stmt).scalar_one_or_none()
+        db_item = self.session.get(SourceDB, str(source_id))
         return self._to_domain(db_item) if db_item else None
 
     def get_by_domain(self, domain: str) -> Source | None:
         """Get a source by domain."""
-        stmt = select(SourceDB).where(SourceDB.domain == domain.lower())
-        db_item = self.session.execute(stmt).scalar_one_or_none()
+        db_item = self.session.execute(
+            _SOURCE_BY_DOMAIN, {"domain": domain.lower()}
+        ).scalar_one_or_none()
         return self._to_domain(db_item) if db_item else None
 
     def list_enabled(self) -> list[Source]:
@@ -677,53 +1311,88 @@ class SourceRepository:
             .where(SourceDB.enabled == True)  # noqa: E712
             .order_by(SourceDB.domain)
         )
-        result = self.session.execute(stmt).scalars().all()
+        result = self.session.execute(_guard_lazy_loads(stmt)).scalars().all()
         return [self._to_domain(s) for s in result]
 
     def list_all(self) -> list[Source]:
         """List all sources."""
         stmt = select(SourceDB).order_by(SourceDB.domain)
-        result = self.session.execute(stmt).scalars().all()
+        result = self.session.execute(_guard_lazy_loads(stmt)).scalars().all()
         return [self._to_domain(s) for s in result]
 
-    def count(self) -> int:
-        """Get total count of sources."""
-        stmt = select(func.count()).select_from(SourceDB)
-        return self.session.execute(stmt).scalar() or 0
+    def iter_all(self, chunk: int = 500) -> Iterator[Source]:
+        """Iterate over all sources, loading at most chunk rows at a time."""
+        stmt = (
+            select(SourceDB)
+            .order_by(SourceDB.domain)
+            .execution_options(yield_per=chunk)
+        )
+        for s in self.session.scalars(_guard_lazy_loads(stmt)):
+            yield self._to_domain(s)
+
+    def count(self, approximate: bool = False) -> int:
+        """Get total count of sources (briefly cached)."""
+        return _count_rows(self.session, SourceDB, _SOURCE_COUNT, approximate)
 
     def update(self, source: Source) -> Source:
         """Update an existing source."""
-        stmt = select(SourceDB).where(SourceDB.id == str(source.id))
-        db_item = self.session.execute(stmt).scalar_one_or_none()
+        row = self._to_row(source)
+        row["updated_at"] = _utc_now()
+        db_item = _update_returning(self.session, SourceDB, row)
         if db_item is None:
             raise ValueError(f"Source with id {source.id} not found")
-
-        db_item.domain = source.domain
-        db_item.adapter_type = source.adapter_type
-        db_item.rate_limit_config_json = json.dumps(source.rate_limit_config)
-        db_item.allowlist_json = json.dumps(source.allowlist)
-        db_item.denylist_json = json.dumps(source.denylist)
-        db_item.enabled = source.enabled
-        db_item.updated_at = _utc_now()
-
-        self.session.flush()
         return self._to_domain(db_item)
 
+    def bulk_update(self, sources: list[Source]) -> list[Source]:
+        """Update many sources with a single executemany UPDATE by primary key."""
+        now = _utc_now()
+        rows = []
+        for source in sources:
+            row = self._to_row(source)
+            del row["created_at"]
+            row["updated_at"] = now
+            rows.append(row)
+        if rows:
+            self.session.execute(update(SourceDB), rows)
+        return [source.model_copy(update={"updated_at": now}) for source in sources]
+
+    def _to_row(self, source: Source) -> dict[str, Any]:
+        """Convert domain model to DB column values."""
+        return {
+            "id": str(source.id),
+            "domain": source.domain,
+            "adapter_type": source.adapter_type,
+            "rate_limit_config_json": _dumps(source.rate_limit_config),
+            "allowlist_json": _dumps(source.allowlist),
+            "denylist_json": _dumps(source.denylist),
+            "enabled": source.enabled,
+            "created_at": source.created_at,
+            "updated_at": source.updated_at,
+        }
+
     def _to_domain(self, db_item: SourceDB) -> Source:
         """Convert DB model to domain model."""
-        return Source(
-            id=UUID(db_item.id),
-            domain=db_item.domain,
-            adapter_type=db_item.adapter_type,
-            rate_limit_config=json.loads(db_item.rate_limit_config_json),
-            allowlist=json.loads(db_item.allowlist_json),
-            denylist=json.loads(db_item.denylist_json),
-            enabled=db_item.enabled,
-            created_at=db_item.created_at,
-            updated_at=db_item.updated_at,
+        return Source.model_validate(
+            {
+                "id": db_item.id,
+                "domain": db_item.domain,
+                "adapter_type": db_item.adapter_type,
+                "rate_limit_config": _loads(db_item.rate_limit_config_json),
+                "allowlist": _loads(db_item.allowlist_json),
+                "denylist": _loads(db_item.denylist_json),
+                "enabled": db_item.enabled,
+                "created_at": db_item.created_at,
+                "updated_at": db_item.updated_at,
+            }
         )
 
 
+_SNAPSHOT_BY_CONTENT_HASH = select(SnapshotDB).where(
+    SnapshotDB.content_hash == bindparam("content_hash")
+)
+_SNAPSHOT_COUNT = select(func.count()).select_from(SnapshotDB)
+
+
 class SnapshotRepository:
     """Repository for Snapshot CRUD operations."""
 
@@ -732,30 +1401,28 @@ class SnapshotRepository:
 
     def create(self, snapshot: Snapshot) -> Snapshot:
         """Create a new snapshot."""
-        db_item = SnapshotDB(
-            id=str(snapshot.id),
-            source_id=str(snapshot.source_id),
-            url=snapshot.url,
-            content_hash=snapshot.content_hash,
-            mime_type=snapshot.mime_type,
-            file_path=snapshot.file_path,
-            fetched_at=snapshot.fetched_at,
-            status=snapshot.status.value,
-        )
-        self.session.add(db_item)
-        self.session.flush()
+        db_item = _insert_returning(self.session, SnapshotDB, self._to_row(snapshot))
+        _mark_changed(self.session, SnapshotDB)
         return self._to_domain(db_item)
 
+    def bulk_create(self, snapshots: list[Snapshot]) -> list[Snapshot]:
+        """Create many snapshots with a single executemany INSERT."""
+        if snapshots:
+            rows = [self._to_row(snapshot) for snapshot in snapshots]
+            self.session.execute(insert(SnapshotDB), rows)
+            _mark_changed(self.session, SnapshotDB)
+        return list(snapshots)
+
     def get_by_id(self, snapshot_id: UUID | str) -> Snapshot | None:
         """Get a snapshot by ID."""
-        stmt = select(SnapshotDB).where(SnapshotDB.id == str(snapshot_id))
-        db_item = self.session.execute(stmt).scalar_one_or_none()
+        db_item = self.session.get(SnapshotDB, str(snapshot_id))
         return self._to_domain(db_item) if db_item else None
 
     def get_by_content_hash(self, content_hash: str) -> Snapshot | None:
         """Get a snapshot by content hash (for deduplication)."""
-        stmt = select(SnapshotDB).where(SnapshotDB.content_hash == content_hash)
-        db_item = self.session.execute(stmt).scalar_one_or_none()
+        db_item = self.session.execute(
+            _SNAPSHOT_BY_CONTENT_HASH, {"content_hash": content_hash}
+        ).scalar_one_or_none()
         return self._to_domain(db_item) if db_item else None
 
     def get_by_source_id(self, source_id: UUID | str, limit: int = 100) -> list[Snapshot]:
@@ -766,40 +1433,65 @@ class SnapshotRepository:
             .order_by(SnapshotDB.fetched_at.desc())
             .limit(limit)
         )
-        result = self.session.execute(stmt).scalars().all()
+        result = self.session.execute(_guard_lazy_loads(stmt)).scalars().all()
         return [self._to_domain(s) for s in result]
 
-    def count(self) -> int:
-        """Get total count of snapshots."""
-        stmt = select(func.count()).select_from(SnapshotDB)
-        return self.session.execute(stmt).scalar() or 0
+    def iter_by_source_id(
+        self, source_id: UUID | str, chunk: int = 500
+    ) -> Iterator[Snapshot]:
+        """Iterate over all snapshots for a source, chunk rows at a time."""
+        stmt = (
+            select(SnapshotDB)
+            .where(SnapshotDB.source_id == str(source_id))
+            .order_by(SnapshotDB.fetched_at.desc())
+            .execution_options(yield_per=chunk)
+        )
+        for s in self.session.scalars(_guard_lazy_loads(stmt)):
+            yield self._to_domain(s)
+
+    def count(self, approximate: bool = False) -> int:
+        """Get total count of snapshots (briefly cached)."""
+        return _count_rows(self.session, SnapshotDB, _SNAPSHOT_COUNT, approximate)
 
     def update_status(self, snapshot_id: UUID | str, status: str) -> Snapshot | None:
         """Update snapshot status."""
-        stmt = select(SnapshotDB).where(SnapshotDB.id == str(snapshot_id))
-        db_item = self.session.execute(stmt).scalar_one_or_none()
-        if db_item is None:
-            return None
-        db_item.status = status
-        self.session.flush()
-        return self._to_domain(db_item)
+        db_item = _update_by_id(
+            self.session, SnapshotDB, snapshot_id, {"status": status}
+        )
+        return self._to_domain(db_item) if db_item else None
+
+    def _to_row(self, snapshot: Snapshot) -> dict[str, Any]:
+        """Convert domain model to DB column values."""
+        return {
+            "id": str(snapshot.id),
+            "source_id": str(snapshot.source_id),
+            "url": snapshot.url,
+            "content_hash": snapshot.content_hash,
+            "mime_type": snapshot.mime_type,
+            "file_path": snapshot.file_path,
+            "fetched_at": snapshot.fetched_at,
+            "status": snapshot.status.value,
+        }
 
     def _to_domain(self, db_item: SnapshotDB) -> Snapshot:
         """Convert DB model to domain model."""
-        from wine_agent.core.schema_canonical import SnapshotStatus
-
-        return Snapshot(
-            id=UUID(db_item.id),
-            source_id=UUID(db_item.source_id),
-            url=db_item.url,
-            content_hash=db_item.content_hash,
-            mime_type=db_item.mime_type,
-            file_path=db_item.file_path,
-            fetched_at=db_item.fetched_at,
-            status=SnapshotStatus(db_item.status),
+        return Snapshot.model_validate(
+            {
+                "id": db_item.id,
+                "source_id": db_item.source_id,
+                "url": db_item.url,
+                "content_hash": db_item.content_hash,
+                "mime_type": db_item.mime_type,
+                "file_path": db_item.file_path,
+                "fetched_at": db_item.fetched_at,
+                "status": SnapshotStatus(db_item.status),
+            }
         )
 
 
+_LISTING_COUNT = select(func.count()).select_from(ListingDB)
+
+
 class ListingRepository:
     """Repository for Listing CRUD operations."""
 
@@ -808,41 +1500,90 @@ class ListingRepository:
 
     def create(self, listing: Listing) -> Listing:
         """Create a new listing."""
-        db_item = ListingDB(
-            id=str(listing.id),
-            source_id=str(listing.source_id),
-            snapshot_id=str(listing.snapshot_id),
-            url=listing.url,
-            title=listing.title,
-            sku=listing.sku,
-            upc=listing.upc,
-            ean=listing.ean,
-            price=listing.price,
-            currency=listing.currency,
-            parsed_fields_json=json.dumps(listing.parsed_fields),
-            created_at=listing.created_at,
-        )
-        self.session.add(db_item)
-        self.session.flush()
+        db_item = _insert_returning(self.session, ListingDB, self._to_row(listing))
+        _mark_changed(self.session, ListingDB)
         return self._to_domain(db_item)
 
+    def bulk_create(self, listings: list[Listing]) -> list[Listing]:
+        """Create many listings with a single executemany INSERT."""
+        if listings:
+            rows = [self._to_row(listing) for listing in listings]
+            self.session.execute(insert(ListingDB), rows)
+            _mark_changed(self.session, ListingDB)
+        return list(listings)
+
     def get_by_id(self, listing_id: UUID | str) -> Listing | None:
         """Get a listing by ID."""
-        stmt = select(ListingDB).where(ListingDB.id == str(listing_id))
-        db_item = self.session.execute(stmt).scalar_one_or_none()
+        db_item = self.session.get(ListingDB, str(listing_id))
         return self._to_domain(db_item) if db_item else None
 
+    def get_parsed_field(self, listing_id: UUID | str, field: str) -> Any:
+        """
+        Get one top-level value from a listing's parsed fields.
+
+        The value is extracted in SQL (the JSON -> operator on both SQLite
+        and PostgreSQL), so the rest of the parsed_fields blob is never decoded.
+        Returns None when the listing or the field does not exist.
+        """
+        column = ListingDB.parsed_fields_json
+        value: ColumnElement[Any]
+        if self.session.get_bind().dialect.name == "postgresql":
+            value = cast(column, JSONB).op("->")(field).cast(Text)
+        elif '"' in field:
+            # SQLite JSON paths cannot quote a key containing '"'
+            listing = self.get_by_id(listing_id)
+            return listing.parsed_fields.get(field) if listing else None
+        else:
+            # The -> operator (SQLite 3.38+) returns the value as JSON text,
+            # so booleans stay true/false instead of becoming 1/0 as they do
+            # through json_extract
+            value = column.op("->")(f'$."{field}"')
+        raw = self.session.execute(
+            select(value).where(ListingDB.id == str(listing_id))
+        ).scalar_one_or_none()
+        return _loads(raw) if raw is not None else None
+
     def get_by_upc(self, upc: str) -> list[Listing]:
         """Get listings by UPC code."""
         stmt = select(ListingDB).where(ListingDB.upc == upc)
-        result = self.session.execute(stmt).scalars().all()
-        return [self._to_domain(l) for l in result]
+        result = self.session.execute(_guard_lazy_loads(stmt)).scalars().all()
+        return [self._to_domain(listing) for listing in result]
 
     def get_by_ean(self, ean: str) -> list[Listing]:
         """Get listings by EAN code."""
         stmt = select(ListingDB).where(ListingDB.ean == ean)
-        result = self.session.execute(stmt).scalars().all()
-        return [self._to_domain(l) for l in result]
+        result = self.session.execute(_guard_lazy_loads(stmt)).scalars().all()
+        return [self._to_domain(listing) for listing in result]
+
+    def get_by_upc_many(self, upcs: list[str]) -> dict[str, list[Listing]]:
+        """
+        Get listings for many UPC codes in a single query.
+
+        Returns a dict keyed by UPC; codes with no listings are absent.
+        """
+        return self._get_by_code_many(ListingDB.upc, upcs)
+
+    def get_by_ean_many(self, eans: list[str]) -> dict[str, list[Listing]]:
+        """
+        Get listings for many EAN codes in a single query.
+
+        Returns a dict keyed by EAN; codes with no listings are absent.
+        """
+        return self._get_by_code_many(ListingDB.ean, eans)
+
+    def _get_by_code_many(
+        self, column: Any, codes: list[str]
+    ) -> dict[str, list[Listing]]:
+        """Get listings whose code column matches any of codes, keyed by code."""
+        if not codes:
+            return {}
+        stmt = select(ListingDB).where(column.in_(set(codes)))
+        listings: dict[str, list[Listing]] = {}
+        for listing in self.session.execute(_guard_lazy_loads(stmt)).scalars():
+            listings.setdefault(getattr(listing, column.key), []).append(
+                self._to_domain(listing)
+            )
+        return listings
 
     def get_by_source_id(self, source_id: UUID | str, limit: int = 100) -> list[Listing]:
         """Get listings for a source."""
@@ -852,29 +1593,60 @@ class ListingRepository:
             .order_by(ListingDB.created_at.desc())
             .limit(limit)
         )
-        result = self.session.execute(stmt).scalars().all()
-        return [self._to_domain(l) for l in result]
+        result = self.session.execute(_guard_lazy_loads(stmt)).scalars().all()
+        return [self._to_domain(listing) for listing in result]
 
-    def count(self) -> int:
-        """Get total count of listings."""
-        stmt = select(func.count()).select_from(ListingDB)
-        return self.session.execute(stmt).scalar() or 0
+    def iter_by_source_id(
+        self, source_id: UUID | str, chunk: int = 500
+    ) -> Iterator[Listing]:
+        """Iterate over all listings for a source, chunk rows at a time."""
+        stmt = (
+            select(ListingDB)
+            .where(ListingDB.source_id == str(source_id))
+            .order_by(ListingDB.created_at.desc())
+            .execution_options(yield_per=chunk)
+        )
+        for listing in self.session.scalars(_guard_lazy_loads(stmt)):
+            yield self._to_domain(listing)
+
+    def count(self, approximate: bool = False) -> int:
+        """Get total count of listings (briefly cached)."""
+        return _count_rows(self.session, ListingDB, _LISTING_COUNT, approximate)
+
+    def _to_row(self, listing: Listing) -> dict[str, Any]:
+        """Convert domain model to DB column values."""
+        return {
+            "id": str(listing.id),
+            "source_id": str(listing.source_id),
+            "snapshot_id": str(listing.snapshot_id),
+            "url": listing.url,
+            "title": listing.title,
+            "sku": listing.sku,
+            "upc": listing.upc,
+            "ean": listing.ean,
+            "price": listing.price,
+            "currency": listing.currency,
+            "parsed_fields_json": _dumps(listing.parsed_fields),
+            "created_at": listing.created_at,
+        }
 
     def _to_domain(self, db_item: ListingDB) -> Listing:
         """Convert DB model to domain model."""
-        return Listing(
-            id=UUID(db_item.id),
-            source_id=UUID(db_item.source_id),
-            snapshot_id=UUID(db_item.snapshot_id),
-            url=db_item.url,
-            title=db_item.title,
-            sku=db_item.sku,
-            upc=db_item.upc,
-            ean=db_item.ean,
-            price=db_item.price,
-            currency=db_item.currency,
-            parsed_fields=json.loads(db_item.parsed_fields_json),
-            created_at=db_item.created_at,
+        return Listing.model_validate(
+            {
+                "id": db_item.id,
+                "source_id": db_item.source_id,
+                "snapshot_id": db_item.snapshot_id,
+                "url": db_item.url,
+                "title": db_item.title,
+                "sku": db_item.sku,
+                "upc": db_item.upc,
+                "ean": db_item.ean,
+                "price": db_item.price,
+                "currency": db_item.currency,
+                "parsed_fields": _loads(db_item.parsed_fields_json),
+                "created_at": db_item.created_at,
+            }
         )
 
 
@@ -886,23 +1658,19 @@ class ListingMatchRepository:
 
     def create(self, match: ListingMatch) -> ListingMatch:
         """Create a new listing match."""
-        db_item = ListingMatchDB(
-            id=str(match.id),
-            listing_id=str(match.listing_id),
-            entity_type=match.entity_type.value,
-            entity_id=str(match.entity_id),
-            confidence=match.confidence,
-            decision=match.decision.value,
-            created_at=match.created_at,
-        )
-        self.session.add(db_item)
-        self.session.flush()
+        db_item = _insert_returning(self.session, ListingMatchDB, self._to_row(match))
         return self._to_domain(db_item)
 
+    def bulk_create(self, matches: list[ListingMatch]) -> list[ListingMatch]:
+        """Create many listing matches with a single executemany INSERT."""
+        if matches:
+            rows = [self._to_row(match) for match in matches]
+            self.session.execute(insert(ListingMatchDB), rows)
+        return list(matches)
+
     def get_by_id(self, match_id: UUID | str) -> ListingMatch | None:
         """Get a listing match by ID."""
-        stmt = select(ListingMatchDB).where(ListingMatchDB.id == str(match_id))
-        db_item = self.session.execute(stmt).scalar_one_or_none()
+        db_item = self.session.get(ListingMatchDB, str(match_id))
         return self._to_domain(db_item) if db_item else None
 
     def get_by_listing_id(self, listing_id: UUID | str) -> list[ListingMatch]:
@@ -912,8 +1680,30 @@ class ListingMatchRepository:
             .where(ListingMatchDB.listing_id == str(listing_id))
             .order_by(ListingMatchDB.confidence.desc())
         )
-        result = self.session.execute(stmt).scalars().all()
-        return [self._to_domain(m) for m in result]
+        result = self.session.execute(_guard_lazy_loads(stmt)).scalars().all()
+        return [self._to_domain(match) for match in result]
+
+    def get_by_listing_id_many(
+        self, listing_ids: list[UUID | str]
+    ) -> dict[UUID, list[ListingMatch]]:
+        """
+        Get matches for many listings in a single query.
+
+        Returns a dict keyed by listing ID, each list ordered by confidence
+        (highest first); listings with no matches are absent from the result.
+        """
+        if not listing_ids:
+            return {}
+        stmt = (
+            select(ListingMatchDB)
+            .where(ListingMatchDB.listing_id.in_({str(i) for i in listing_ids}))
+            .order_by(ListingMatchDB.confidence.desc())
+        )
+        matches: dict[UUID, list[ListingMatch]] = {}
+        for row in self.session.execute(_guard_lazy_loads(stmt)).scalars():
+            match = self._to_domain(row)
+            matches.setdefault(match.listing_id, []).append(match)
+        return matches
 
     def get_by_entity(self, entity_type: str, entity_id: UUID | str) -> list[ListingMatch]:
         """Get all matches for an entity."""
@@ -925,8 +1715,8 @@ class ListingMatchRepository:
             )
             .order_by(ListingMatchDB.confidence.desc())
         )
-        result = self.session.execute(stmt).scalars().all()
-        return [self._to_domain(m) for m in result]
+        result = self.session.execute(_guard_lazy_loads(stmt)).scalars().all()
+        return [self._to_domain(match) for match in result]
 
     def get_pending_review(self, min_confidence: float = 0.7, max_confidence: float = 0.9) -> list[ListingMatch]:
         """Get matches pending manual review (auto matches in confidence range)."""
@@ -939,31 +1729,40 @@ class ListingMatchRepository:
             )
             .order_by(ListingMatchDB.confidence.desc())
         )
-        result = self.session.execute(stmt).scalars().all()
-        return [self._to_domain(m) for m in result]
+        result = self.session.execute(_guard_lazy_loads(stmt)).scalars().all()
+        return [self._to_domain(match) for match in result]
 
     def update_decision(self, match_id: UUID | str, decision: str) -> ListingMatch | None:
         """Update match decision."""
-        stmt = select(ListingMatchDB).where(ListingMatchDB.id == str(match_id))
-        db_item = self.session.execute(stmt).scalar_one_or_none()
-        if db_item is None:
-            return None
-        db_item.decision = decision
-        self.session.flush()
-        return self._to_domain(db_item)
+        db_item = _update_by_id(
+            self.session, ListingMatchDB, match_id, {"decision": decision}
+        )
+        return self._to_domain(db_item) if db_item else None
+
+    def _to_row(self, match: ListingMatch) -> dict[str, Any]:
+        """Convert domain model to DB column values."""
+        return {
+            "id": str(match.id),
+            "listing_id": str(match.listing_id),
+            "entity_type": match.entity_type.value,
+            "entity_id": str(match.entity_id),
+            "confidence": match.confidence,
+            "decision": match.decision.value,
+            "created_at": match.created_at,
+        }
 
     def _to_domain(self, db_item: ListingMatchDB) -> ListingMatch:
         """Convert DB model to domain model."""
-        from wine_agent.core.schema_canonical import EntityType, MatchDecision
-
-        return ListingMatch(
-            id=UUID(db_item.id),
-            listing_id=UUID(db_item.listing_id),
-            entity_type=EntityType(db_item.entity_type),
-            entity_id=UUID(db_item.entity_id),
-            confidence=db_item.confidence,
-            decision=MatchDecision(db_item.decision),
-            created_at=db_item.created_at,
+        return ListingMatch.model_validate(
+            {
+                "id": db_item.id,
+                "listing_id": db_item.listing_id,
+                "entity_type": EntityType(db_item.entity_type),
+                "entity_id": db_item.entity_id,
+                "confidence": db_item.confidence,
+                "decision": MatchDecision(db_item.decision),
+                "created_at": db_item.created_at,
+            }
         )
 
 
@@ -980,24 +1779,18 @@ class FieldProvenanceRepository:
 
     def create(self, provenance: FieldProvenance) -> FieldProvenance:
         """Create a new field provenance record."""
-        db_item = FieldProvenanceDB(
-            id=str(provenance.id),
-            entity_type=provenance.entity_type.value,
-            entity_id=str(provenance.entity_id),
-            field_path=provenance.field_path,
-            value_json=json.dumps(provenance.value),
-            source_id=str(provenance.source_id),
-            source_url=provenance.source_url,
-            fetched_at=provenance.fetched_at,
-            extractor_version=provenance.extractor_version,
-            confidence=provenance.confidence,
-            snapshot_id=str(provenance.snapshot_id) if provenance.snapshot_id else None,
-            created_at=provenance.created_at,
+        db_item = _insert_returning(
+            self.session, FieldProvenanceDB, self._to_row(provenance)
         )
-        self.session.add(db_item)
-        self.session.flush()
         return self._to_domain(db_item)
 
+    def bulk_create(self, provenances: list[FieldProvenance]) -> list[FieldProvenance]:
+        """Create many field provenance records with a single executemany INSERT."""
+        if provenances:
+            rows = [self._to_row(provenance) for provenance in provenances]
+            self.session.execute(insert(FieldProvenanceDB), rows)
+        return list(provenances)
+
     def get_by_entity(self, entity_type: str, entity_id: UUID | str) -> list[FieldProvenance]:
         """Get all provenance records for an entity."""
         stmt = (
@@ -1008,7 +1801,7 @@ class FieldProvenanceRepository:
             )
             .order_by(FieldProvenanceDB.field_path, FieldProvenanceDB.confidence.desc())
         )
-        result = self.session.execute(stmt).scalars().all()
+        result = self.session.execute(_guard_lazy_loads(stmt)).scalars().all()
         return [self._to_domain(p) for p in result]
 
     def get_by_field(self, entity_type: str, entity_id: UUID | str, field_path: str) -> list[FieldProvenance]:
@@ -1022,24 +1815,41 @@ class FieldProvenanceRepository:
             )
             .order_by(FieldProvenanceDB.confidence.desc())
         )
-        result = self.session.execute(stmt).scalars().all()
+        result = self.session.execute(_guard_lazy_loads(stmt)).scalars().all()
         return [self._to_domain(p) for p in result]
 
+    def _to_row(self, provenance: FieldProvenance) -> dict[str, Any]:
+        """Convert domain model to DB column values."""
+        return {
+            "id": str(provenance.id),
+            "entity_type": provenance.entity_type.value,
+            "entity_id": str(provenance.entity_id),
+            "field_path": provenance.field_path,
+            "value_json": _dumps(provenance.value),
+            "source_id": str(provenance.source_id),
+            "source_url": provenance.source_url,
+            "fetched_at": provenance.fetched_at,
+            "extractor_version": provenance.extractor_version,
+            "confidence": provenance.confidence,
+            "snapshot_id": str(provenance.snapshot_id) if provenance.snapshot_id else None,
+            "created_at": provenance.created_at,
+        }
+
     def _to_domain(self, db_item: FieldProvenanceDB) -> FieldProvenance:
         """Convert DB model to domain model."""
-        from wine_agent.core.schema_canonical import EntityType
-
-        return FieldProvenance(
-            id=UUID(db_item.id),
-            entity_type=EntityType(db_item.entity_type),
-            entity_id=UUID(db_item.entity_id),
-            field_path=db_item.field_path,
-            value=json.loads(db_item.value_json),
-            source_id=UUID(db_item.source_id),
-            source_url=db_item.source_url,
-            fetched_at=db_item.fetched_at,
-            extractor_version=db_item.extractor_version,
-            confidence=db_item.confidence,
-            snapshot_id=UUID(db_item.snapshot_id) if db_item.snapshot_id else None,
-            created_at=db_item.created_at,
+        return FieldProvenance.model_validate(
+            {
+                "id": db_item.id,
+                "entity_type": EntityType(db_item.entity_type),
+                "entity_id": db_item.entity_id,
+                "field_path": db_item.field_path,
+                "value": _loads(db_item.value_json),
+                "source_id": db_item.source_id,
+                "source_url": db_item.source_url,
+                "fetched_at": db_item.fetched_at,
+                "extractor_version": db_item.extractor_version,
+                "confidence": db_item.confidence,
+                "snapshot_id": db_item.snapshot_id,
+                "created_at": db_item.created_at,
+            }
         )
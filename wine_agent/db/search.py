@@ -1,13 +1,70 @@
 """Search repository with FTS5 full-text search and filters."""
 
-import json
+import time
+import weakref
+from collections.abc import Iterator
 from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
 from uuid import UUID
 
-from sqlalchemy import text
-from sqlalchemy.orm import Session
+from sqlalchemy import DateTime, bindparam, event, text
+from sqlalchemy.orm import Session, SessionTransaction, object_session
+from sqlalchemy.sql.elements import TextClause
 
 from wine_agent.core.schema import TastingNote
+from wine_agent.db.models import TastingNoteDB
+
+# Characters with special meaning in FTS5 query syntax, mapped to spaces
+_FTS_SPECIAL_CHARS = str.maketrans(dict.fromkeys("\"'()*:-^", " "))
+
+# (kind, value) rows for get_filter_options, sorted by kind then value
+_FILTER_OPTIONS_SQL = text("""
+    SELECT DISTINCT 'regions', region FROM tasting_notes WHERE region != ''
+    UNION ALL
+    SELECT DISTINCT 'countries', country FROM tasting_notes WHERE country != ''
+    UNION ALL
+    SELECT DISTINCT 'producers', producer FROM tasting_notes WHERE producer != ''
+    UNION ALL
+    SELECT DISTINCT 'grapes', grape FROM tasting_note_grapes
+    ORDER BY 1, 2
+""")
+
+
+# Filter options change only when notes are written, so they are cached per
+# engine for a minute. ORM writes to TastingNoteDB (via mapper events) and
+# TastingNoteRepository.update mark the session; it then reads the options
+# uncached, and the entry is dropped when its transaction commits or rolls
+# back. Other writes become visible once the TTL expires.
+FILTER_OPTIONS_CACHE_TTL_SECONDS = 60.0
+_filter_options_cache: weakref.WeakKeyDictionary[Any, tuple[float, dict]] = (
+    weakref.WeakKeyDictionary()
+)
+
+# Session.info key set while a session's transaction has written notes
+_NOTES_CHANGED = "wine_agent.notes_changed"
+
+
+def invalidate_filter_options(session: Session) -> None:
+    """Drop the cached filter options once the session's transaction ends."""
+    session.info[_NOTES_CHANGED] = True
+
+
+@event.listens_for(TastingNoteDB, "after_insert")
+@event.listens_for(TastingNoteDB, "after_update")
+@event.listens_for(TastingNoteDB, "after_delete")
+def _on_note_write(mapper: Any, connection: Any, target: TastingNoteDB) -> None:
+    """Invalidate filter options when the unit of work writes a note."""
+    session = object_session(target)
+    if session is not None:
+        invalidate_filter_options(session)
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _on_transaction_end(session: Session, transaction: SessionTransaction) -> None:
+    """Drop the cached filter options after a transaction that wrote notes."""
+    if transaction.parent is None and session.info.pop(_NOTES_CHANGED, False):
+        _filter_options_cache.pop(session.get_bind(), None)
 
 
 @dataclass
@@ -25,16 +82,26 @@ class SearchFilters:
     vintage_max: int | None = None
     drink_or_hold: str | None = None
     status: str = "published"
+    # (updated_at, id) of the last note already seen; when set, search seeks
+    # past it instead of skipping OFFSET rows
+    cursor: tuple[datetime, str] | None = None
 
 
 @dataclass
 class SearchResult:
-    """Result of a search query."""
+    """
+    Result of a search query.
+
+    In cursor mode, offset is always 0 and total_count counts the matches
+    from the cursor onward, so has_more stays accurate.
+    """
 
     notes: list[TastingNote] = field(default_factory=list)
     total_count: int = 0
     limit: int = 50
     offset: int = 0
+    # Pass as SearchFilters.cursor to fetch the next page; None on the last page
+    next_cursor: tuple[datetime, str] | None = None
 
     @property
     def has_more(self) -> bool:
@@ -71,20 +138,116 @@ class SearchRepository:
         """
         Search tasting notes with full-text search and filters.
 
+        When filters.cursor is set, offset is ignored and the page starts
+        right after the cursor, which costs the same at any depth. Pass
+        the returned next_cursor back to fetch the following page.
+
         Args:
             filters: Search filters to apply.
             limit: Maximum number of results to return.
-            offset: Number of results to skip.
+            offset: Number of results to skip (ignored in cursor mode).
 
         Returns:
             SearchResult with matching notes and pagination info.
         """
-        if filters is None:
-            filters = SearchFilters()
+        filters = filters or SearchFilters()
+        from_where, params = self._build_from_where(filters)
+        if filters.cursor is not None:
+            offset = 0
+
+        # COUNT(*) OVER () is evaluated before LIMIT/OFFSET, so every row
+        # carries the total match count and no separate COUNT query is needed
+        sql = f"""
+            SELECT tn.note_json, tn.updated_at, tn.id,
+                   COUNT(*) OVER () AS total_count
+            {from_where}
+            ORDER BY tn.updated_at DESC, tn.id DESC
+            LIMIT :limit OFFSET :offset
+        """
+
+        params["limit"] = limit
+        params["offset"] = offset
+
+        # Execute query; pydantic parses each note's JSON as rows stream in
+        stmt = self._text(sql, params).columns(updated_at=DateTime)
+        result = self.session.execute(stmt, params).yield_per(200)
+        notes = []
+        total_count = 0
+        last_key = None
+        for row in result:
+            total_count = row.total_count
+            last_key = (row.updated_at, row.id)
+            notes.append(TastingNote.model_validate_json(row.note_json))
+
+        # An empty page (past the end, or limit=0) carries no total; count it
+        if not notes and (offset > 0 or limit == 0):
+            count_sql = f"SELECT COUNT(*) {from_where}"
+            total_count = (
+                self.session.execute(self._text(count_sql, params), params).scalar()
+                or 0
+            )
+
+        search_result = SearchResult(
+            notes=notes,
+            total_count=total_count,
+            limit=limit,
+            offset=offset,
+        )
+        if search_result.has_more:
+            search_result.next_cursor = last_key
+        return search_result
+
+    def iter_notes(
+        self,
+        filters: SearchFilters | None = None,
+        chunk: int = 200,
+    ) -> Iterator[TastingNote]:
+        """
+        Iterate over every tasting note matching the filters.
 
+        Preferred over search() for bulk consumers: rows are fetched chunk at
+        a time and parsed lazily, so memory stays bounded regardless of the
+        number of matches. No pagination or total count is computed.
+
+        Args:
+            filters: Search filters to apply.
+            chunk: Number of rows fetched from the database at a time.
+
+        Yields:
+            Matching notes, most recently updated first.
+        """
+        from_where, params = self._build_from_where(filters or SearchFilters())
+        sql = f"""
+            SELECT tn.note_json {from_where}
+            ORDER BY tn.updated_at DESC, tn.id DESC
+        """
+
+        stmt = self._text(sql, params)
+        for row in self.session.execute(stmt, params).yield_per(chunk):
+            yield TastingNote.model_validate_json(row[0])
+
+    @staticmethod
+    def _text(sql: str, params: dict[str, Any]) -> TextClause:
+        """Build a text() statement, typing the cursor timestamp if bound."""
+        stmt = text(sql)
+        if "cursor_ts" in params:
+            # Bind through DateTime so the value is stored-format text on SQLite
+            stmt = stmt.bindparams(bindparam("cursor_ts", type_=DateTime))
+        return stmt
+
+    def _build_from_where(self, filters: SearchFilters) -> tuple[str, dict[str, Any]]:
+        """
+        Build the FROM/WHERE clause and bound parameters for the filters.
+
+        Args:
+            filters: Search filters to apply.
+
+        Returns:
+            Tuple of (SQL fragment starting at FROM, parameters).
+        """
         # Build the WHERE clause conditions
         conditions = []
-        params: dict = {}
+        params: dict[str, Any] = {}
 
         # Status filter (always applied)
         if filters.status and filters.status != "all":
@@ -136,27 +299,18 @@ class SearchRepository:
             )
             params["drink_or_hold"] = filters.drink_or_hold
 
-        # Build the base query
-        if filters.query:
-            # Use FTS5 for text search
-            fts_query = self._build_fts_query(filters.query)
-            params["fts_query"] = fts_query
+        # Keyset cursor: rows strictly after the last one seen in
+        # (updated_at DESC, id DESC) order
+        if filters.cursor is not None:
+            conditions.append("(tn.updated_at, tn.id) < (:cursor_ts, :cursor_id)")
+            params["cursor_ts"], params["cursor_id"] = filters.cursor
 
-            where_clause = " AND ".join(conditions) if conditions else "1=1"
+        where_clause = " AND ".join(conditions) if conditions else "1=1"
 
-            # Query with FTS join
-            sql = f"""
-                SELECT tn.note_json
-                FROM tasting_notes tn
-                INNER JOIN tasting_notes_fts fts ON tn.id = fts.note_id
-                WHERE fts.tasting_notes_fts MATCH :fts_query
-                AND {where_clause}
-                ORDER BY tn.updated_at DESC
-                LIMIT :limit OFFSET :offset
-            """
-
-            count_sql = f"""
-                SELECT COUNT(*)
+        if filters.query:
+            # Use FTS5 for text search
+            params["fts_query"] = self._build_fts_query(filters.query)
+            from_where = f"""
                 FROM tasting_notes tn
                 INNER JOIN tasting_notes_fts fts ON tn.id = fts.note_id
                 WHERE fts.tasting_notes_fts MATCH :fts_query
@@ -164,44 +318,12 @@ class SearchRepository:
             """
         else:
             # No text search, just filters
-            where_clause = " AND ".join(conditions) if conditions else "1=1"
-
-            sql = f"""
-                SELECT tn.note_json
-                FROM tasting_notes tn
-                WHERE {where_clause}
-                ORDER BY tn.updated_at DESC
-                LIMIT :limit OFFSET :offset
-            """
-
-            count_sql = f"""
-                SELECT COUNT(*)
+            from_where = f"""
                 FROM tasting_notes tn
                 WHERE {where_clause}
             """
 
-        params["limit"] = limit
-        params["offset"] = offset
-
-        # Execute queries
-        result = self.session.execute(text(sql), params)
-        rows = result.fetchall()
-
-        count_result = self.session.execute(text(count_sql), params)
-        total_count = count_result.scalar() or 0
-
-        # Parse notes from JSON
-        notes = []
-        for row in rows:
-            note_data = json.loads(row[0])
-            notes.append(TastingNote.model_validate(note_data))
-
-        return SearchResult(
-            notes=notes,
-            total_count=total_count,
-            limit=limit,
-            offset=offset,
-        )
+        return from_where, params
 
     def _build_fts_query(self, query: str) -> str:
         """
@@ -215,22 +337,14 @@ class SearchRepository:
         Returns:
             FTS5-compatible query string.
         """
-        # Clean and escape the query
-        # Remove FTS special characters that could cause issues
-        cleaned = query.strip()
-        special_chars = ['"', "'", "(", ")", "*", ":", "-", "^"]
-        for char in special_chars:
-            cleaned = cleaned.replace(char, " ")
-
-        # Split into words and create prefix search for each
-        words = cleaned.split()
+        # Replace FTS special characters that could cause issues with spaces
+        words = query.translate(_FTS_SPECIAL_CHARS).split()
         if not words:
             return '""'
 
         # Use prefix search for partial matching
         # Each word gets a * suffix for prefix matching
-        terms = [f'"{word}"*' for word in words if word]
-        return " ".join(terms)
+        return '"' + '"* "'.join(words) + '"*'
 
     def get_filter_options(self) -> dict:
         """
@@ -245,48 +359,28 @@ class SearchRepository:
         Returns:
             Dictionary of filter options.
         """
-        options: dict = {
-            "regions": [],
-            "countries": [],
-            "producers": [],
-            "grapes": [],
-        }
-
-        # Get unique regions
-        result = self.session.execute(
-            text(
-                "SELECT DISTINCT region FROM tasting_notes WHERE region != '' ORDER BY region"
-            )
-        )
-        options["regions"] = [row[0] for row in result.fetchall()]
-
-        # Get unique countries
-        result = self.session.execute(
-            text(
-                "SELECT DISTINCT country FROM tasting_notes WHERE country != '' ORDER BY country"
-            )
-        )
-        options["countries"] = [row[0] for row in result.fetchall()]
-
-        # Get unique producers
-        result = self.session.execute(
-            text(
-                "SELECT DISTINCT producer FROM tasting_notes WHERE producer != '' ORDER BY producer"
-            )
-        )
-        options["producers"] = [row[0] for row in result.fetchall()]
-
-        # Get unique grapes (from JSON arrays)
-        result = self.session.execute(
-            text("SELECT DISTINCT grapes_json FROM tasting_notes WHERE grapes_json != '[]'")
-        )
-        all_grapes = set()
-        for row in result.fetchall():
-            try:
-                grapes = json.loads(row[0])
-                all_grapes.update(grapes)
-            except (json.JSONDecodeError, TypeError):
-                pass
-        options["grapes"] = sorted(list(all_grapes))
-
-        return options
+        bind = self.session.get_bind()
+        now = time.monotonic()
+        # Notes written in this transaction may not be committed yet
+        cacheable = not self.session.info.get(_NOTES_CHANGED, False)
+        cached = _filter_options_cache.get(bind) if cacheable else None
+        if cached is None or now - cached[0] >= FILTER_OPTIONS_CACHE_TTL_SECONDS:
+            options: dict = {
+                "regions": [],
+                "countries": [],
+                "producers": [],
+                "grapes": [],
+            }
+
+            # One round-trip for all four lists; grapes come from the indexed
+            # tasting_note_grapes lookup instead of decoding every grapes_json
+            result = self.session.execute(_FILTER_OPTIONS_SQL)
+            for kind, value in result:
+                options[kind].append(value)
+
+            cached = (now, options)
+            if cacheable:
+                _filter_options_cache[bind] = cached
+
+        # Copy the lists so callers can't mutate the cached entry
+        return {kind: list(values) for kind, values in cached[1].items()}
@@ -11,17 +11,17 @@ Adapters are responsible for:
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
-from decimal import Decimal
+from dataclasses import dataclass, field, fields
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ExtractedField:
     """
     A field extracted from source content with confidence metadata.
 
     Tracks how the field was extracted for debugging and quality assessment.
+    Immutable, so one instance may be shared between listings.
     """
 
     field_name: str
@@ -35,7 +35,7 @@ class ExtractedField:
             raise ValueError(f"Confidence must be between 0.0 and 1.0, got {self.confidence}")
 
 
-@dataclass
+@dataclass(slots=True)
 class ExtractedListing:
     """
     Structured wine listing extracted from a source page.
@@ -129,29 +129,31 @@ class ExtractedListing:
         }
 
         # Add extracted fields with their metadata
-        field_names = [
-            "producer_name", "wine_name", "vintage_year", "region", "sub_region",
-            "appellation", "country", "grapes", "color", "style", "abv",
-            "bottle_size_ml", "price", "currency", "price_per_bottle",
-            "in_stock", "quantity_available", "critic_scores", "description",
-            "tasting_notes", "sku", "upc",
-        ]
-
-        for field_name in field_names:
-            field_obj = getattr(self, field_name, None)
-            if field_obj is not None:
-                if isinstance(field_obj, ExtractedField):
-                    result[field_name] = {
-                        "value": field_obj.value,
-                        "confidence": field_obj.confidence,
-                        "method": field_obj.extractor_method,
-                    }
-                else:
-                    result[field_name] = field_obj
+        for field_name in _EXTRACTED_FIELD_NAMES:
+            field_obj = getattr(self, field_name)
+            if field_obj is None:
+                continue
+            if isinstance(field_obj, ExtractedField):
+                result[field_name] = {
+                    "value": field_obj.value,
+                    "confidence": field_obj.confidence,
+                    "method": field_obj.extractor_method,
+                }
+            else:
+                result[field_name] = field_obj
 
         return result
 
 
+# ExtractedListing attributes holding ExtractedField values, in declaration
+# order; derived once so to_dict follows the dataclass definition
+_EXTRACTED_FIELD_NAMES: tuple[str, ...] = tuple(
+    f.name
+    for f in fields(ExtractedListing)
+    if f.name not in {"url", "source_name", "title", "raw_jsonld", "extraction_errors"}
+)
+
+
 class BaseAdapter(ABC):
     """
     Abstract base class for source-specific adapters.
@@ -252,8 +254,9 @@ class BaseAdapter(ABC):
         price = listing.get_value("price")
         if price is not None:
             try:
-                price_val = Decimal(str(price))
-                if price_val <= 0:
+                # A float compare suffices; "not > 0" also rejects NaN
+                price_val = float(price)
+                if not price_val > 0:
                     errors.append(f"Invalid price: {price}")
             except Exception:
                 errors.append(f"Invalid price format: {price}")
@@ -8,9 +8,11 @@ Provides synthetic wine data for testing the full ingestion flow.
 
 from __future__ import annotations
 
-import json
+from dataclasses import replace
 from typing import Any
 
+import orjson
+
 from wine_agent.ingestion.adapters.base import (
     BaseAdapter,
     ExtractedField,
@@ -293,6 +295,28 @@ TEST_WINES: list[dict[str, Any]] = [
 ]
 
 
+# (listing field, test wine key, required) in extraction order; required keys
+# must be present in the wine data, optional ones are skipped when empty
+_FIELD_MAP: tuple[tuple[str, str, bool], ...] = (
+    ("producer_name", "producer", True),
+    ("wine_name", "wine", True),
+    ("vintage_year", "vintage", False),
+    ("region", "region", True),
+    ("sub_region", "sub_region", False),
+    ("appellation", "appellation", False),
+    ("country", "country", True),
+    ("grapes", "grapes", True),
+    ("color", "color", True),
+    ("style", "style", True),
+    ("abv", "abv", True),
+    ("bottle_size_ml", "bottle_size_ml", True),
+    ("price", "price", True),
+    ("currency", "currency", True),
+    ("in_stock", "in_stock", True),
+    ("description", "description", True),
+)
+
+
 class TestAdapter(BaseAdapter):
     """
     Test adapter that returns synthetic wine data.
@@ -310,19 +334,29 @@ class TestAdapter(BaseAdapter):
 
     def __init__(self, config: dict[str, Any] | None = None) -> None:
         super().__init__(config)
-        self._wines = TEST_WINES.copy()
-
-        # Allow custom test data via config
+        # Allow custom test data via config; the wine list is only read, so
+        # the module-level data is used without copying
+        self._wines = TEST_WINES
         if config and "test_wines" in config:
             self._wines = config["test_wines"]
 
+        # Product URLs are fixed by the wine list, so build them once
+        self._urls = tuple(f"{self.BASE_URL}/{i}" for i in range(len(self._wines)))
+
+        # Extracted listing per wine index, built on first extraction
+        self._listings: dict[int, ExtractedListing] = {}
+
+        # Shared ExtractedField per (field, value type, value); values such as
+        # currency and color repeat across wines
+        self._fields: dict[tuple[str, type, Any], ExtractedField] = {}
+
     def discover_urls(self, seed_urls: list[str] | None = None) -> list[str]:
         """
         Return URLs for all test wines.
 
         Each wine gets a URL like: https://test.wineagent.local/wines/0
         """
-        return [f"{self.BASE_URL}/{i}" for i in range(len(self._wines))]
+        return list(self._urls)
 
     def extract_listing(
         self,
@@ -333,157 +367,85 @@ class TestAdapter(BaseAdapter):
         """
         Extract wine data from test content.
 
-        The content is expected to be JSON with a wine index.
-        Falls back to parsing the URL for the index.
+        The wine index is read from the URL's last path segment, which
+        get_test_content always mirrors. Falls back to the JSON content's
+        index when the URL does not end in a valid index.
         """
-        # Try to parse content as JSON
-        wine_data = None
-        try:
-            data = json.loads(content)
-            if isinstance(data, dict) and "index" in data:
-                idx = data["index"]
-                if 0 <= idx < len(self._wines):
-                    wine_data = self._wines[idx]
-        except (json.JSONDecodeError, KeyError):
-            pass
-
-        # Fall back to URL parsing
-        if wine_data is None:
+        # Try the URL tail first; it avoids parsing the content at all
+        wine_index = None
+        tail = url.rsplit("/", 1)[-1]
+        if tail.isdecimal():
+            idx = int(tail)
+            if idx < len(self._wines):
+                wine_index = idx
+
+        # Fall back to parsing content as JSON; only a JSON object can carry
+        # an index, so anything else is skipped without raising
+        if wine_index is None and content.lstrip()[:1] == b"{":
             try:
-                idx = int(url.split("/")[-1])
-                if 0 <= idx < len(self._wines):
-                    wine_data = self._wines[idx]
-            except (ValueError, IndexError):
-                return None
-
-        if wine_data is None:
+                data = orjson.loads(content)
+                if isinstance(data, dict) and "index" in data:
+                    idx = data["index"]
+                    if 0 <= idx < len(self._wines):
+                        wine_index = idx
+            except (orjson.JSONDecodeError, KeyError):
+                pass
+
+        if wine_index is None:
             return None
 
-        # Build extracted listing
+        # Listings are built once per wine and copied, so callers never
+        # share one instance
+        template = self._listings.get(wine_index)
+        if template is None:
+            template = self._build_listing(self._wines[wine_index])
+            self._listings[wine_index] = template
+
+        return replace(template, url=url, extraction_errors=[])
+
+    def _build_listing(self, wine_data: dict[str, Any]) -> ExtractedListing:
+        """Build the extracted listing for one test wine."""
+        vintage = wine_data.get("vintage")
         listing = ExtractedListing(
-            url=url,
+            url="",
             source_name="test-wines",
-            title=f"{wine_data['producer']} {wine_data['wine']} {wine_data.get('vintage', 'NV')}",
+            title=f"{wine_data['producer']} {wine_data['wine']} {vintage or 'NV'}",
         )
 
         # Map wine data to extracted fields with high confidence
         # (since this is test data, we know it's accurate)
-        listing.producer_name = ExtractedField(
-            field_name="producer_name",
-            value=wine_data["producer"],
-            confidence=1.0,
-            extractor_method="manual",
-        )
-
-        listing.wine_name = ExtractedField(
-            field_name="wine_name",
-            value=wine_data["wine"],
-            confidence=1.0,
-            extractor_method="manual",
-        )
-
-        if wine_data.get("vintage"):
-            listing.vintage_year = ExtractedField(
-                field_name="vintage_year",
-                value=wine_data["vintage"],
-                confidence=1.0,
-                extractor_method="manual",
-            )
-
-        listing.region = ExtractedField(
-            field_name="region",
-            value=wine_data["region"],
-            confidence=1.0,
-            extractor_method="manual",
-        )
+        for field_name, key, required in _FIELD_MAP:
+            if required:
+                value = wine_data[key]
+            else:
+                value = wine_data.get(key)
+                if not value:
+                    continue
+            setattr(listing, field_name, self._get_field(field_name, value))
 
-        if wine_data.get("sub_region"):
-            listing.sub_region = ExtractedField(
-                field_name="sub_region",
-                value=wine_data["sub_region"],
-                confidence=1.0,
-                extractor_method="manual",
-            )
+        return listing
 
-        if wine_data.get("appellation"):
-            listing.appellation = ExtractedField(
-                field_name="appellation",
-                value=wine_data["appellation"],
+    def _get_field(self, field_name: str, value: Any) -> ExtractedField:
+        """Return the shared extracted field for a value, creating it once."""
+        key = (field_name, type(value), value)
+        shared = True
+        try:
+            extracted = self._fields.get(key)
+        except TypeError:
+            # Unhashable values (e.g. grape lists) are not shared
+            shared = False
+            extracted = None
+
+        if extracted is None:
+            extracted = ExtractedField(
+                field_name=field_name,
+                value=value,
                 confidence=1.0,
                 extractor_method="manual",
             )
-
-        listing.country = ExtractedField(
-            field_name="country",
-            value=wine_data["country"],
-            confidence=1.0,
-            extractor_method="manual",
-        )
-
-        listing.grapes = ExtractedField(
-            field_name="grapes",
-            value=wine_data["grapes"],
-            confidence=1.0,
-            extractor_method="manual",
-        )
-
-        listing.color = ExtractedField(
-            field_name="color",
-            value=wine_data["color"],
-            confidence=1.0,
-            extractor_method="manual",
-        )
-
-        listing.style = ExtractedField(
-            field_name="style",
-            value=wine_data["style"],
-            confidence=1.0,
-            extractor_method="manual",
-        )
-
-        listing.abv = ExtractedField(
-            field_name="abv",
-            value=wine_data["abv"],
-            confidence=1.0,
-            extractor_method="manual",
-        )
-
-        listing.bottle_size_ml = ExtractedField(
-            field_name="bottle_size_ml",
-            value=wine_data["bottle_size_ml"],
-            confidence=1.0,
-            extractor_method="manual",
-        )
-
-        listing.price = ExtractedField(
-            field_name="price",
-            value=wine_data["price"],
-            confidence=1.0,
-            extractor_method="manual",
-        )
-
-        listing.currency = ExtractedField(
-            field_name="currency",
-            value=wine_data["currency"],
-            confidence=1.0,
-            extractor_method="manual",
-        )
-
-        listing.in_stock = ExtractedField(
-            field_name="in_stock",
-            value=wine_data["in_stock"],
-            confidence=1.0,
-            extractor_method="manual",
-        )
-
-        listing.description = ExtractedField(
-            field_name="description",
-            value=wine_data["description"],
-            confidence=1.0,
-            extractor_method="manual",
-        )
-
-        return listing
+            if shared:
+                self._fields[key] = extracted
+        return extracted
 
     def get_test_content(self, index: int) -> bytes:
         """
@@ -491,4 +453,4 @@ class TestAdapter(BaseAdapter):
 
         This is used by the test crawler to simulate fetching.
         """
-        return json.dumps({"index": index}).encode("utf-8")
+        return orjson.dumps({"index": index})
@@ -11,22 +11,93 @@ from __future__ import annotations
 import asyncio
 import hashlib
 import logging
+import random
+import sys
 import time
+from collections import OrderedDict, deque
+from collections.abc import AsyncGenerator, Iterable, Mapping
 from dataclasses import dataclass, field
-from datetime import datetime
-from typing import TYPE_CHECKING
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING, Any
 from urllib.parse import urlparse
 from urllib.robotparser import RobotFileParser
 
 import httpx
 
+try:
+    import h2  # noqa: F401
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
 if TYPE_CHECKING:
     from wine_agent.ingestion.registry import SourceConfig
 
 logger = logging.getLogger(__name__)
 
-
-@dataclass
+# Connection pool limits for the crawler's shared HTTP client
+HTTP_LIMITS = httpx.Limits(
+    max_keepalive_connections=50,
+    max_connections=100,
+    keepalive_expiry=30.0,
+)
+
+# Bytes read per iteration when streaming a response body
+STREAM_CHUNK_SIZE = 65536
+
+# URLs whose ETag/Last-Modified validators are kept for conditional requests
+VALIDATOR_CACHE_SIZE = 10_000
+
+# Domains whose robots.txt is cached, and how long entries stay fresh. A
+# Cache-Control max-age on the response overrides the default TTL, up to the
+# 24 hour limit of RFC 9309. Fetch failures and server errors are retried
+# sooner than definitive answers.
+ROBOTS_CACHE_SIZE = 10_000
+ROBOTS_CACHE_TTL_SECONDS = 3600.0
+ROBOTS_MAX_TTL_SECONDS = 86400.0
+ROBOTS_ERROR_TTL_SECONDS = 60.0
+
+# URLs whose robots.txt allow/deny decision is remembered per user agent
+ROBOTS_DECISION_CACHE_SIZE = 100_000
+
+# Adaptive rate limiting: throttling responses (429/503) cut the rate by
+# RATE_BACKOFF_FACTOR, down to RATE_MIN_FRACTION of the configured rate; every
+# RATE_RECOVERY_STREAK consecutive successes raise it by RATE_RECOVERY_FACTOR,
+# never above the configured rate. Retry-After waits are capped.
+RATE_BACKOFF_FACTOR = 0.5
+RATE_MIN_FRACTION = 1 / 16
+RATE_RECOVERY_FACTOR = 1.1
+RATE_RECOVERY_STREAK = 10
+MAX_RETRY_AFTER_SECONDS = 300.0
+
+# Response statuses worth retrying; other 4xx responses are final
+RETRYABLE_STATUS_CODES = frozenset({408, 429, 500, 502, 503, 504})
+
+# Shared parser cached for every domain whose robots.txt blocks us entirely
+_DENY_ALL = RobotFileParser()
+_DENY_ALL.parse(["User-agent: *", "Disallow: /"])
+
+# robots.txt caches shared by every RobotsChecker in the process, one per user
+# agent: domain -> (parser or None to allow all, monotonic expiry time)
+_ROBOTS_CACHES: dict[str, OrderedDict[str, tuple[RobotFileParser | None, float]]] = {}
+
+# can_fetch results shared the same way: url -> (parser that decided, allowed).
+# A decision only counts while its parser is still the cached one for the
+# domain, so refreshing robots.txt invalidates it.
+_ROBOTS_DECISIONS: dict[str, OrderedDict[str, tuple[RobotFileParser, bool]]] = {}
+
+# Cache validators shared by every Crawler in the process, one store per user
+# agent, so a new crawler (one per ingestion job) still sends conditional
+# requests: url -> (etag, last_modified, content_hash, mime_type), least
+# recent first
+_VALIDATOR_CACHES: dict[
+    str, OrderedDict[str, tuple[str | None, str | None, str, str]]
+] = {}
+
+
+@dataclass(slots=True)
 class FetchResult:
     """Result of fetching a URL."""
 
@@ -38,89 +109,274 @@ class FetchResult:
     fetched_at: datetime
     is_duplicate: bool = False
     error: str | None = None
+    # Cache validators from the response, kept via Crawler.remember_validators
+    etag: str | None = None
+    last_modified: str | None = None
 
     @property
     def success(self) -> bool:
         """Check if fetch was successful."""
         return self.error is None and 200 <= self.status_code < 300
 
+    @property
+    def not_modified(self) -> bool:
+        """Check if the server reported the page unchanged since the last fetch."""
+        return self.error is None and self.status_code == 304
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """
+    Parse a Retry-After header into seconds to wait.
+
+    Args:
+        value: Header value, either delay-seconds or an HTTP date
+
+    Returns:
+        Seconds to wait (0 to MAX_RETRY_AFTER_SECONDS), or None if absent/invalid
+    """
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            when = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if when.tzinfo is None:
+            when = when.replace(tzinfo=UTC)
+        seconds = (when - datetime.now(UTC)).total_seconds()
+    return min(max(seconds, 0.0), MAX_RETRY_AFTER_SECONDS)
+
 
 class TokenBucket:
     """
     Token bucket rate limiter for per-domain rate limiting.
 
     Allows bursting up to burst_limit requests, then enforces
-    the steady-state rate of requests_per_second.
+    the steady-state rate of requests_per_second. The rate adapts to
+    server throttling reported through on_response, never exceeding the
+    configured rate.
     """
 
     def __init__(self, requests_per_second: float, burst_limit: int) -> None:
         self.requests_per_second = requests_per_second
+        self.max_requests_per_second = requests_per_second
         self.burst_limit = burst_limit
         self.tokens = float(burst_limit)
         self.last_update = time.monotonic()
-        self._lock = asyncio.Lock()
+        self._success_streak = 0
+
+    def _refill(self) -> None:
+        """Add tokens for the time elapsed since the last update."""
+        now = time.monotonic()
+        elapsed = now - self.last_update
+        self.last_update = now
+        self.tokens = min(
+            self.burst_limit, self.tokens + elapsed * self.requests_per_second
+        )
 
     async def acquire(self) -> None:
         """
         Acquire a token, waiting if necessary.
 
-        This method blocks until a token is available.
+        This method blocks until a token is available. Each caller reserves
+        its token up front (tokens may go negative, queueing later callers
+        behind it) and then sleeps until its slot, so waiters do not hold
+        each other up. The reservation never awaits, which makes it atomic
+        on the event loop without a lock.
+        """
+        # Add tokens based on elapsed time, then take one
+        self._refill()
+        self.tokens -= 1.0
+
+        if self.tokens < 0.0:
+            # Wait until the tokens reserved ahead of us have refilled
+            await asyncio.sleep(-self.tokens / self.requests_per_second)
+
+    def on_response(self, status_code: int, headers: Mapping[str, str]) -> None:
         """
-        async with self._lock:
-            now = time.monotonic()
-            elapsed = now - self.last_update
-            self.last_update = now
-
-            # Add tokens based on elapsed time
-            self.tokens = min(
-                self.burst_limit, self.tokens + elapsed * self.requests_per_second
+        Adapt the rate to a response from the rate-limited host.
+
+        Throttling responses (429/503) halve the rate and, when they carry
+        Retry-After, hold off the next request for that long. A streak of
+        successful responses gradually restores the configured rate.
+
+        Args:
+            status_code: HTTP status code of the response
+            headers: Response headers
+        """
+        if status_code in (429, 503):
+            self._success_streak = 0
+            self._refill()
+            self.requests_per_second = max(
+                self.requests_per_second * RATE_BACKOFF_FACTOR,
+                self.max_requests_per_second * RATE_MIN_FRACTION,
             )
+            retry_after = parse_retry_after(headers.get("retry-after"))
+            if retry_after:
+                # Owe enough tokens that refilling them takes retry_after
+                self.tokens = min(self.tokens, -retry_after * self.requests_per_second)
+        elif (
+            200 <= status_code < 300
+            and self.requests_per_second < self.max_requests_per_second
+        ):
+            self._success_streak += 1
+            if self._success_streak >= RATE_RECOVERY_STREAK:
+                self._success_streak = 0
+                self._refill()
+                self.requests_per_second = min(
+                    self.requests_per_second * RATE_RECOVERY_FACTOR,
+                    self.max_requests_per_second,
+                )
 
-            if self.tokens < 1.0:
-                # Need to wait for tokens
-                wait_time = (1.0 - self.tokens) / self.requests_per_second
-                await asyncio.sleep(wait_time)
-                self.tokens = 0.0
-            else:
-                self.tokens -= 1.0
+
+def _robots_rules(
+    parser: RobotFileParser, user_agent: str
+) -> list[tuple[str, bool]] | None:
+    """
+    Get the (path, allowed) rules a parser's can_fetch applies to a user agent.
+
+    RobotFileParser does not expose its parsed groups, so this is the one place
+    that reads its private entries. Returns None if they are not available,
+    in which case callers should keep using the parser itself.
+    """
+    entries: list[Any] | None = getattr(parser, "entries", None)
+    if entries is None:
+        return None
+    try:
+        # The same group can_fetch would pick: first matching agent, else "*"
+        entry = next(
+            (e for e in entries if e.applies_to(user_agent)),
+            getattr(parser, "default_entry", None),
+        )
+        if entry is None:
+            return []
+        return [(line.path, bool(line.allowance)) for line in entry.rulelines]
+    except AttributeError:
+        return None
 
 
 class RobotsChecker:
     """
     Robots.txt parser and cache.
 
-    Caches parsed robots.txt files per domain and checks
-    if URLs are allowed for crawling.
+    Caches parsed robots.txt files per domain (LRU with expiry) and checks
+    if URLs are allowed for crawling. The cache is shared by all checkers
+    with the same user agent, so later crawls start warm. Concurrent lookups
+    for a domain that is not cached share a single fetch; other domains are
+    not blocked.
     """
 
     def __init__(self, user_agent: str, timeout: float = 10.0) -> None:
         self.user_agent = user_agent
         self.timeout = timeout
-        self._cache: dict[str, RobotFileParser | None] = {}
-        self._lock = asyncio.Lock()
+        self._cache = _ROBOTS_CACHES.setdefault(user_agent, OrderedDict())
+        self._decisions = _ROBOTS_DECISIONS.setdefault(user_agent, OrderedDict())
+        self._inflight: dict[str, asyncio.Future[RobotFileParser | None]] = {}
+        self._client: httpx.AsyncClient | None = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the shared HTTP client, creating it on first use."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                headers={"User-Agent": self.user_agent},
+                limits=HTTP_LIMITS,
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client and its pooled connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
-    async def _fetch_robots(self, domain: str, scheme: str = "https") -> RobotFileParser | None:
-        """Fetch and parse robots.txt for a domain."""
+    async def _fetch_robots(
+        self, domain: str, scheme: str = "https"
+    ) -> tuple[RobotFileParser | None, float]:
+        """
+        Fetch and parse robots.txt for a domain.
+
+        Returns:
+            Tuple of (parser, or None to allow all; seconds to cache the result)
+        """
         robots_url = f"{scheme}://{domain}/robots.txt"
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(
-                    robots_url,
-                    headers={"User-Agent": self.user_agent},
-                    follow_redirects=True,
-                )
-
-                if response.status_code == 200:
-                    parser = RobotFileParser()
-                    parser.parse(response.text.splitlines())
-                    return parser
-                else:
-                    # No robots.txt or error - allow all
-                    return None
+            response = await self._get_client().get(robots_url, follow_redirects=True)
+
+            if response.status_code == 200:
+                parser = RobotFileParser()
+                parser.parse(response.text.splitlines())
+                return self._simplify(parser), self._cache_ttl(response)
+            elif response.status_code < 500:
+                # No robots.txt - allow all
+                return None, self._cache_ttl(response)
+            else:
+                # Server error - allow all, but check again soon
+                return None, ROBOTS_ERROR_TTL_SECONDS
         except Exception as e:
             logger.warning(f"Failed to fetch robots.txt for {domain}: {e}")
+            return None, ROBOTS_ERROR_TTL_SECONDS
+
+    def _cache_ttl(self, response: httpx.Response) -> float:
+        """Get how long to cache a robots.txt response, honoring max-age."""
+        for directive in response.headers.get("Cache-Control", "").split(","):
+            name, _, value = directive.strip().partition("=")
+            if name.lower() == "max-age" and value.strip().isdecimal():
+                # Never below the error TTL, so max-age=0 cannot force a
+                # robots.txt fetch before every page
+                return min(
+                    max(float(value), ROBOTS_ERROR_TTL_SECONDS),
+                    ROBOTS_MAX_TTL_SECONDS,
+                )
+        return ROBOTS_CACHE_TTL_SECONDS
+
+    def _simplify(self, parser: RobotFileParser) -> RobotFileParser | None:
+        """
+        Reduce a parsed robots.txt to a shared result when it is trivial.
+
+        Most files either allow everything or block everything for our user
+        agent; those are cached as None or the shared _DENY_ALL parser instead
+        of a parser per domain.
+        """
+        rules = _robots_rules(parser, self.user_agent)
+        if rules is None:
+            return parser
+        if all(allowed for _, allowed in rules):
             return None
+        # The first matching rule wins, and "Disallow: /" matches every path
+        path, allowed = rules[0]
+        if path == "/" and not allowed:
+            return _DENY_ALL
+        return parser
+
+    async def _load_robots(self, domain: str, scheme: str) -> RobotFileParser | None:
+        """Fetch robots.txt for a domain and cache the result."""
+        parser, ttl = await self._fetch_robots(domain, scheme)
+        self._cache[domain] = (parser, time.monotonic() + ttl)
+        self._cache.move_to_end(domain)
+        if len(self._cache) > ROBOTS_CACHE_SIZE:
+            self._cache.popitem(last=False)
+        return parser
+
+    async def _get_parser(self, domain: str, scheme: str) -> RobotFileParser | None:
+        """Get the robots.txt parser for a domain, fetching it if not cached."""
+        entry = self._cache.get(domain)
+        if entry is not None and entry[1] > time.monotonic():
+            self._cache.move_to_end(domain)
+            return entry[0]
+
+        # Concurrent misses for the same domain await one shared fetch
+        task = self._inflight.get(domain)
+        if task is None:
+            task = asyncio.ensure_future(self._load_robots(domain, scheme))
+            self._inflight[domain] = task
+            task.add_done_callback(lambda _: self._inflight.pop(domain, None))
+
+        # Shielded so a cancelled caller does not cancel the other waiters' fetch
+        return await asyncio.shield(task)
 
     async def is_allowed(self, url: str) -> bool:
         """
@@ -136,20 +392,28 @@ class RobotsChecker:
         domain = parsed.netloc
         scheme = parsed.scheme or "https"
 
-        async with self._lock:
-            if domain not in self._cache:
-                self._cache[domain] = await self._fetch_robots(domain, scheme)
-
-        parser = self._cache.get(domain)
+        parser = await self._get_parser(domain, scheme)
         if parser is None:
             # No robots.txt - allow everything
             return True
 
-        return parser.can_fetch(self.user_agent, url)
+        # Recrawls check the same URLs against the same rules again
+        decision = self._decisions.get(url)
+        if decision is not None and decision[0] is parser:
+            self._decisions.move_to_end(url)
+            return decision[1]
+
+        allowed = parser.can_fetch(self.user_agent, url)
+        self._decisions[url] = (parser, allowed)
+        self._decisions.move_to_end(url)
+        if len(self._decisions) > ROBOTS_DECISION_CACHE_SIZE:
+            self._decisions.popitem(last=False)
+        return allowed
 
     def clear_cache(self) -> None:
-        """Clear the robots.txt cache."""
+        """Clear the robots.txt cache shared by checkers with this user agent."""
         self._cache.clear()
+        self._decisions.clear()
 
 
 class Crawler:
@@ -161,6 +425,13 @@ class Crawler:
     - Robots.txt compliance
     - Content hashing for deduplication
     - Configurable timeouts and retries
+    - Conditional refetches (ETag/Last-Modified); validators kept with
+      remember_validators are shared by all crawlers with the same user agent
+    - One pooled HTTP client reused across fetches (keep-alive, and HTTP/2
+      when the optional h2 package is installed)
+
+    Use as an async context manager, or call aclose() when done, to
+    release pooled connections.
     """
 
     def __init__(
@@ -177,7 +448,37 @@ class Crawler:
 
         self._rate_limiters: dict[str, TokenBucket] = {}
         self._robots_checker = RobotsChecker(user_agent) if respect_robots else None
-        self._seen_hashes: set[str] = set()
+        # Raw 32-byte digests; half the size of the hex strings they encode
+        self._seen_hashes: set[bytes] = set()
+        self._client: httpx.AsyncClient | None = None
+        self._validators = _VALIDATOR_CACHES.setdefault(user_agent, OrderedDict())
+
+    async def __aenter__(self) -> Crawler:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the shared HTTP client, creating it on first use."""
+        if self._client is None:
+            # With HTTP/2, concurrent fetches from one host multiplex over a
+            # single connection instead of opening one connection each
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                headers={"User-Agent": self.user_agent},
+                limits=HTTP_LIMITS,
+                http2=HTTP2_AVAILABLE,
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP clients and their pooled connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        if self._robots_checker:
+            await self._robots_checker.aclose()
 
     def _get_rate_limiter(self, source: SourceConfig) -> TokenBucket:
         """Get or create a rate limiter for a source."""
@@ -188,6 +489,19 @@ class Crawler:
             )
         return self._rate_limiters[source.name]
 
+    @staticmethod
+    def compute_digest(content: bytes) -> bytes:
+        """
+        Compute the raw SHA-256 digest of content.
+
+        Args:
+            content: Raw bytes to hash
+
+        Returns:
+            32-byte SHA-256 digest
+        """
+        return hashlib.sha256(content).digest()
+
     @staticmethod
     def compute_hash(content: bytes) -> str:
         """
@@ -199,7 +513,7 @@ class Crawler:
         Returns:
             Hex-encoded SHA-256 hash
         """
-        return hashlib.sha256(content).hexdigest()
+        return Crawler.compute_digest(content).hex()
 
     async def fetch(self, url: str, source: SourceConfig) -> FetchResult:
         """
@@ -212,7 +526,7 @@ class Crawler:
         Returns:
             FetchResult with content or error
         """
-        fetched_at = datetime.utcnow()
+        fetched_at = datetime.now(UTC)
 
         # Check if URL is allowed by source config
         if not source.is_url_allowed(url):
@@ -243,39 +557,104 @@ class Crawler:
             except Exception as e:
                 logger.warning(f"Robots.txt check failed for {url}: {e}")
 
-        # Apply rate limiting
         rate_limiter = self._get_rate_limiter(source)
-        await rate_limiter.acquire()
+
+        # Revalidate pages fetched before instead of downloading them again
+        headers: dict[str, str] = {}
+        validators = self._validators.get(url)
+        if validators is not None:
+            etag, last_modified, _, _ = validators
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
 
         # Fetch with retries
         last_error: str | None = None
+        paused = False
         for attempt in range(self.max_retries):
-            try:
-                async with httpx.AsyncClient(timeout=self.timeout) as client:
-                    response = await client.get(
-                        url,
-                        headers={"User-Agent": self.user_agent},
-                        follow_redirects=True,
-                    )
+            if attempt and not paused:
+                # Full-jitter exponential backoff, so retries from many
+                # requests to one domain do not arrive in lockstep
+                await asyncio.sleep(random.uniform(0, 2 ** (attempt - 1)))
+            paused = False
 
-                    content = response.content
-                    content_hash = self.compute_hash(content)
-                    mime_type = response.headers.get("content-type", "").split(";")[0].strip()
+            # Apply rate limiting (retries count against the rate too)
+            await rate_limiter.acquire()
 
-                    # Check for duplicate content
-                    is_duplicate = content_hash in self._seen_hashes
-                    if not is_duplicate:
-                        self._seen_hashes.add(content_hash)
+            try:
+                # Hash the body as it streams in, overlapping hashing with I/O
+                client = self._get_client()
+                async with client.stream(
+                    "GET", url, headers=headers, follow_redirects=True
+                ) as response:
+                    rate_limiter.on_response(response.status_code, response.headers)
+
+                    if (
+                        response.status_code in RETRYABLE_STATUS_CODES
+                        and attempt < self.max_retries - 1
+                    ):
+                        last_error = f"HTTP {response.status_code}"
+                        logger.warning(
+                            f"HTTP {response.status_code} fetching {url} "
+                            f"(attempt {attempt + 1}/{self.max_retries})"
+                        )
+                        # on_response already holds the whole domain off for
+                        # Retry-After; the next acquire waits it out
+                        paused = bool(
+                            parse_retry_after(response.headers.get("retry-after"))
+                        )
+                        continue
+
+                    if response.status_code == 304 and validators is not None:
+                        self._validators.move_to_end(url)
+                        return FetchResult(
+                            url=url,
+                            content=b"",
+                            content_hash=validators[2],
+                            mime_type=validators[3],
+                            status_code=304,
+                            fetched_at=fetched_at,
+                            is_duplicate=True,
+                        )
+
+                    hasher = hashlib.sha256()
+                    chunks = []
+                    async for chunk in response.aiter_bytes(STREAM_CHUNK_SIZE):
+                        hasher.update(chunk)
+                        chunks.append(chunk)
+
+                content = b"".join(chunks)
+                digest = hasher.digest()
+                content_hash = digest.hex()
+                # Interned: a crawl sees a handful of distinct types many times
+                mime_type = sys.intern(
+                    response.headers.get("content-type", "").split(";")[0].strip()
+                )
 
-                    return FetchResult(
-                        url=url,
-                        content=content,
-                        content_hash=content_hash,
-                        mime_type=mime_type,
-                        status_code=response.status_code,
-                        fetched_at=fetched_at,
-                        is_duplicate=is_duplicate,
-                    )
+                # Check for duplicate content
+                is_duplicate = digest in self._seen_hashes
+                if not is_duplicate:
+                    self._seen_hashes.add(digest)
+
+                # Validators are only stored once the caller has processed the
+                # page (remember_validators); until then it is refetched in full
+                etag = response.headers.get("etag")
+                last_modified = response.headers.get("last-modified")
+                if response.status_code != 200 or not (etag or last_modified):
+                    self._validators.pop(url, None)
+
+                return FetchResult(
+                    url=url,
+                    content=content,
+                    content_hash=content_hash,
+                    mime_type=mime_type,
+                    status_code=response.status_code,
+                    fetched_at=fetched_at,
+                    is_duplicate=is_duplicate,
+                    etag=etag,
+                    last_modified=last_modified,
+                )
 
             except httpx.TimeoutException:
                 last_error = f"Timeout after {self.timeout}s"
@@ -288,10 +667,6 @@ class Crawler:
                 logger.error(f"Unexpected error fetching {url}: {e}")
                 break  # Don't retry unexpected errors
 
-            # Wait before retry with exponential backoff
-            if attempt < self.max_retries - 1:
-                await asyncio.sleep(2**attempt)
-
         return FetchResult(
             url=url,
             content=b"",
@@ -302,6 +677,30 @@ class Crawler:
             error=last_error or "Unknown error",
         )
 
+    def remember_validators(self, result: FetchResult) -> None:
+        """
+        Keep a fetched page's cache validators for conditional refetches.
+
+        Call only once the page's data has been stored: later fetches of the
+        page then return 304 results with no content.
+
+        Args:
+            result: A successful FetchResult from this crawler's user agent
+        """
+        if result.status_code != 200 or not (result.etag or result.last_modified):
+            return
+
+        url = result.url
+        self._validators[url] = (
+            result.etag,
+            result.last_modified,
+            result.content_hash,
+            result.mime_type,
+        )
+        self._validators.move_to_end(url)
+        if len(self._validators) > VALIDATOR_CACHE_SIZE:
+            self._validators.popitem(last=False)
+
     async def fetch_batch(
         self,
         urls: list[str],
@@ -328,10 +727,48 @@ class Crawler:
         tasks = [fetch_with_semaphore(url) for url in urls]
         return await asyncio.gather(*tasks)
 
+    async def iter_fetch(
+        self,
+        urls: Iterable[str],
+        source: SourceConfig,
+        concurrency: int = 5,
+    ) -> AsyncGenerator[FetchResult, None]:
+        """
+        Fetch URLs with up to `concurrency` requests in flight.
+
+        Unlike fetch_batch, results are yielded as soon as they are ready in
+        input order, so callers can process one page while the next ones
+        download. Fetches still in flight are cancelled if the iterator is
+        closed early.
+
+        Args:
+            urls: URLs to fetch
+            source: Source configuration
+            concurrency: Maximum concurrent requests
+
+        Yields:
+            FetchResults in the same order as input URLs
+        """
+        pending: deque[asyncio.Future[FetchResult]] = deque()
+        try:
+            for url in urls:
+                pending.append(asyncio.ensure_future(self.fetch(url, source)))
+                if len(pending) >= concurrency:
+                    yield await pending.popleft()
+            while pending:
+                yield await pending.popleft()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def clear_validators(self) -> None:
+        """Forget the cache validators shared by crawlers with this user agent."""
+        self._validators.clear()
+
     def clear_seen_hashes(self) -> None:
         """Clear the set of seen content hashes."""
         self._seen_hashes.clear()
 
     def mark_hash_seen(self, content_hash: str) -> None:
-        """Mark a content hash as already seen (for deduplication)."""
-        self._seen_hashes.add(content_hash)
+        """Mark a hex-encoded content hash as already seen (for deduplication)."""
+        self._seen_hashes.add(bytes.fromhex(content_hash))
@@ -11,27 +11,38 @@ from __future__ import annotations
 import asyncio
 import logging
 import os
-from dataclasses import dataclass, field
-from datetime import datetime
+from collections.abc import AsyncGenerator
+from dataclasses import dataclass, field, replace
+from datetime import UTC, datetime
 from enum import Enum
 from typing import Any
 from uuid import UUID, uuid4
 
+import orjson
 from arq import create_pool
 from arq.connections import ArqRedis, RedisSettings
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
 
 from wine_agent.db.engine import get_session
 from wine_agent.db.models_canonical import ListingDB, ListingMatchDB, SnapshotDB, SourceDB
 from wine_agent.ingestion.adapters import get_adapter
+from wine_agent.ingestion.adapters.base import BaseAdapter, ExtractedListing
 from wine_agent.ingestion.adapters.test_adapter import TestAdapter
-from wine_agent.ingestion.crawler import Crawler
-from wine_agent.ingestion.normalizer import Normalizer
+from wine_agent.ingestion.crawler import Crawler, FetchResult
+from wine_agent.ingestion.normalizer import NormalizedListing, Normalizer
 from wine_agent.ingestion.registry import get_default_registry
 from wine_agent.ingestion.resolver import EntityResolver, MatchAction, create_entities_from_listing
 from wine_agent.ingestion.storage import get_default_storage
 
 logger = logging.getLogger(__name__)
 
+# Number of listings buffered before the pipeline writes its pending rows
+PERSIST_CHUNK_SIZE = 500
+
+# Pages downloaded ahead of the one being processed
+FETCH_CONCURRENCY = 5
+
 
 class JobStatus(str, Enum):
     """Status of an ingestion job."""
@@ -53,6 +64,7 @@ class JobResult:
     completed_at: datetime | None = None
     urls_discovered: int = 0
     urls_fetched: int = 0
+    urls_unchanged: int = 0
     listings_created: int = 0
     entities_created: int = 0
     entities_matched: int = 0
@@ -70,6 +82,7 @@ class JobResult:
             "completed_at": self.completed_at.isoformat() if self.completed_at else None,
             "urls_discovered": self.urls_discovered,
             "urls_fetched": self.urls_fetched,
+            "urls_unchanged": self.urls_unchanged,
             "listings_created": self.listings_created,
             "entities_created": self.entities_created,
             "entities_matched": self.entities_matched,
@@ -79,6 +92,24 @@ class JobResult:
         }
 
 
+def _persist_rows(
+    session: Session,
+    snapshot_rows: list[dict[str, Any]],
+    listing_rows: list[dict[str, Any]],
+    match_rows: list[dict[str, Any]],
+) -> None:
+    """Write buffered pipeline rows with one executemany INSERT per table."""
+    # Parents first so foreign keys resolve
+    for model, rows in (
+        (SnapshotDB, snapshot_rows),
+        (ListingDB, listing_rows),
+        (ListingMatchDB, match_rows),
+    ):
+        if rows:
+            session.execute(insert(model), rows)
+            rows.clear()
+
+
 def get_redis_settings() -> RedisSettings:
     """Get Redis connection settings from environment."""
     return RedisSettings(
@@ -88,6 +119,29 @@ def get_redis_settings() -> RedisSettings:
     )
 
 
+def _parse_page(
+    adapter: BaseAdapter,
+    normalizer: Normalizer,
+    content: bytes,
+    url: str,
+    mime_type: str,
+) -> tuple[ExtractedListing, list[str], NormalizedListing] | None:
+    """
+    Extract, validate and normalize one fetched page.
+
+    Pure CPU work with no database access, so it can run off the event loop.
+
+    Returns:
+        Tuple of (extracted listing, validation errors, normalized listing),
+        or None if no listing could be extracted
+    """
+    extracted = adapter.extract_listing(content, url, mime_type)
+    if extracted is None:
+        return None
+    validation_errors = adapter.validate_listing(extracted)
+    return extracted, validation_errors, normalizer.normalize_listing(extracted)
+
+
 async def ingest_source(
     ctx: dict[str, Any],
     source_name: str,
@@ -118,9 +172,11 @@ async def ingest_source(
         job_id=job_id,
         source_name=source_name,
         status=JobStatus.RUNNING,
-        started_at=datetime.utcnow(),
+        started_at=datetime.now(UTC),
     )
 
+    crawler: Crawler | None = None
+    fetch_results: AsyncGenerator[FetchResult, None] | None = None
     try:
         # Load source configuration
         registry = get_default_registry()
@@ -180,6 +236,21 @@ async def ingest_source(
             # Initialize resolver
             resolver = EntityResolver.from_config(session, registry.entity_resolution)
 
+            # Snapshot, listing and match rows are buffered and written in
+            # chunks with executemany INSERTs instead of one flush per URL
+            snapshot_rows: list[dict[str, Any]] = []
+            listing_rows: list[dict[str, Any]] = []
+            match_rows: list[dict[str, Any]] = []
+            # Fetches whose cache validators are kept once their rows commit
+            processed_fetches: list[FetchResult] = []
+
+            # Pages download concurrently ahead of processing; results arrive
+            # in URL order, one per URL, while resolution and writes stay
+            # sequential on this session. Nothing is fetched until consumed.
+            fetch_results = crawler.iter_fetch(
+                urls, source_config, concurrency=FETCH_CONCURRENCY
+            )
+
             # Process URLs
             for url in urls:
                 try:
@@ -190,21 +261,27 @@ async def ingest_source(
                         content = adapter.get_test_content(idx)
                         mime_type = "application/json"
                         # Create a placeholder snapshot for test adapter
-                        from wine_agent.ingestion.crawler import Crawler
                         test_hash = Crawler.compute_hash(content)
-                        snapshot_db = SnapshotDB(
-                            id=str(uuid4()),
-                            source_id=source_id,
-                            url=url,
-                            content_hash=test_hash,
-                            mime_type=mime_type,
-                            file_path="",
+                        snapshot_id = str(uuid4())
+                        snapshot_rows.append(
+                            {
+                                "id": snapshot_id,
+                                "source_id": source_id,
+                                "url": url,
+                                "content_hash": test_hash,
+                                "mime_type": mime_type,
+                                "file_path": "",
+                            }
                         )
-                        session.add(snapshot_db)
-                        snapshot_id = snapshot_db.id
                     else:
                         # Fetch content
-                        fetch_result = await crawler.fetch(url, source_config)
+                        fetch_result = await anext(fetch_results)
+
+                        # Unchanged since an earlier job in this process
+                        # stored it (validators outlive each job's crawler)
+                        if fetch_result.not_modified:
+                            result.urls_unchanged += 1
+                            continue
 
                         if not fetch_result.success:
                             result.errors.append(f"Failed to fetch {url}: {fetch_result.error}")
@@ -222,34 +299,40 @@ async def ingest_source(
                             mime_type=mime_type,
                         )
 
-                        # Create snapshot record in database
-                        snapshot_db = SnapshotDB(
-                            id=str(snapshot_meta.snapshot_id),
-                            source_id=source_id,
-                            url=url,
-                            content_hash=snapshot_meta.content_hash,
-                            mime_type=mime_type,
-                            file_path=snapshot_meta.file_path,
+                        # Buffer snapshot record for the database
+                        snapshot_id = str(snapshot_meta.snapshot_id)
+                        snapshot_rows.append(
+                            {
+                                "id": snapshot_id,
+                                "source_id": source_id,
+                                "url": url,
+                                "content_hash": snapshot_meta.content_hash,
+                                "mime_type": mime_type,
+                                "file_path": snapshot_meta.file_path,
+                            }
                         )
-                        session.add(snapshot_db)
-                        snapshot_id = snapshot_db.id
 
                     result.urls_fetched += 1
 
-                    # Extract listing
-                    extracted = adapter.extract_listing(content, url, mime_type)
-                    if extracted is None:
+                    # Extract, validate and normalize. Fetched pages are parsed in a
+                    # worker thread so prefetches keep downloading meanwhile;
+                    # the test adapter's synthetic pages are too cheap to hand off
+                    if isinstance(adapter, TestAdapter):
+                        parsed = _parse_page(
+                            adapter, normalizer, content, url, mime_type
+                        )
+                    else:
+                        parsed = await asyncio.to_thread(
+                            _parse_page, adapter, normalizer, content, url, mime_type
+                        )
+                    if parsed is None:
                         result.errors.append(f"Failed to extract listing from {url}")
                         continue
 
-                    # Validate
-                    validation_errors = adapter.validate_listing(extracted)
+                    extracted, validation_errors, normalized = parsed
                     if validation_errors:
                         result.errors.extend([f"{url}: {e}" for e in validation_errors])
 
-                    # Normalize
-                    normalized = normalizer.normalize_listing(extracted)
-
                     # Resolve to entities
                     resolution = resolver.resolve(normalized)
 
@@ -269,60 +352,61 @@ async def ingest_source(
                     if resolution.create_vintage:
                         result.entities_created += 1
 
-                    # Create listing record
-                    import json
-                    listing_db = ListingDB(
-                        id=str(resolution.listing_id),
-                        source_id=source_id,
-                        snapshot_id=snapshot_id,
-                        url=url,
-                        title=extracted.title or "",
-                        price=normalized.price,
-                        currency=normalized.currency or "USD",
-                        parsed_fields_json=json.dumps(extracted.to_dict()),
+                    # Buffer listing record
+                    listing_id = str(resolution.listing_id)
+                    listing_rows.append(
+                        {
+                            "id": listing_id,
+                            "source_id": source_id,
+                            "snapshot_id": snapshot_id,
+                            "url": url,
+                            "title": extracted.title or "",
+                            "price": normalized.price,
+                            "currency": normalized.currency or "USD",
+                            "parsed_fields_json": orjson.dumps(extracted.to_dict()).decode(),
+                        }
                     )
-                    session.add(listing_db)
                     result.listings_created += 1
 
-                    # Create listing match records
-                    if resolution.producer_match:
-                        match_db = ListingMatchDB(
-                            id=str(uuid4()),
-                            listing_id=listing_db.id,
-                            entity_type="producer",
-                            entity_id=str(resolution.producer_match.entity_id),
-                            confidence=resolution.producer_match.confidence,
-                            decision="auto" if resolution.action == MatchAction.AUTO_MERGE else "pending",
-                        )
-                        session.add(match_db)
-                    if resolution.wine_match:
-                        match_db = ListingMatchDB(
-                            id=str(uuid4()),
-                            listing_id=listing_db.id,
-                            entity_type="wine",
-                            entity_id=str(resolution.wine_match.entity_id),
-                            confidence=resolution.wine_match.confidence,
-                            decision="auto" if resolution.action == MatchAction.AUTO_MERGE else "pending",
-                        )
-                        session.add(match_db)
-                    if resolution.vintage_match:
-                        match_db = ListingMatchDB(
-                            id=str(uuid4()),
-                            listing_id=listing_db.id,
-                            entity_type="vintage",
-                            entity_id=str(resolution.vintage_match.entity_id),
-                            confidence=resolution.vintage_match.confidence,
-                            decision="auto" if resolution.action == MatchAction.AUTO_MERGE else "pending",
-                        )
-                        session.add(match_db)
+                    # Buffer listing match records
+                    decision = "auto" if resolution.action == MatchAction.AUTO_MERGE else "pending"
+                    for entity_type, match in (
+                        ("producer", resolution.producer_match),
+                        ("wine", resolution.wine_match),
+                        ("vintage", resolution.vintage_match),
+                    ):
+                        if match:
+                            match_rows.append(
+                                {
+                                    "id": str(uuid4()),
+                                    "listing_id": listing_id,
+                                    "entity_type": entity_type,
+                                    "entity_id": str(match.entity_id),
+                                    "confidence": match.confidence,
+                                    "decision": decision,
+                                }
+                            )
+
+                    if not isinstance(adapter, TestAdapter):
+                        # Without the body, which is no longer needed
+                        processed_fetches.append(replace(fetch_result, content=b""))
+
+                    if len(listing_rows) >= PERSIST_CHUNK_SIZE:
+                        _persist_rows(session, snapshot_rows, listing_rows, match_rows)
 
                 except Exception as e:
                     logger.exception(f"Error processing {url}")
                     result.errors.append(f"{url}: {str(e)}")
 
-            # Commit all changes
+            # Write remaining buffered rows and commit all changes
+            _persist_rows(session, snapshot_rows, listing_rows, match_rows)
             session.commit()
 
+            # Only pages stored by this job may be answered with 304 later;
+            # failed ones are downloaded and processed again next time
+            for fetch_result in processed_fetches:
+                crawler.remember_validators(fetch_result)
+
         result.status = JobStatus.COMPLETED
 
     except Exception as e:
@@ -331,7 +415,11 @@ async def ingest_source(
         result.errors.append(str(e))
 
     finally:
-        result.completed_at = datetime.utcnow()
+        if fetch_results is not None:
+            await fetch_results.aclose()
+        if crawler is not None:
+            await crawler.aclose()
+        result.completed_at = datetime.now(UTC)
         if result.started_at and result.completed_at:
             result.duration_seconds = (result.completed_at - result.started_at).total_seconds()
 
@@ -365,6 +453,7 @@ async def ingest_source_sync(
         completed_at=datetime.fromisoformat(result_dict["completed_at"]) if result_dict["completed_at"] else None,
         urls_discovered=result_dict["urls_discovered"],
         urls_fetched=result_dict["urls_fetched"],
+        urls_unchanged=result_dict["urls_unchanged"],
         listings_created=result_dict["listings_created"],
         entities_created=result_dict["entities_created"],
         entities_matched=result_dict["entities_matched"],
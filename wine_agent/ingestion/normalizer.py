@@ -15,7 +15,7 @@ from typing import Any
 from wine_agent.ingestion.adapters.base import ExtractedListing
 
 
-@dataclass
+@dataclass(slots=True)
 class NormalizedListing:
     """
     Cleaned and standardized wine listing data.
@@ -293,6 +293,18 @@ class Normalizer:
         "sweet": "dessert",
     }
 
+    # Canonical names, which every alias table maps to themselves; inputs
+    # already in canonical form skip case folding and the alias lookup
+    _CANONICAL_REGIONS: frozenset[str] = frozenset(REGION_ALIASES.values())
+    _CANONICAL_GRAPES: frozenset[str] = frozenset(GRAPE_ALIASES.values())
+    _CANONICAL_COLORS: frozenset[str] = frozenset(COLOR_ALIASES.values())
+    _CANONICAL_STYLES: frozenset[str] = frozenset(STYLE_ALIASES.values())
+
+    # Prefix trie over all alias tables for find_aliases, built per class on
+    # first use: char -> child node, with an alias's (kind, canonical name)
+    # pairs stored under the "" key of its last node
+    _alias_trie: dict[str, Any] | None = None
+
     # Bottle size patterns and their ml values
     BOTTLE_SIZE_PATTERNS: list[tuple[re.Pattern[str], int]] = [
         (re.compile(r"(?:^|\s)375\s*(?:ml)?(?:\s|$)", re.I), 375),   # Half bottle
@@ -314,6 +326,12 @@ class Normalizer:
         re.compile(r"(\d+(?:\.\d+)?)\s*(?:degrees|°)", re.I),
     ]
 
+    # Vintage year found anywhere in a string, and the non-vintage markers
+    VINTAGE_YEAR_PATTERN: re.Pattern[str] = re.compile(r"\b(?:19|20)\d{2}\b")
+    NON_VINTAGE_MARKERS: frozenset[str] = frozenset(
+        {"NV", "N/V", "NON-VINTAGE", "NONVINTAGE"}
+    )
+
     def normalize_listing(self, extracted: ExtractedListing) -> NormalizedListing:
         """
         Normalize an extracted listing.
@@ -356,12 +374,18 @@ class Normalizer:
 
         # Normalize color and style
         color = extracted.get_value("color")
-        if color:
-            normalized.color = self.COLOR_ALIASES.get(color.lower().strip(), color.lower())
+        if color in self._CANONICAL_COLORS:
+            normalized.color = color
+        elif color:
+            folded = color.strip().lower()
+            normalized.color = self.COLOR_ALIASES.get(folded, folded)
 
         style = extracted.get_value("style")
-        if style:
-            normalized.style = self.STYLE_ALIASES.get(style.lower().strip(), style.lower())
+        if style in self._CANONICAL_STYLES:
+            normalized.style = style
+        elif style:
+            folded = style.strip().lower()
+            normalized.style = self.STYLE_ALIASES.get(folded, folded)
 
         # Parse bottle size
         bottle_size = extracted.get_value("bottle_size_ml")
@@ -394,9 +418,9 @@ class Normalizer:
         """Clean and normalize a string value."""
         if value is None:
             return None
-        s = str(value).strip()
-        # Normalize whitespace
-        s = re.sub(r"\s+", " ", s)
+        # Strip and collapse whitespace runs; split() treats the same
+        # characters as whitespace that the regex \s class does
+        s = " ".join(str(value).split())
         return s if s else None
 
     def normalize_region(self, region: str | None) -> str | None:
@@ -413,8 +437,8 @@ class Normalizer:
             return None
 
         cleaned = self._clean_string(region)
-        if cleaned is None:
-            return None
+        if cleaned is None or cleaned in self._CANONICAL_REGIONS:
+            return cleaned
 
         # Look up alias (case-insensitive)
         canonical = self.REGION_ALIASES.get(cleaned.lower())
@@ -440,16 +464,94 @@ class Normalizer:
         else:
             grape_list = grapes
 
+        # Bound once, outside the loop
+        clean = self._clean_string
+        canonical_grapes = self._CANONICAL_GRAPES
+        get_alias = self.GRAPE_ALIASES.get
+
         normalized = []
         for grape in grape_list:
-            cleaned = self._clean_string(grape)
-            if cleaned:
+            cleaned = clean(grape)
+            if cleaned in canonical_grapes:
+                normalized.append(cleaned)
+            elif cleaned:
                 # Look up alias
-                canonical = self.GRAPE_ALIASES.get(cleaned.lower())
+                canonical = get_alias(cleaned.lower())
                 normalized.append(canonical if canonical else cleaned)
 
         return normalized
 
+    def find_aliases(self, text: str | None) -> list[tuple[str, str]]:
+        """
+        Find region, grape, color and style aliases mentioned in free text.
+
+        Scans the text once against a trie of every alias, taking the longest
+        alias at each position. Aliases must start and end on word boundaries,
+        so "port" is not found in "important".
+
+        Args:
+            text: Free text such as a listing title
+
+        Returns:
+            (kind, canonical name) pairs in order of appearance, where kind is
+            "region", "grape", "color" or "style". An alias listed under
+            several kinds (e.g. "champagne") yields one pair per kind.
+        """
+        if not text:
+            return []
+
+        cls = type(self)
+        trie = cls.__dict__.get("_alias_trie")
+        if trie is None:
+            trie = cls._alias_trie = cls._build_alias_trie()
+
+        lowered = text.lower()
+        length = len(lowered)
+        found: list[tuple[str, str]] = []
+        start = 0
+        while start < length:
+            if start and lowered[start - 1].isalnum():
+                start += 1
+                continue
+
+            # Walk the trie as far as the text allows, keeping the longest
+            # alias that ends on a word boundary
+            node = trie
+            matched: list[tuple[str, str]] | None = None
+            end = pos = start
+            while pos < length:
+                node = node.get(lowered[pos])
+                if node is None:
+                    break
+                pos += 1
+                if "" in node and (pos == length or not lowered[pos].isalnum()):
+                    matched, end = node[""], pos
+
+            if matched:
+                found.extend(matched)
+                start = end
+            else:
+                start += 1
+
+        return found
+
+    @classmethod
+    def _build_alias_trie(cls) -> dict[str, Any]:
+        """Build the find_aliases trie from the class's alias tables."""
+        trie: dict[str, Any] = {}
+        for kind, aliases in (
+            ("region", cls.REGION_ALIASES),
+            ("grape", cls.GRAPE_ALIASES),
+            ("color", cls.COLOR_ALIASES),
+            ("style", cls.STYLE_ALIASES),
+        ):
+            for alias, canonical in aliases.items():
+                node = trie
+                for char in alias:
+                    node = node.setdefault(char, {})
+                node.setdefault("", []).append((kind, canonical))
+        return trie
+
     def parse_abv(self, abv_str: str | float | int | None) -> float | None:
         """
         Parse ABV from various formats.
@@ -500,7 +602,7 @@ class Normalizer:
 
         # Handle "NV" or "Non-Vintage"
         if isinstance(vintage_str, str):
-            if vintage_str.upper() in ("NV", "N/V", "NON-VINTAGE", "NONVINTAGE"):
+            if vintage_str.upper() in self.NON_VINTAGE_MARKERS:
                 return None
 
         # Try to convert to int
@@ -514,7 +616,7 @@ class Normalizer:
 
         # Try to extract 4-digit year from string
         if isinstance(vintage_str, str):
-            match = re.search(r"\b(19|20)\d{2}\b", vintage_str)
+            match = self.VINTAGE_YEAR_PATTERN.search(vintage_str)
             if match:
                 return int(match.group())
 
@@ -8,6 +8,7 @@ which websites/APIs can be crawled and their associated settings.
 
 from __future__ import annotations
 
+import copy
 import os
 import re
 from dataclasses import dataclass, field
@@ -16,6 +17,40 @@ from typing import Any
 
 import yaml
 
+# The libyaml-backed loader is several times faster when PyYAML has it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Numbered backreferences, which would point at the wrong group once URL
+# patterns are fused into one alternation
+_BACKREFERENCE = re.compile(r"\\[1-9]")
+
+# Parsed configuration files: resolved path -> (mtime_ns, size, data).
+# Reloading a file that has not changed reuses its parse.
+_CONFIG_CACHE: dict[Path, tuple[int, int, Any]] = {}
+
+
+def _read_config(config_path: Path) -> Any:
+    """
+    Parse a YAML configuration file, reusing the previous parse if unchanged.
+
+    Returns a copy of the parsed data, so callers may keep references into it.
+    """
+    try:
+        stat = config_path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(
+            f"Configuration file not found: {config_path}"
+        ) from None
+
+    cached = _CONFIG_CACHE.get(config_path)
+    if cached is None or cached[:2] != (stat.st_mtime_ns, stat.st_size):
+        with open(config_path) as f:
+            data = yaml.load(f, Loader=_YAML_LOADER)
+        cached = (stat.st_mtime_ns, stat.st_size, data)
+        _CONFIG_CACHE[config_path] = cached
+
+    return copy.deepcopy(cached[2])
+
 
 @dataclass
 class RateLimitConfig:
@@ -35,7 +70,7 @@ class RateLimitConfig:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class SourceConfig:
     """Configuration for a single ingestion source."""
 
@@ -84,12 +119,29 @@ class SourceConfig:
             custom_config=data.get("custom_config", {}),
         )
 
+    @staticmethod
+    def _fuse_patterns(patterns: list[str]) -> list[re.Pattern[str]]:
+        """
+        Compile URL patterns, fused into a single alternation when possible.
+
+        One regex matching wherever any of the patterns matches replaces a
+        loop over them. Patterns using numbered backreferences, or that only
+        compile on their own (e.g. a leading inline flag), stay separate.
+        """
+        compiled = [re.compile(p) for p in patterns]
+        if len(compiled) > 1 and not any(_BACKREFERENCE.search(p) for p in patterns):
+            try:
+                return [re.compile("|".join(f"(?:{p})" for p in patterns))]
+            except re.error:
+                pass
+        return compiled
+
     def _compile_patterns(self) -> None:
         """Compile regex patterns for URL filtering."""
         if self._allowlist_patterns is None:
-            self._allowlist_patterns = [re.compile(p) for p in self.allowlist]
+            self._allowlist_patterns = self._fuse_patterns(self.allowlist)
         if self._denylist_patterns is None:
-            self._denylist_patterns = [re.compile(p) for p in self.denylist]
+            self._denylist_patterns = self._fuse_patterns(self.denylist)
 
     def is_url_allowed(self, url: str) -> bool:
         """
@@ -176,6 +228,7 @@ class SourceRegistry:
 
     def __init__(self) -> None:
         self._sources: dict[str, SourceConfig] = {}
+        self._sources_by_domain: dict[str, SourceConfig] = {}
         self._global_config: GlobalConfig = GlobalConfig()
         self._entity_resolution: EntityResolutionConfig = EntityResolutionConfig()
         self._config_path: Path | None = None
@@ -198,11 +251,7 @@ class SourceRegistry:
             config_path: Path to the sources.yaml file
         """
         config_path = Path(config_path).expanduser().resolve()
-        if not config_path.exists():
-            raise FileNotFoundError(f"Configuration file not found: {config_path}")
-
-        with open(config_path) as f:
-            data = yaml.safe_load(f)
+        data = _read_config(config_path)
 
         self._config_path = config_path
         self._global_config = GlobalConfig.from_dict(data.get("global"))
@@ -218,6 +267,11 @@ class SourceRegistry:
             )
             self._sources[source.name] = source
 
+        # Index by domain; the first source listed for a domain wins
+        self._sources_by_domain.clear()
+        for source in self._sources.values():
+            self._sources_by_domain.setdefault(source.domain, source)
+
     def get_source(self, name: str) -> SourceConfig | None:
         """
         Get a source configuration by name.
@@ -290,10 +344,7 @@ class SourceRegistry:
         Returns:
             SourceConfig if found, None otherwise
         """
-        for source in self._sources.values():
-            if source.domain == domain:
-                return source
-        return None
+        return self._sources_by_domain.get(domain)
 
 
 # Global registry instance
@@ -159,8 +159,6 @@ class EntityResolver:
         Returns:
             Best match if above minimum threshold, None otherwise
         """
-        import json
-
         # Query all producers (in production, use full-text search or limit scope)
         producers = self.session.query(ProducerDB).all()
 
@@ -172,12 +170,7 @@ class EntityResolver:
             confidence = self._string_similarity(producer_name, producer.canonical_name)
 
             # Also check aliases if available
-            try:
-                aliases = json.loads(producer.aliases_json) if producer.aliases_json else []
-            except (json.JSONDecodeError, TypeError):
-                aliases = []
-
-            for alias in aliases:
+            for alias in producer.aliases_json:
                 alias_conf = self._string_similarity(producer_name, alias)
                 confidence = max(confidence, alias_conf)
 
@@ -19,6 +19,7 @@ from wine_agent.core.schema_canonical import (
     CatalogStats,
     GrapeVariety,
     Producer,
+    ProducerAggregate,
     Region,
     Vintage,
     Wine,
@@ -26,6 +27,7 @@ from wine_agent.core.schema_canonical import (
 from wine_agent.db.engine import get_session
 from wine_agent.db.repositories_canonical import (
     GrapeVarietyRepository,
+    ProducerAggregateRepository,
     ProducerRepository,
     RegionRepository,
     VintageRepository,
@@ -198,6 +200,11 @@ class CatalogService:
         repo = WineRepository(self.session)
         return repo.get_by_id(wine_id)
 
+    def get_producer_full(self, producer_id: UUID | str) -> ProducerAggregate | None:
+        """Get a producer with all of its wines and their vintages."""
+        repo = ProducerAggregateRepository(self.session)
+        return repo.get_full(producer_id)
+
     def get_wines_by_producer(self, producer_id: UUID | str) -> list[Wine]:
         """Get all wines for a producer."""
         repo = WineRepository(self.session)
@@ -538,31 +545,22 @@ class CatalogService:
 
         # Re-index all producers
         producer_repo = ProducerRepository(self.session)
-        producers = producer_repo.list_all(limit=10000)
-        for producer in producers:
+        for producer in producer_repo.iter_all():
             self.meilisearch.index_producer(producer)
 
         # Re-index all regions
         region_repo = RegionRepository(self.session)
-        regions = region_repo.search_by_name("", limit=10000)
-        for region in regions:
+        for region in region_repo.iter_all():
             self.meilisearch.index_region(region)
 
         # Re-index all wines with vintages
         wine_repo = WineRepository(self.session)
-        vintage_repo = VintageRepository(self.session)
-
-        wines = wine_repo.search_by_name("", limit=10000)
-        for wine in wines:
-            producer = producer_repo.get_by_id(wine.producer_id)
-            region = region_repo.get_by_id(wine.region_id) if wine.region_id else None
 
-            vintages = vintage_repo.get_by_wine_id(wine.id)
+        for wine, producer, region, vintages in wine_repo.iter_with_related():
             if vintages:
                 for vintage in vintages:
-                    if producer:
-                        self.meilisearch.index_wine_vintage(vintage, wine, producer, region)
-            elif producer:
+                    self.meilisearch.index_wine_vintage(vintage, wine, producer, region)
+            else:
                 self.meilisearch.index_wine_without_vintage(wine, producer, region)
 
         logger.info("Search index rebuild complete")
@@ -93,7 +93,9 @@ class PublishingService:
 
         # Save changes
         try:
-            updated_note = self.note_repo.update(note)
+            updated_note = self.note_repo.update(
+                note, changed_fields=set(revision.changed_fields)
+            )
             saved_revision = self.revision_repo.create(revision)
             self.session.flush()
 
@@ -143,7 +145,7 @@ class PublishingService:
         # Apply updates to the note
         try:
             updated_note = self._apply_updates(note, updates)
-            saved_note = self.note_repo.update(updated_note)
+            saved_note = self.note_repo.update(updated_note, changed_fields=set(updates))
             self.session.flush()
 
             logger.info(f"Saved draft {note_id}")